@@ -0,0 +1,125 @@
+"""Micro-benchmarks: AddressableHeap against the tuple heapq lists it replaced.
+
+Run from the project root:
+
+    python -m benchmarks.heaps --sizes 1000 100000
+"""
+
+import argparse
+import heapq
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from schedulers.addressable_heap import AddressableHeap
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _keys(n: int, seed: int) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(1, 1_000) for _ in range(n)]
+
+
+def churn_tuple(keys: Sequence[int]) -> None:
+    """SJF/SRTF pattern: push everything, then alternate pop and re-push."""
+    heap: List[Tuple[int, int, object]] = []
+    for job_id, key in enumerate(keys):
+        heapq.heappush(heap, (key, job_id, None))
+    for _ in range(len(keys)):
+        key, job_id, item = heapq.heappop(heap)
+        heapq.heappush(heap, (key + 1, job_id, item))
+    while heap:
+        heapq.heappop(heap)
+
+
+def churn_addressable(keys: Sequence[int]) -> None:
+    heap: AddressableHeap[object] = AddressableHeap()
+    for job_id, key in enumerate(keys):
+        heap.push(job_id, key, None)
+    for _ in range(len(keys)):
+        key, job_id, item = heap.pop()
+        heap.push(job_id, key + 1, item)
+    while heap:
+        heap.pop()
+
+
+def rekey_tuple(keys: Sequence[int]) -> None:
+    """Priority-aging pattern: lower every key a few times, then drain.
+
+    With plain tuples each change pushes a new entry and the old one is left
+    behind as a stale token that pops must skip.
+    """
+    heap: List[Tuple[int, int, int]] = []
+    live: Dict[int, int] = {}
+    token = 0
+    for job_id, key in enumerate(keys):
+        live[job_id] = token
+        heapq.heappush(heap, (key, job_id, token))
+        token += 1
+    for step in range(1, 4):
+        for job_id, key in enumerate(keys):
+            live[job_id] = token
+            heapq.heappush(heap, (key - step, job_id, token))
+            token += 1
+    while heap:
+        _, job_id, entry_token = heapq.heappop(heap)
+        if live.get(job_id) == entry_token:
+            del live[job_id]
+
+
+def rekey_addressable(keys: Sequence[int]) -> None:
+    heap: AddressableHeap[None] = AddressableHeap()
+    for job_id, key in enumerate(keys):
+        heap.push(job_id, key, None)
+    for step in range(1, 4):
+        for job_id, key in enumerate(keys):
+            heap.update(job_id, key - step)
+    while heap:
+        heap.pop()
+
+
+CASES: Dict[str, Tuple[Callable[[Sequence[int]], None], Callable[[Sequence[int]], None]]] = {
+    "push/pop churn": (churn_tuple, churn_addressable),
+    "decrease-key": (rekey_tuple, rekey_addressable),
+}
+
+
+def _time(fn: Callable[[Sequence[int]], None], keys: Sequence[int], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(keys)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: Sequence[int], repeat: int = 3, seed: int = 42) -> None:
+    print(f"{'case':<16} {'n':>9} {'tuple heapq':>12} {'addressable':>12} {'ratio':>7}")
+    for n in sizes:
+        keys = _keys(n, seed)
+        for name, (tuple_fn, addressable_fn) in CASES.items():
+            t_tuple = _time(tuple_fn, keys, repeat)
+            t_addr = _time(addressable_fn, keys, repeat)
+            print(
+                f"{name:<16} {n:>9} {t_tuple * 1000:>10.1f}ms {t_addr * 1000:>10.1f}ms"
+                f" {t_addr / t_tuple:>6.2f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AddressableHeap vs tuple heapq micro-benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions per case.")
+    args = parser.parse_args()
+    run(args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
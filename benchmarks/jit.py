@@ -0,0 +1,73 @@
+"""Benchmark: SimulationEngine(backend="numba") against the Python event loop.
+
+Equivalence with the Python engine is checked by tests/test_jit_backend.py.
+Run from the project root:
+
+    python -m benchmarks.jit --sizes 10000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.scalability import make_workload
+from schedulers.base import Scheduler
+from schedulers.mlfq import MLFQScheduler
+from schedulers.priority_aging import PriorityAgingScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+from simulation import jit_backend
+from simulation.engine import SimulationEngine
+
+DEFAULT_SIZES = (10_000, 100_000)
+SCHEDULERS: List[Callable[[], Scheduler]] = [
+    RoundRobinScheduler,
+    SJFScheduler,
+    SRTFScheduler,
+    PriorityAgingScheduler,
+    MLFQScheduler,
+]
+
+
+def run(sizes: Sequence[int], load: str, quantum: int, repeat: int = 3) -> None:
+    # Compile (or load from the on-disk cache) before timing.
+    SimulationEngine(RoundRobinScheduler(), backend="numba").run(make_workload(10, load).to_jobs())
+    print(f"{'scheduler':<16} {'jobs':>8} {'python':>10} {'numba':>10} {'speedup':>8}")
+    for size in sizes:
+        jobs = make_workload(size, load).to_jobs()
+        for make in SCHEDULERS:
+            timings = {}
+            for backend in ("python", "numba"):
+                best = float("inf")
+                for _ in range(repeat):
+                    engine = SimulationEngine(make(), quantum, backend=backend)
+                    start = time.perf_counter()
+                    engine.run(jobs)
+                    best = min(best, time.perf_counter() - start)
+                timings[backend] = best
+            print(
+                f"{make.name:<16} {size:>8} {timings['python']:>9.3f}s {timings['numba']:>9.3f}s"
+                f" {timings['python'] / timings['numba']:>7.1f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compiled engine backend vs the Python loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--load", default="saturated", choices=["light", "saturated", "overloaded"])
+    parser.add_argument("--quantum", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions per case.")
+    args = parser.parse_args()
+    if not jit_backend.available():
+        sys.exit("numba is not installed; backend='numba' falls back to the Python engine.")
+    run(args.sizes, args.load, args.quantum, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
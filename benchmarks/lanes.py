@@ -0,0 +1,102 @@
+"""Benchmark: run_lanes() against one SimulationEngine.run() per workload.
+
+Two inputs are timed. Job lists (one generated workload per lane) go through
+run_lanes(). Columns (every lane's arrivals and bursts drawn as (lanes, jobs)
+arrays in one call) go through run_lane_arrays(), while the engine first has
+to build each lane's Jobs from them. Run from the project root:
+
+    python -m benchmarks.lanes --lanes 10000 20000 --jobs 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from models.job import Job
+from simulation.engine import SimulationEngine
+from simulation.lanes import LANE_POLICIES, run_lane_arrays, run_lanes
+from workloads.generator import generate_interactive_workload
+from workloads.vectorized import ColumnarWorkload
+
+DEFAULT_LANES = (10_000, 20_000)
+
+
+def _workloads(lanes: int, jobs: int) -> List[List[Job]]:
+    # Offered load just under 1, so lanes see both queueing and idle gaps.
+    return [
+        generate_interactive_workload(num_jobs=jobs, arrival_max=jobs * 5, seed=seed)
+        for seed in range(lanes)
+    ]
+
+
+def _columns(lanes: int, jobs: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    # The same distributions as _workloads(), for every lane at once.
+    rng = np.random.default_rng(seed)
+    arrival = np.sort(rng.integers(0, jobs * 5, (lanes, jobs), endpoint=True), axis=1)
+    burst = rng.integers(1, 10, (lanes, jobs), endpoint=True)
+    return arrival, burst
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _engine_on_columns(cls, arrival: np.ndarray, burst: np.ndarray, quantum: int) -> None:
+    ids = np.arange(arrival.shape[1])
+    for lane_arrival, lane_burst in zip(arrival, burst):
+        jobs = ColumnarWorkload(ids, lane_arrival, lane_burst, np.ones_like(ids)).to_jobs()
+        SimulationEngine(scheduler=cls(), quantum=quantum).run(jobs)
+
+
+def run(lane_counts: Sequence[int], jobs: int, quantum: int, repeat: int = 3) -> None:
+    print(f"{'input':<8} {'policy':<12} {'lanes':>7} {'engine':>10} {'lanes':>10} {'speedup':>8}")
+    for lanes in lane_counts:
+        workloads = _workloads(lanes, jobs)
+        arrival, burst = _columns(lanes, jobs)
+        for name, cls in LANE_POLICIES.items():
+            cases = (
+                (
+                    "jobs",
+                    lambda: [SimulationEngine(cls(), quantum).run(w) for w in workloads],
+                    lambda: run_lanes(workloads, cls, quantum),
+                ),
+                (
+                    "columns",
+                    lambda: _engine_on_columns(cls, arrival, burst, quantum),
+                    lambda: run_lane_arrays(arrival, burst, cls, quantum, priority=1),
+                ),
+            )
+            for label, engine, batched in cases:
+                t_engine = _best(engine, 1)
+                t_lanes = _best(batched, repeat)
+                print(
+                    f"{label:<8} {name:<12} {lanes:>7} {t_engine:>9.2f}s {t_lanes:>9.2f}s"
+                    f" {t_engine / t_lanes:>7.1f}x"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batched NumPy lanes vs the event engine.")
+    parser.add_argument("--lanes", type=int, nargs="+", default=list(DEFAULT_LANES))
+    parser.add_argument("--jobs", type=int, default=50, help="Jobs per workload.")
+    parser.add_argument("--quantum", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions for lanes.")
+    args = parser.parse_args()
+    run(args.lanes, args.jobs, args.quantum, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
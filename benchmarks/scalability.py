@@ -0,0 +1,301 @@
+"""Scalability benchmarks: every default scheduler across workload sizes and loads.
+
+Run from the project root:
+
+    python -m benchmarks.scalability --sizes 1000 10000 100000 --save results/bench_baseline.json
+    python -m benchmarks.scalability --compare results/bench_baseline.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Type, Union
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from experiments.runner import DEFAULT_SCHEDULERS, _build_scheduler
+from models.job import Job
+from schedulers.base import Scheduler
+from simulation.engine import SimulationEngine
+from workloads.generator import generate_interactive_workload
+from workloads.vectorized import ColumnarWorkload, generate_interactive_columns
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Offered load = total burst / arrival span.
+LOADS: Dict[str, float] = {"light": 0.5, "saturated": 1.0, "overloaded": 1.5}
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+BURST_MIN, BURST_MAX = 1, 10
+
+
+@dataclass
+class BenchmarkCase:
+    scheduler: str
+    load: str
+    num_jobs: int
+    wall_time: float
+    peak_memory_bytes: Optional[int]
+    events: int
+    events_per_second: float
+
+
+def make_workload(
+    num_jobs: int, load: str, seed: int = 42
+) -> Union[ColumnarWorkload, List[Job]]:
+    """Interactive workload at ``load``: NumPy columns when available, else Jobs.
+
+    Columns are drawn in one vectorized call and become Jobs only as the
+    engine reaches them, so 10^7-job sizes do not hold 10^7 Job objects.
+    """
+    mean_burst = (BURST_MIN + BURST_MAX) / 2
+    span = max(1, int(num_jobs * mean_burst / LOADS[load]))
+    generate = generate_interactive_columns if np is not None else generate_interactive_workload
+    return generate(
+        num_jobs=num_jobs,
+        burst_min=BURST_MIN,
+        burst_max=BURST_MAX,
+        arrival_max=span,
+        seed=seed,
+    )
+
+
+def _jobs(workload: Union[ColumnarWorkload, List[Job]]) -> Iterator[Job]:
+    return workload.iter_jobs() if isinstance(workload, ColumnarWorkload) else iter(workload)
+
+
+def run_case(
+    SchedulerClass: Type[Scheduler],
+    jobs: Union[ColumnarWorkload, List[Job]],
+    load: str,
+    seed: int = 42,
+    measure_memory: bool = True,
+) -> BenchmarkCase:
+    """Time one simulation; separate passes count events and measure peak memory.
+
+    Each instrument gets its own pass, so neither the profiler's records nor
+    tracemalloc's overhead shows up in the other's numbers. Jobs are streamed
+    with run_stream(), so memory is the engine's live state, not the workload.
+    """
+    engine = SimulationEngine(_build_scheduler(SchedulerClass, seed))
+    start = time.perf_counter()
+    engine.run_stream(_jobs(jobs))
+    wall = time.perf_counter() - start
+
+    engine = SimulationEngine(_build_scheduler(SchedulerClass, seed), profile=True)
+    engine.run_stream(_jobs(jobs))
+    events = engine.profile_report.events if engine.profile_report else 0
+
+    peak: Optional[int] = None
+    if measure_memory:
+        engine = SimulationEngine(_build_scheduler(SchedulerClass, seed))
+        tracemalloc.start()
+        try:
+            engine.run_stream(_jobs(jobs))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkCase(
+        scheduler=SchedulerClass.name,
+        load=load,
+        num_jobs=len(jobs),
+        wall_time=wall,
+        peak_memory_bytes=peak,
+        events=events,
+        events_per_second=events / wall if wall > 0 else 0.0,
+    )
+
+
+def fit_exponent(cases: Sequence[BenchmarkCase]) -> Optional[float]:
+    """Least-squares slope of log(wall_time) against log(num_jobs)."""
+    points = [(math.log(c.num_jobs), math.log(c.wall_time)) for c in cases if c.wall_time > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    loads: Sequence[str] = tuple(LOADS),
+    schedulers: Optional[List[Type[Scheduler]]] = None,
+    time_budget: float = 60.0,
+    measure_memory: bool = True,
+    seed: int = 42,
+) -> Dict[str, object]:
+    """
+    Benchmark each scheduler at each size and load.
+
+    A (scheduler, load) series stops growing once the next size is predicted
+    (from the exponent fitted so far, or linear scaling) to exceed
+    ``time_budget`` seconds, so quadratic policies do not stall the suite.
+    """
+    schedulers = schedulers or DEFAULT_SCHEDULERS
+    cases: List[BenchmarkCase] = []
+    exponents: Dict[str, Dict[str, Optional[float]]] = {}
+
+    for load in loads:
+        workloads = {}
+        for SchedulerClass in schedulers:
+            series: List[BenchmarkCase] = []
+            for n in sorted(sizes):
+                if series:
+                    k = fit_exponent(series) or 1.0
+                    last = series[-1]
+                    predicted = last.wall_time * (n / last.num_jobs) ** max(k, 1.0)
+                    if predicted > time_budget:
+                        print(f"  skip {SchedulerClass.name} {load} n={n}: ~{predicted:.0f}s predicted")
+                        continue
+                if n not in workloads:
+                    workloads[n] = make_workload(n, load, seed)
+                case = run_case(SchedulerClass, workloads[n], load, seed, measure_memory)
+                print(
+                    f"  {case.scheduler:<16} {load:<11} n={n:<9} {case.wall_time:>9.3f}s"
+                    f" {case.events_per_second:>12,.0f} ev/s"
+                )
+                series.append(case)
+            cases.extend(series)
+            exponents.setdefault(SchedulerClass.name, {})[load] = fit_exponent(series)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "sizes": list(sizes),
+            "loads": {name: LOADS[name] for name in loads},
+        },
+        "cases": [asdict(c) for c in cases],
+        "exponents": exponents,
+    }
+
+
+def compare_to_baseline(
+    current: Dict[str, object],
+    baseline: Dict[str, object],
+    time_tolerance: float = 1.25,
+    exponent_tolerance: float = 0.15,
+    min_seconds: float = 0.05,
+) -> List[str]:
+    """Return human-readable regressions of ``current`` against ``baseline``.
+
+    Cases that took under ``min_seconds`` in the baseline are too noisy to
+    compare and are skipped.
+    """
+    regressions: List[str] = []
+    base_cases = {(c["scheduler"], c["load"], c["num_jobs"]): c for c in baseline["cases"]}
+    for case in current["cases"]:
+        key = (case["scheduler"], case["load"], case["num_jobs"])
+        old = base_cases.get(key)
+        if old is None or old["wall_time"] < min_seconds:
+            continue
+        ratio = case["wall_time"] / old["wall_time"]
+        if ratio > time_tolerance:
+            regressions.append(
+                f"{key[0]} {key[1]} n={key[2]}: {old['wall_time']:.3f}s -> "
+                f"{case['wall_time']:.3f}s ({ratio:.2f}x)"
+            )
+    for sched, by_load in current["exponents"].items():
+        for load, k in by_load.items():
+            old_k = baseline["exponents"].get(sched, {}).get(load)
+            if k is not None and old_k is not None and k - old_k > exponent_tolerance:
+                regressions.append(
+                    f"{sched} {load}: scaling exponent {old_k:.2f} -> {k:.2f}"
+                )
+    return regressions
+
+
+def print_exponents(report: Dict[str, object]) -> None:
+    loads = list(report["meta"]["loads"])
+    print(f"\n{'Scheduler':<18}" + "".join(f"{load:>12}" for load in loads))
+    for sched, by_load in report["exponents"].items():
+        cells = []
+        for load in loads:
+            k = by_load.get(load)
+            cells.append(f"{'-' if k is None else format(k, '.2f'):>12}")
+        print(f"{sched:<18}" + "".join(cells))
+    print("(exponent k in wall_time ~ n^k)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scheduler/engine scalability benchmarks.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Workload sizes (number of jobs), e.g. 1000 10000 100000 1000000 10000000.",
+    )
+    parser.add_argument(
+        "--loads",
+        nargs="+",
+        choices=list(LOADS),
+        default=list(LOADS),
+        help="Arrival-rate regimes to run.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=60.0,
+        help="Skip sizes whose predicted run time exceeds this many seconds.",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak-memory measurement.")
+    parser.add_argument("--save", default=None, help="Write results to this JSON baseline.")
+    parser.add_argument(
+        "--compare",
+        default=None,
+        help="Compare against a saved baseline; exit with status 1 on regressions.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="Allowed wall-time ratio against the baseline before flagging.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report = run_benchmarks(
+        sizes=args.sizes,
+        loads=args.loads,
+        time_budget=args.time_budget,
+        measure_memory=not args.no_memory,
+    )
+    print_exponents(report)
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, time_tolerance=args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,16 @@
 from .runner import run_experiments, ExperimentResult
+from .replication import ReplicatedResult, run_replicated, run_replicated_experiments
+from .sweep import SweepConfig, SweepRow, WorkloadSpec, expand_grid, run_sweep
 
-__all__ = ["run_experiments", "ExperimentResult"]
+__all__ = [
+    "run_experiments",
+    "ExperimentResult",
+    "ReplicatedResult",
+    "run_replicated",
+    "run_replicated_experiments",
+    "SweepConfig",
+    "SweepRow",
+    "WorkloadSpec",
+    "expand_grid",
+    "run_sweep",
+]
@@ -0,0 +1,275 @@
+"""Adaptive Monte Carlo replication for stochastic schedulers.
+
+A stochastic scheduler (Lottery) is re-run with independent seeds until the
+Student-t confidence interval of every chosen metric is narrower than a
+target, and reported as mean +/- half-width. Deterministic schedulers give
+the same result for every seed, so they are run once.
+"""
+
+import hashlib
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Type
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.lottery import LotteryScheduler
+from simulation.accumulator import MetricsAccumulator
+from simulation.engine import SimulationEngine
+from simulation.metrics import SimulationMetrics
+from .runner import DEFAULT_SCHEDULERS, _build_scheduler, _standard_workloads
+
+REPLICATION_METRICS = (
+    "avg_turnaround_time",
+    "avg_response_time",
+    "tail_latency_p95",
+    "starvation_rate",
+    "lifetime_starvation_rate",
+)
+
+
+@dataclass
+class MetricEstimate:
+    mean: float
+    half_width: float  # confidence interval is mean +/- half_width
+    stdev: float
+
+    @property
+    def low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def high(self) -> float:
+        return self.mean + self.half_width
+
+
+@dataclass
+class ReplicatedResult:
+    scheduler_name: str
+    workload_name: str
+    replications: int
+    converged: bool  # False if max_replications ran out first
+    estimates: Dict[str, MetricEstimate]
+    seeds: List[int] = field(default_factory=list)
+
+
+def replication_seeds(base_seed: int, count: int, start: int = 0) -> List[int]:
+    """
+    Seeds for replications ``start .. start+count-1`` of ``base_seed``.
+
+    Each is a hash of (base_seed, index), so they are unrelated to each other
+    and the i-th seed does not depend on how many replications are run.
+    """
+    return [
+        int.from_bytes(
+            hashlib.blake2b(f"{base_seed}:{i}".encode(), digest_size=8).digest(), "little"
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def t_critical(confidence: float, df: int) -> float:
+    """Two-sided Student-t critical value (exact for df <= 2, Cornish-Fisher above)."""
+    p = 0.5 + confidence / 2
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    terms = (
+        (z**3 + z) / 4,
+        (5 * z**5 + 16 * z**3 + 3 * z) / 96,
+        (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384,
+        (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160,
+    )
+    return z + sum(term / df ** (k + 1) for k, term in enumerate(terms))
+
+
+def is_stochastic(SchedulerClass: Type[Scheduler]) -> bool:
+    return issubclass(SchedulerClass, LotteryScheduler)
+
+
+def estimate(samples: Sequence[float], confidence: float) -> MetricEstimate:
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return MetricEstimate(mean=mean, half_width=0.0, stdev=0.0)
+    stdev = statistics.stdev(samples)
+    half_width = t_critical(confidence, len(samples) - 1) * stdev / math.sqrt(len(samples))
+    return MetricEstimate(mean=mean, half_width=half_width, stdev=stdev)
+
+
+# Per-process workload, installed once per worker by _init_worker.
+_JOBS: List[Job] = []
+
+
+def _init_worker(jobs: List[Job]) -> None:
+    global _JOBS
+    _JOBS = jobs
+
+
+def _replicate(
+    SchedulerClass: Type[Scheduler],
+    quantum: int,
+    starvation_threshold: int,
+    seed: int,
+) -> SimulationMetrics:
+    accumulator = MetricsAccumulator(starvation_thresholds=(starvation_threshold,))
+    engine = SimulationEngine(
+        scheduler=_build_scheduler(SchedulerClass, seed),
+        quantum=quantum,
+        accumulator=accumulator,
+        retain_jobs=False,
+    )
+    engine.run(_JOBS)
+    return accumulator.metrics()
+
+
+def run_replicated(
+    jobs: List[Job],
+    SchedulerClass: Type[Scheduler],
+    quantum: int = 4,
+    starvation_threshold: int = 100,
+    base_seed: int = 42,
+    metrics: Sequence[str] = REPLICATION_METRICS,
+    confidence: float = 0.95,
+    relative_precision: float = 0.05,
+    target_half_width: Optional[float] = None,
+    min_replications: int = 5,
+    max_replications: int = 200,
+    batch_size: int = 8,
+    workers: int = 1,
+    workload_name: str = "",
+) -> ReplicatedResult:
+    """
+    Replicate one (workload, scheduler) cell until its estimates are precise enough.
+
+    Replications run in batches of ``batch_size`` (in parallel with
+    ``workers`` > 1; 0 = one per CPU core). After each batch, once at least
+    ``min_replications`` have run, it stops if every metric's CI half-width is
+    at most ``target_half_width``, or ``relative_precision`` times the
+    metric's mean when no absolute target is given. Seeds come from
+    replication_seeds(base_seed, ...) and the stopping points do not depend
+    on ``workers``, so results are reproducible.
+    """
+    unknown = [m for m in metrics if m not in REPLICATION_METRICS]
+    if unknown:
+        raise ValueError("Unknown replication metrics: " + ", ".join(unknown))
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if not 2 <= min_replications <= max_replications:
+        raise ValueError("Need 2 <= min_replications <= max_replications")
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    if not is_stochastic(SchedulerClass):
+        _init_worker(jobs)
+        single = _replicate(SchedulerClass, quantum, starvation_threshold, base_seed)
+        return ReplicatedResult(
+            scheduler_name=SchedulerClass.name,
+            workload_name=workload_name,
+            replications=1,
+            converged=True,
+            estimates={m: estimate([getattr(single, m)], confidence) for m in metrics},
+        )
+
+    samples: Dict[str, List[float]] = {m: [] for m in metrics}
+    seeds: List[int] = []
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, batch_size), initializer=_init_worker, initargs=(jobs,)
+        )
+    else:
+        _init_worker(jobs)
+    try:
+        while True:
+            count = min(batch_size, max_replications - len(seeds))
+            batch = replication_seeds(base_seed, count, start=len(seeds))
+            args = ([SchedulerClass] * count, [quantum] * count, [starvation_threshold] * count, batch)
+            outcomes = pool.map(_replicate, *args) if pool else map(_replicate, *args)
+            for result in outcomes:
+                for m in metrics:
+                    samples[m].append(getattr(result, m))
+            seeds.extend(batch)
+
+            estimates = {m: estimate(samples[m], confidence) for m in metrics}
+            converged = len(seeds) >= min_replications and all(
+                e.half_width <= (
+                    target_half_width
+                    if target_half_width is not None
+                    else relative_precision * abs(e.mean)
+                )
+                for e in estimates.values()
+            )
+            if converged or len(seeds) >= max_replications:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return ReplicatedResult(
+        scheduler_name=SchedulerClass.name,
+        workload_name=workload_name,
+        replications=len(seeds),
+        converged=converged,
+        estimates=estimates,
+        seeds=seeds,
+    )
+
+
+def run_replicated_experiments(
+    schedulers: Optional[List[Type[Scheduler]]] = None,
+    workload_seed: int = 42,
+    batch_num_jobs: int = 20,
+    interactive_num_jobs: int = 50,
+    mixed_num_batch: int = 10,
+    mixed_num_interactive: int = 30,
+    lottery_seed: Optional[int] = None,
+    **options,
+) -> List[ReplicatedResult]:
+    """run_replicated over the run_experiments grid; ``options`` go to run_replicated."""
+    workloads = _standard_workloads(
+        workload_seed, batch_num_jobs, interactive_num_jobs, mixed_num_batch, mixed_num_interactive
+    )
+    base_seed = lottery_seed if lottery_seed is not None else workload_seed
+    return [
+        run_replicated(
+            jobs, SchedulerClass, base_seed=base_seed, workload_name=wl_name, **options
+        )
+        for wl_name, jobs in workloads.items()
+        for SchedulerClass in schedulers or DEFAULT_SCHEDULERS
+    ]
+
+
+_COLUMNS = {
+    "avg_turnaround_time": ("Avg TT", 1, 1),
+    "avg_response_time": ("Avg RT", 1, 1),
+    "tail_latency_p95": ("Tail p95", 0, 1),
+    "starvation_rate": ("Starv(1st)%", 2, 100),
+    "lifetime_starvation_rate": ("Starv(life)%", 2, 100),
+}
+
+
+def print_replicated_table(results: List[ReplicatedResult], confidence: float = 0.95) -> None:
+    """Print mean +/- CI half-width per metric, with the replication count per cell."""
+    print("\n" + "=" * 100)
+    print(f"REPLICATED RESULTS (mean +/- {confidence:.0%} CI half-width)")
+    print("=" * 100)
+    metrics = [m for m in REPLICATION_METRICS if results and m in results[0].estimates]
+    for wl in sorted(set(r.workload_name for r in results)):
+        print(f"\n--- Workload: {wl.upper()} ---\n")
+        header = f"{'Scheduler':<16} {'Reps':>5}" + "".join(f"{_COLUMNS[m][0]:>19}" for m in metrics)
+        print(header)
+        print("-" * len(header))
+        for r in sorted((x for x in results if x.workload_name == wl), key=lambda x: x.scheduler_name):
+            cells = []
+            for m in metrics:
+                _, digits, scale = _COLUMNS[m]
+                e = r.estimates[m]
+                cells.append(f"{e.mean * scale:>10.{digits}f} +/-{e.half_width * scale:>6.{digits}f}")
+            flag = "" if r.converged else "  (max replications reached)"
+            print(f"{r.scheduler_name:<16} {r.replications:>5}" + "".join(f"{c:>19}" for c in cells) + flag)
@@ -1,7 +1,9 @@
 """Experiment runner: run all schedulers on all workloads and compare."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Type, Any
+from typing import Any, Dict, List, Optional, Type
 
 from models.job import Job
 from schedulers.base import Scheduler
@@ -10,8 +12,11 @@ from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
 from schedulers.priority_aging import PriorityAgingScheduler
 from schedulers.lottery import LotteryScheduler
 from schedulers.mlfq import MLFQScheduler
+from simulation.accumulator import MetricsAccumulator
+from simulation.cache import SimulationCache, simulation_key, workload_digest
 from simulation.engine import SimulationEngine
 from simulation.metrics import SimulationMetrics, compute_metrics
+from simulation.profiling import ProfileReport
 from workloads.generator import (
     generate_batch_workload,
     generate_interactive_workload,
@@ -25,6 +30,7 @@ class ExperimentResult:
     workload_name: str
     metrics: SimulationMetrics
     completed_jobs: List[Job] = field(default_factory=list)
+    profile: Optional[ProfileReport] = None
 
 
 # Default schedulers to compare
@@ -47,14 +53,90 @@ def run_experiments(
     interactive_num_jobs: int = 50,
     mixed_num_batch: int = 10,
     mixed_num_interactive: int = 30,
+    lottery_seed: Optional[int] = None,
+    workers: int = 1,
+    cache: Optional[SimulationCache] = None,
+    retain_jobs: bool = False,
+    profile: bool = False,
 ) -> List[ExperimentResult]:
     """
     Run each scheduler on batch, interactive, and mixed workloads.
     Returns list of ExperimentResult for comparison.
+
+    Lottery is seeded with ``lottery_seed`` (defaults to ``workload_seed``) so
+    runs are reproducible. With ``workers`` > 1 the (workload, scheduler) grid
+    is fanned out over a process pool (0 = one worker per CPU core); results
+    come back in the same order as a serial run. Cells found in ``cache`` are
+    not re-simulated, and new results are added to it. Metrics are accumulated
+    online and results carry no completed_jobs unless ``retain_jobs`` is set;
+    ``cache`` is only used then, since it stores completed jobs.
+    ``profile`` instruments every run and attaches a ProfileReport to each
+    result; profiled runs bypass the cache so every cell is actually timed.
     """
     schedulers = schedulers or DEFAULT_SCHEDULERS
+    if lottery_seed is None:
+        lottery_seed = workload_seed
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    workloads = _standard_workloads(
+        workload_seed, batch_num_jobs, interactive_num_jobs, mixed_num_batch, mixed_num_interactive
+    )
+
+    tasks = [
+        (
+            wl_name,
+            jobs,
+            SchedulerClass,
+            quantum,
+            starvation_threshold,
+            lottery_seed,
+            retain_jobs,
+            profile,
+        )
+        for wl_name, jobs in workloads.items()
+        for SchedulerClass in schedulers
+    ]
+
+    results: List[Optional[ExperimentResult]] = [None] * len(tasks)
+    keys: List[Optional[str]] = [None] * len(tasks)
+    use_cache = cache is not None and retain_jobs and not profile
+    if use_cache:
+        digests = {wl_name: workload_digest(jobs) for wl_name, jobs in workloads.items()}
+        for idx, (wl_name, _, SchedulerClass, *_) in enumerate(tasks):
+            scheduler = _build_scheduler(SchedulerClass, lottery_seed)
+            keys[idx] = simulation_key(scheduler, quantum, digests[wl_name])
+            completed = cache.get(keys[idx]) if keys[idx] else None
+            if completed is not None:
+                results[idx] = _make_result(
+                    wl_name, scheduler.name, completed, starvation_threshold
+                )
 
-    workloads = {
+    pending = [idx for idx, result in enumerate(results) if result is None]
+    pending_tasks = [tasks[idx] for idx in pending]
+    if workers == 1 or len(pending_tasks) <= 1:
+        computed = [_run_single(*task) for task in pending_tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending_tasks))) as pool:
+            # map() yields in submission order regardless of completion order.
+            computed = list(pool.map(_run_single, *zip(*pending_tasks)))
+
+    for idx, result in zip(pending, computed):
+        results[idx] = result
+        if use_cache and keys[idx]:
+            cache.put(keys[idx], result.completed_jobs)
+
+    return [r for r in results if r is not None]
+
+
+def _standard_workloads(
+    workload_seed: int,
+    batch_num_jobs: int,
+    interactive_num_jobs: int,
+    mixed_num_batch: int,
+    mixed_num_interactive: int,
+) -> Dict[str, List[Job]]:
+    return {
         "batch": generate_batch_workload(num_jobs=batch_num_jobs, seed=workload_seed),
         "interactive": generate_interactive_workload(
             num_jobs=interactive_num_jobs, seed=workload_seed
@@ -66,24 +148,61 @@ def run_experiments(
         ),
     }
 
-    results: List[ExperimentResult] = []
-
-    for wl_name, jobs in workloads.items():
-        for SchedulerClass in schedulers:
-            scheduler = SchedulerClass()
-            engine = SimulationEngine(scheduler=scheduler, quantum=quantum)
-            completed = engine.run(jobs)
-            metrics = compute_metrics(completed, starvation_threshold=starvation_threshold)
-            results.append(
-                ExperimentResult(
-                    scheduler_name=scheduler.name,
-                    workload_name=wl_name,
-                    metrics=metrics,
-                    completed_jobs=completed,
-                )
-            )
 
-    return results
+def _build_scheduler(SchedulerClass: Type[Scheduler], lottery_seed: Optional[int]) -> Scheduler:
+    if issubclass(SchedulerClass, LotteryScheduler):
+        return SchedulerClass(seed=lottery_seed)
+    return SchedulerClass()
+
+
+def _run_single(
+    wl_name: str,
+    jobs: List[Job],
+    SchedulerClass: Type[Scheduler],
+    quantum: int,
+    starvation_threshold: int,
+    lottery_seed: Optional[int],
+    retain_jobs: bool = False,
+    profile: bool = False,
+) -> ExperimentResult:
+    """Simulate one (workload, scheduler) cell; module-level so worker processes can run it."""
+    scheduler = _build_scheduler(SchedulerClass, lottery_seed)
+    if not retain_jobs:
+        accumulator = MetricsAccumulator(starvation_thresholds=(starvation_threshold,))
+        engine = SimulationEngine(
+            scheduler=scheduler,
+            quantum=quantum,
+            accumulator=accumulator,
+            retain_jobs=False,
+            profile=profile,
+        )
+        engine.run(jobs)
+        return ExperimentResult(
+            scheduler_name=scheduler.name,
+            workload_name=wl_name,
+            metrics=accumulator.metrics(),
+            profile=engine.profile_report,
+        )
+    engine = SimulationEngine(scheduler=scheduler, quantum=quantum, profile=profile)
+    completed = engine.run(jobs)
+    result = _make_result(wl_name, scheduler.name, completed, starvation_threshold)
+    result.profile = engine.profile_report
+    return result
+
+
+def _make_result(
+    wl_name: str,
+    scheduler_name: str,
+    completed: List[Job],
+    starvation_threshold: int,
+) -> ExperimentResult:
+    metrics = compute_metrics(completed, starvation_threshold=starvation_threshold)
+    return ExperimentResult(
+        scheduler_name=scheduler_name,
+        workload_name=wl_name,
+        metrics=metrics,
+        completed_jobs=completed,
+    )
 
 
 def print_results_table(results: List[ExperimentResult]) -> None:
@@ -115,3 +234,18 @@ def print_results_table(results: List[ExperimentResult]) -> None:
     print("\n" + "=" * 100)
     print("Starv(1st)  = % of jobs waiting > threshold before first run")
     print("Starv(life) = % of jobs whose total wait (turnaround - burst) > threshold")
+
+
+def print_profile_reports(results: List[ExperimentResult]) -> None:
+    """Print the per-run profiling reports collected with run_experiments(profile=True)."""
+    profiled = [r for r in results if r.profile is not None]
+    if not profiled:
+        return
+    print("\n" + "=" * 100)
+    print("PROFILE")
+    print("=" * 100)
+    for wl in sorted(set(r.workload_name for r in profiled)):
+        print(f"\n--- Workload: {wl.upper()} ---")
+        for r in sorted((x for x in profiled if x.workload_name == wl), key=lambda x: x.scheduler_name):
+            print()
+            print(r.profile.format())
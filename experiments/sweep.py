@@ -0,0 +1,299 @@
+"""Parameter sweeps: run many scheduler configurations over shared workloads."""
+
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from models.job import Job
+from schedulers.base import Scheduler
+from simulation.engine import SimulationEngine
+from simulation.metrics import SimulationMetrics, compute_metrics
+from workloads.generator import (
+    generate_batch_workload,
+    generate_interactive_workload,
+    generate_mixed_workload,
+)
+from .runner import DEFAULT_SCHEDULERS
+
+SCHEDULERS_BY_NAME = {cls.name: cls for cls in DEFAULT_SCHEDULERS}
+
+WORKLOAD_GENERATORS: Dict[str, Callable[..., List[Job]]] = {
+    "batch": generate_batch_workload,
+    "interactive": generate_interactive_workload,
+    "mixed": generate_mixed_workload,
+}
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """A named generated workload: generator kind plus its keyword arguments."""
+
+    kind: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    def generate(self) -> List[Job]:
+        if self.kind not in WORKLOAD_GENERATORS:
+            raise ValueError(f"Unknown workload kind: {self.kind}")
+        return WORKLOAD_GENERATORS[self.kind](**dict(self.params))
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    """One point of a sweep: a scheduler configuration on a named workload."""
+
+    workload: str
+    scheduler: str
+    quantum: int = 4
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    def run_key(self) -> tuple:
+        """Key identifying the simulation this point needs.
+
+        Points that differ only in settings the scheduler ignores share a key,
+        e.g. the engine quantum for SJF/SRTF (run to completion) and MLFQ
+        (per-level quanta).
+        """
+        cls = SCHEDULERS_BY_NAME[self.scheduler]
+        uses_quantum = getattr(cls, "preempts_on_quantum", True) and not hasattr(
+            cls, "get_quantum"
+        )
+        return (self.workload, self.scheduler, self.quantum if uses_quantum else None, self.params)
+
+
+@dataclass
+class SweepRow:
+    config: SweepConfig
+    metrics: Dict[int, SimulationMetrics] = field(default_factory=dict)  # threshold -> metrics
+
+
+def freeze_params(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """Turn a parameter dict into a hashable, order-independent tuple."""
+    if not params:
+        return ()
+    return tuple(sorted((k, _freeze(v)) for k, v in params.items()))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def expand_grid(
+    workloads: Iterable[str],
+    schedulers: Dict[str, Dict[str, List[Any]]],
+    quanta: Iterable[int] = (4,),
+) -> List[SweepConfig]:
+    """
+    Cartesian product of workloads x quanta x per-scheduler parameter grids.
+
+    ``schedulers`` maps a scheduler name to {param: [alternatives, ...]}; an
+    empty dict runs the scheduler with its defaults.
+    """
+    configs: List[SweepConfig] = []
+    for workload in workloads:
+        for quantum in quanta:
+            for name, grid in schedulers.items():
+                if name not in SCHEDULERS_BY_NAME:
+                    raise ValueError(f"Unknown scheduler: {name}")
+                keys = sorted(grid)
+                for values in itertools.product(*(grid[k] for k in keys)):
+                    configs.append(
+                        SweepConfig(
+                            workload=workload,
+                            scheduler=name,
+                            quantum=quantum,
+                            params=freeze_params(dict(zip(keys, values))),
+                        )
+                    )
+    return configs
+
+
+def build_configured_scheduler(config: SweepConfig, lottery_seed: Optional[int]) -> Scheduler:
+    cls = SCHEDULERS_BY_NAME[config.scheduler]
+    kwargs = {k: (list(v) if isinstance(v, tuple) else v) for k, v in config.params}
+    if config.scheduler == "Lottery":
+        kwargs.setdefault("seed", lottery_seed)
+    return cls(**kwargs)
+
+
+# Per-process workload table, installed once per worker by _init_worker.
+_WORKLOADS: Dict[str, List[Job]] = {}
+
+
+def _init_worker(workloads: Dict[str, List[Job]]) -> None:
+    global _WORKLOADS
+    _WORKLOADS = workloads
+
+
+def _simulate_point(
+    config: SweepConfig,
+    starvation_thresholds: Tuple[int, ...],
+    lottery_seed: Optional[int],
+) -> Dict[int, SimulationMetrics]:
+    scheduler = build_configured_scheduler(config, lottery_seed)
+    engine = SimulationEngine(scheduler=scheduler, quantum=config.quantum)
+    completed = engine.run(_WORKLOADS[config.workload])
+    # The threshold only affects metrics, so one simulation serves them all.
+    return {t: compute_metrics(completed, starvation_threshold=t) for t in starvation_thresholds}
+
+
+def run_sweep(
+    configs: List[SweepConfig],
+    workloads: Dict[str, WorkloadSpec],
+    starvation_thresholds: Iterable[int] = (100,),
+    output_path: Optional[str] = None,
+    lottery_seed: Optional[int] = 42,
+    workers: int = 1,
+) -> List[SweepRow]:
+    """
+    Run every sweep point and return one SweepRow per config, in input order.
+
+    Each workload is generated once and shared by all points; points that map
+    to the same simulation (see SweepConfig.run_key) are simulated once. If
+    ``output_path`` is given, a CSV row per point is written and flushed as
+    soon as its simulation finishes.
+    """
+    thresholds = tuple(starvation_thresholds)
+    if not thresholds:
+        raise ValueError("At least one starvation threshold is required")
+    missing = {c.workload for c in configs} - set(workloads)
+    if missing:
+        raise ValueError("Unknown workloads: " + ", ".join(sorted(missing)))
+
+    generated: Dict[WorkloadSpec, List[Job]] = {}
+    jobs_by_name: Dict[str, List[Job]] = {}
+    for name in sorted({c.workload for c in configs}):
+        spec = workloads[name]
+        if spec not in generated:
+            generated[spec] = spec.generate()
+        jobs_by_name[name] = generated[spec]
+
+    unique: Dict[tuple, SweepConfig] = {}
+    for config in configs:
+        unique.setdefault(config.run_key(), config)
+    waiting: Dict[tuple, List[int]] = {}
+    for idx, config in enumerate(configs):
+        waiting.setdefault(config.run_key(), []).append(idx)
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    rows: List[Optional[SweepRow]] = [None] * len(configs)
+    with _SweepWriter(output_path, thresholds) as writer:
+        keys = list(unique)
+        args = ([unique[k] for k in keys], [thresholds] * len(keys), [lottery_seed] * len(keys))
+        if workers == 1 or len(keys) <= 1:
+            _init_worker(jobs_by_name)
+            outcomes: Iterable[Dict[int, SimulationMetrics]] = map(_simulate_point, *args)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=min(workers, len(keys)),
+                initializer=_init_worker,
+                initargs=(jobs_by_name,),
+            )
+            outcomes = pool.map(_simulate_point, *args)
+        try:
+            for key, metrics in zip(keys, outcomes):
+                for idx in waiting[key]:
+                    rows[idx] = SweepRow(config=configs[idx], metrics=metrics)
+                    writer.write(rows[idx])
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    return [row for row in rows if row is not None]
+
+
+class _SweepWriter:
+    """Appends one CSV row per sweep point, flushing after each."""
+
+    METRIC_FIELDS = ("avg_turnaround_time", "avg_response_time", "tail_latency_p95", "completed_jobs")
+
+    def __init__(self, path: Optional[str], thresholds: Tuple[int, ...]) -> None:
+        self.path = path
+        self.thresholds = thresholds
+        self._file = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "_SweepWriter":
+        if self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", newline="")
+            self._writer = csv.writer(self._file)
+            header = ["workload", "scheduler", "quantum", "params", *self.METRIC_FIELDS]
+            for t in self.thresholds:
+                header += [f"starvation_rate@{t}", f"lifetime_starvation_rate@{t}"]
+            self._writer.writerow(header)
+        return self
+
+    def write(self, row: SweepRow) -> None:
+        if self._writer is None:
+            return
+        c = row.config
+        base = row.metrics[self.thresholds[0]]
+        values: List[Any] = [c.workload, c.scheduler, c.quantum, json.dumps(dict(c.params))]
+        values += [getattr(base, f) for f in self.METRIC_FIELDS]
+        for t in self.thresholds:
+            values += [row.metrics[t].starvation_rate, row.metrics[t].lifetime_starvation_rate]
+        self._writer.writerow(values)
+        self._file.flush()
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def load_sweep_file(
+    path: str,
+    default_workloads: Optional[Dict[str, WorkloadSpec]] = None,
+) -> Tuple[List[SweepConfig], Dict[str, WorkloadSpec], List[int]]:
+    """
+    Read a JSON sweep definition.
+
+    Keys: ``workloads`` ({name: {"kind": ..., **generator kwargs}}, optional when
+    ``default_workloads`` is given), ``schedulers`` ({name: {param: [values]}}),
+    ``quantum`` (list), ``starvation_thresholds`` (list), and ``points`` (an
+    explicit list of {"workload", "scheduler", "quantum", "params"} added after
+    the grid).
+    """
+    with open(path) as f:
+        spec = json.load(f)
+
+    if "workloads" in spec:
+        workloads = {
+            name: WorkloadSpec(
+                kind=w.get("kind", name),
+                params=freeze_params({k: v for k, v in w.items() if k != "kind"}),
+            )
+            for name, w in spec["workloads"].items()
+        }
+    elif default_workloads:
+        workloads = dict(default_workloads)
+    else:
+        raise ValueError("Sweep file must define 'workloads'")
+
+    configs = expand_grid(
+        workloads=list(workloads),
+        schedulers=spec.get("schedulers", {}),
+        quanta=spec.get("quantum", [4]),
+    )
+    for point in spec.get("points", []):
+        if point["scheduler"] not in SCHEDULERS_BY_NAME:
+            raise ValueError(f"Unknown scheduler: {point['scheduler']}")
+        configs.append(
+            SweepConfig(
+                workload=point["workload"],
+                scheduler=point["scheduler"],
+                quantum=point.get("quantum", 4),
+                params=freeze_params(point.get("params")),
+            )
+        )
+    thresholds = spec.get("starvation_thresholds", [100])
+    return configs, workloads, thresholds
@@ -36,7 +36,11 @@ def generate_visualizations(
     for workload in workloads:
         wl_results = [r for r in results if r.workload_name == workload]
         by_sched = {r.scheduler_name: r for r in wl_results}
-        workload_n = len(wl_results[0].completed_jobs) if wl_results else 0
+        workload_n = (
+            len(wl_results[0].completed_jobs) or wl_results[0].metrics.completed_jobs
+            if wl_results
+            else 0
+        )
 
         if workload == "batch":
             metric_defs = [
@@ -54,12 +58,15 @@ def generate_visualizations(
                 ("avg_response_time", "Avg Response Time", 1.0),
             ]
             mixed_jobs = wl_results[0].completed_jobs if wl_results else []
-            batch_count = sum(1 for j in mixed_jobs if j.priority <= 0)
-            interactive_count = len(mixed_jobs) - batch_count
-            title = (
-                "Mixed (fair vs. responsive, "
-                f"batch={batch_count}, interactive={interactive_count})"
-            )
+            if mixed_jobs:
+                batch_count = sum(1 for j in mixed_jobs if j.priority <= 0)
+                interactive_count = len(mixed_jobs) - batch_count
+                title = (
+                    "Mixed (fair vs. responsive, "
+                    f"batch={batch_count}, interactive={interactive_count})"
+                )
+            else:  # per-job records were not retained
+                title = f"Mixed (fair vs. responsive, n={workload_n})"
 
         fig, axes = plt.subplots(1, len(metric_defs), figsize=(6 * len(metric_defs), 5))
         if len(metric_defs) == 1:
@@ -3,8 +3,15 @@
 
 import argparse
 
-from experiments.runner import run_experiments, print_results_table
+from experiments.replication import (
+    REPLICATION_METRICS,
+    print_replicated_table,
+    run_replicated_experiments,
+)
+from experiments.runner import print_profile_reports, print_results_table, run_experiments
+from experiments.sweep import WorkloadSpec, freeze_params, load_sweep_file, run_sweep
 from experiments.visualization import generate_visualizations
+from simulation.cache import SimulationCache
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,6 +52,74 @@ def parse_args() -> argparse.Namespace:
         default=30,
         help="Number of interactive jobs in mixed workload.",
     )
+    parser.add_argument(
+        "--lottery-seed",
+        type=int,
+        default=None,
+        help="Seed for the Lottery scheduler (defaults to --seed).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the experiment grid (0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--job-records",
+        action="store_true",
+        help="Keep every completed job instead of only aggregating metrics online.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time scheduler callbacks and the engine loop and print a report.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse simulation results stored in this directory across runs.",
+    )
+    parser.add_argument(
+        "--sweep",
+        metavar="CONFIG",
+        default=None,
+        help="Run a parameter sweep defined in a JSON file instead of the default grid.",
+    )
+    parser.add_argument(
+        "--sweep-output",
+        default="results/sweep.csv",
+        help="CSV file that sweep rows are streamed to.",
+    )
+    parser.add_argument(
+        "--replicate",
+        action="store_true",
+        help="Re-run stochastic schedulers with independent seeds and report mean +/- CI.",
+    )
+    parser.add_argument(
+        "--confidence", type=float, default=0.95, help="Confidence level for --replicate."
+    )
+    parser.add_argument(
+        "--ci-precision",
+        type=float,
+        default=0.05,
+        help="Stop replicating once every CI half-width is at most this fraction of its mean.",
+    )
+    parser.add_argument(
+        "--ci-half-width",
+        type=float,
+        default=None,
+        help="Absolute CI half-width target (overrides --ci-precision).",
+    )
+    parser.add_argument(
+        "--max-replications", type=int, default=200, help="Upper bound on replications per cell."
+    )
+    parser.add_argument(
+        "--replication-metrics",
+        nargs="+",
+        choices=REPLICATION_METRICS,
+        default=list(REPLICATION_METRICS),
+        help="Metrics whose CI must meet the target.",
+    )
     parser.add_argument(
         "--no-viz",
         action="store_true",
@@ -53,13 +128,76 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def run_sweep_from_args(args: argparse.Namespace) -> None:
+    default_workloads = {
+        "batch": WorkloadSpec(
+            "batch", freeze_params({"num_jobs": args.batch_num_jobs, "seed": args.seed})
+        ),
+        "interactive": WorkloadSpec(
+            "interactive",
+            freeze_params({"num_jobs": args.interactive_num_jobs, "seed": args.seed}),
+        ),
+        "mixed": WorkloadSpec(
+            "mixed",
+            freeze_params(
+                {
+                    "num_batch": args.mixed_num_batch,
+                    "num_interactive": args.mixed_num_interactive,
+                    "seed": args.seed,
+                }
+            ),
+        ),
+    }
+    configs, workloads, thresholds = load_sweep_file(args.sweep, default_workloads)
+    lottery_seed = args.lottery_seed if args.lottery_seed is not None else args.seed
+    print(f"Sweep: {len(configs)} points over {len(workloads)} workloads, thresholds {thresholds}")
+    rows = run_sweep(
+        configs,
+        workloads,
+        starvation_thresholds=thresholds,
+        output_path=args.sweep_output,
+        lottery_seed=lottery_seed,
+        workers=args.jobs,
+    )
+    print(f"Wrote {len(rows)} rows to {args.sweep_output}")
+
+
+def run_replicated_from_args(args: argparse.Namespace) -> None:
+    print("Replicating stochastic schedulers until their confidence intervals converge")
+    results = run_replicated_experiments(
+        workload_seed=args.seed,
+        batch_num_jobs=args.batch_num_jobs,
+        interactive_num_jobs=args.interactive_num_jobs,
+        mixed_num_batch=args.mixed_num_batch,
+        mixed_num_interactive=args.mixed_num_interactive,
+        lottery_seed=args.lottery_seed,
+        quantum=args.quantum,
+        starvation_threshold=args.starvation_threshold,
+        metrics=args.replication_metrics,
+        confidence=args.confidence,
+        relative_precision=args.ci_precision,
+        target_half_width=args.ci_half_width,
+        max_replications=args.max_replications,
+        workers=args.jobs,
+    )
+    print_replicated_table(results, confidence=args.confidence)
+
+
 def main() -> None:
     args = parse_args()
 
+    if args.sweep:
+        run_sweep_from_args(args)
+        return
+    if args.replicate:
+        run_replicated_from_args(args)
+        return
+
     print("Workload-Driven Scheduling Evaluation")
     print("Running schedulers: Round Robin, SJF, SRTF, Priority+Aging, Lottery, MLFQ")
     print("Workloads: batch, interactive, mixed\n")
 
+    cache = SimulationCache(cache_dir=args.cache_dir) if args.cache_dir else None
     results = run_experiments(
         quantum=args.quantum,
         workload_seed=args.seed,
@@ -68,9 +206,23 @@ def main() -> None:
         interactive_num_jobs=args.interactive_num_jobs,
         mixed_num_batch=args.mixed_num_batch,
         mixed_num_interactive=args.mixed_num_interactive,
+        lottery_seed=args.lottery_seed,
+        workers=args.jobs,
+        cache=cache,
+        # The result cache stores completed jobs, so it needs the records.
+        retain_jobs=args.job_records or cache is not None,
+        profile=args.profile,
     )
 
     print_results_table(results)
+    if args.profile:
+        print_profile_reports(results)
+    if cache is not None:
+        stats = cache.stats
+        print(
+            f"\nResult cache: {stats.hits} hits ({stats.disk_hits} from disk), "
+            f"{stats.misses} misses, {stats.evictions} evictions"
+        )
 
     if not args.no_viz:
         try:
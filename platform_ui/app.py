@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
 from pathlib import Path
@@ -17,11 +18,16 @@ if str(ROOT) not in sys.path:
 
 from models.job import Job
 from platform_ui.experiment_service import (
+    BackgroundExperiment,
     PlatformRunResult,
     available_scheduler_names,
-    run_platform_experiment,
 )
-from platform_ui.workload_io import parse_workload_text, parse_workload_upload
+from platform_ui.workload_io import (
+    WorkloadParseResult,
+    WorkloadValidationError,
+    parse_workload_text,
+    parse_workload_upload,
+)
 from workloads.generator import (
     generate_batch_workload,
     generate_interactive_workload,
@@ -35,6 +41,8 @@ DEFAULT_TEMPLATE = """job_id,arrival_time,burst_time,priority
 2,3,8,1
 """
 SESSION_RESULTS_KEY = "platform_results"
+SESSION_EXPERIMENT_KEY = "platform_experiment"
+POLL_SECONDS = 0.5
 
 
 def main() -> None:
@@ -66,18 +74,19 @@ def main() -> None:
 
     jobs: list[Job] | None = None
     source_label = ""
+    input_key = ""
 
     if input_mode == "Preset generator":
-        jobs, source_label = render_preset_input()
+        jobs, source_label, input_key = render_preset_input()
     elif input_mode == "Upload file":
-        jobs, source_label = render_upload_input()
+        jobs, source_label, input_key = render_upload_input()
     else:
-        jobs, source_label = render_manual_input()
+        jobs, source_label, input_key = render_manual_input()
 
     if jobs:
         st.subheader("Workload Preview")
         st.caption(source_label)
-        st.dataframe(_jobs_to_table(jobs), use_container_width=True)
+        st.dataframe(_jobs_to_table(jobs, input_key), use_container_width=True)
 
     run_clicked = st.button("Run Experiment", type="primary", use_container_width=True)
     if run_clicked:
@@ -85,8 +94,11 @@ def main() -> None:
             st.error("Please provide a valid workload before running the experiment.")
             return
 
+        previous = st.session_state.get(SESSION_EXPERIMENT_KEY)
+        if previous is not None:
+            previous.cancel()
         try:
-            results = run_platform_experiment(
+            experiment = BackgroundExperiment(
                 jobs=jobs,
                 scheduler_names=scheduler_names,
                 quantum=quantum,
@@ -97,51 +109,94 @@ def main() -> None:
             st.error(str(err))
             return
 
-        st.success("Experiment complete")
-        st.session_state[SESSION_RESULTS_KEY] = results
+        st.session_state[SESSION_EXPERIMENT_KEY] = experiment.start()
+        st.session_state[SESSION_RESULTS_KEY] = None
+
+    experiment = st.session_state.get(SESSION_EXPERIMENT_KEY)
+    if experiment is not None and experiment.running:
+        render_experiment_progress()
+        return
+    if experiment is not None:
+        # Finished since the last rerun: keep its results, report how it ended.
+        _, results, error = experiment.snapshot()
+        st.session_state[SESSION_EXPERIMENT_KEY] = None
+        st.session_state[SESSION_RESULTS_KEY] = results or None
+        if error:
+            st.error(error)
+        elif experiment.cancelled:
+            st.warning(f"Experiment cancelled after {len(results)} scheduler(s)")
+        else:
+            st.success("Experiment complete")
 
     if st.session_state[SESSION_RESULTS_KEY] is not None:
         render_results(st.session_state[SESSION_RESULTS_KEY])
 
 
-def render_preset_input() -> tuple[list[Job], str]:
+@st.fragment(run_every=POLL_SECONDS)
+def render_experiment_progress() -> None:
+    """Poll the running experiment; only this fragment reruns until it ends."""
+    experiment: BackgroundExperiment | None = st.session_state.get(SESSION_EXPERIMENT_KEY)
+    if experiment is None or not experiment.running:
+        st.rerun()  # full rerun renders the final results without polling
+
+    progress, results, _ = experiment.snapshot()
+    st.subheader("Running")
+    for name, fraction in progress.items():
+        st.progress(fraction, text=f"{name}: {fraction:.0%}")
+    if st.button("Cancel", disabled=experiment.cancelled):
+        experiment.cancel()
+    if results:
+        render_results(results)
+
+
+def render_preset_input() -> tuple[list[Job], str, str]:
     preset = st.selectbox("Preset workload", options=["batch", "interactive", "mixed"])
     seed = st.number_input("Seed", min_value=0, value=42, step=1)
 
     if preset == "batch":
         num_jobs = st.number_input("Number of jobs", min_value=1, value=20, step=1)
-        jobs = generate_batch_workload(num_jobs=int(num_jobs), seed=int(seed))
+        sizes = (int(num_jobs),)
     elif preset == "interactive":
         num_jobs = st.number_input("Number of jobs", min_value=1, value=50, step=1)
-        jobs = generate_interactive_workload(num_jobs=int(num_jobs), seed=int(seed))
+        sizes = (int(num_jobs),)
     else:
         num_batch = st.number_input("Batch jobs", min_value=1, value=10, step=1)
         num_interactive = st.number_input("Interactive jobs", min_value=1, value=30, step=1)
-        jobs = generate_mixed_workload(
-            num_batch=int(num_batch),
-            num_interactive=int(num_interactive),
-            seed=int(seed),
-        )
+        sizes = (int(num_batch), int(num_interactive))
 
-    return jobs, f"Generated preset: {preset} ({len(jobs)} jobs)"
+    jobs = _generate_preset(preset, sizes, int(seed))
+    return jobs, f"Generated preset: {preset} ({len(jobs)} jobs)", f"preset:{preset}:{sizes}:{seed}"
 
 
-def render_upload_input() -> tuple[list[Job] | None, str]:
-    uploaded = st.file_uploader("Upload .csv or .json workload", type=["csv", "json"])
+def render_upload_input() -> tuple[list[Job] | None, str, str]:
+    uploaded = st.file_uploader(
+        "Upload .csv, .json, .jsonl or .swl workload", type=["csv", "json", "jsonl", "swl"]
+    )
     if uploaded is None:
         st.info("Required columns/fields: arrival_time, burst_time. Optional: job_id, priority")
-        return None, ""
+        return None, "", ""
 
+    payload = uploaded.getvalue()
     try:
-        parsed = parse_workload_upload(uploaded.name, uploaded.getvalue())
+        parsed = _parse_upload(uploaded.name, payload)
+    except WorkloadValidationError as err:
+        st.error(str(err))
+        if len(err.errors) > 1:
+            with st.expander("All row errors"):
+                st.text("\n".join(err.errors))
+        return None, "", ""
     except ValueError as err:
         st.error(str(err))
-        return None, ""
+        return None, "", ""
 
-    return parsed.jobs, f"Uploaded: {uploaded.name} ({parsed.source_summary})"
+    return (
+        parsed.jobs,
+        f"Uploaded: {uploaded.name} ({parsed.source_summary})",
+        f"upload:{uploaded.name}:{_digest(payload)}",
+    )
 
 
-def render_manual_input() -> tuple[list[Job] | None, str]:
+def render_manual_input() -> tuple[list[Job] | None, str, str]:
     fmt = st.selectbox("Manual format", options=["CSV", "JSON"])
     default_payload = DEFAULT_TEMPLATE if fmt == "CSV" else _default_json_template()
     payload = st.text_area(
@@ -152,12 +207,16 @@ def render_manual_input() -> tuple[list[Job] | None, str]:
     )
 
     try:
-        parsed = parse_workload_text(payload, fmt)
+        parsed = _parse_text(payload, fmt)
     except ValueError as err:
         st.error(str(err))
-        return None, ""
+        return None, "", ""
 
-    return parsed.jobs, f"Manual {fmt}: {parsed.source_summary}"
+    return (
+        parsed.jobs,
+        f"Manual {fmt}: {parsed.source_summary}",
+        f"manual:{fmt}:{_digest(payload.encode())}",
+    )
 
 
 def render_results(results: list[PlatformRunResult]) -> None:
@@ -247,16 +306,45 @@ def render_results(results: list[PlatformRunResult]) -> None:
     )
 
 
-def _jobs_to_table(jobs: list[Job]) -> list[dict[str, int]]:
-    return [
+# Workloads are memoized by a hash of their inputs, so widget interactions and
+# progress reruns do not regenerate or reparse them. cache_resource hands back
+# the same objects; that is safe because the engine copies jobs before running.
+
+
+@st.cache_resource(max_entries=8, show_spinner="Generating workload...")
+def _generate_preset(preset: str, sizes: tuple[int, ...], seed: int) -> list[Job]:
+    if preset == "batch":
+        return generate_batch_workload(num_jobs=sizes[0], seed=seed)
+    if preset == "interactive":
+        return generate_interactive_workload(num_jobs=sizes[0], seed=seed)
+    return generate_mixed_workload(num_batch=sizes[0], num_interactive=sizes[1], seed=seed)
+
+
+@st.cache_resource(max_entries=8, show_spinner="Parsing workload...")
+def _parse_upload(filename: str, payload: bytes) -> WorkloadParseResult:
+    return parse_workload_upload(filename, payload)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _parse_text(payload: str, fmt: str) -> WorkloadParseResult:
+    return parse_workload_text(payload, fmt)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _jobs_to_table(_jobs: list[Job], input_key: str) -> pd.DataFrame:
+    """Preview table, keyed by the inputs the jobs came from (hashing jobs is slow)."""
+    return pd.DataFrame(
         {
-            "job_id": job.job_id,
-            "arrival_time": job.arrival_time,
-            "burst_time": job.burst_time,
-            "priority": job.priority,
+            "job_id": [job.job_id for job in _jobs],
+            "arrival_time": [job.arrival_time for job in _jobs],
+            "burst_time": [job.burst_time for job in _jobs],
+            "priority": [job.priority for job in _jobs],
         }
-        for job in jobs
-    ]
+    )
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def _default_json_template() -> str:
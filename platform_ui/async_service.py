@@ -0,0 +1,270 @@
+"""Asyncio front end for running several platform experiments concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+from models.job import Job
+from platform_ui.experiment_service import (
+    RESULT_CACHE,
+    PlatformRunResult,
+    _check_inputs,
+    run_platform_scheduler,
+)
+from simulation.cache import SimulationCache, workload_digest
+from simulation.engine import SimulationCancelled
+
+
+@dataclass
+class ExperimentProgress:
+    """Simulated time one scheduler has covered out of the workload's horizon."""
+
+    experiment_id: int
+    scheduler_name: str
+    simulated_time: int
+    horizon: int
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.simulated_time / self.horizon) if self.horizon else 1.0
+
+
+def simulation_horizon(jobs: list[Job]) -> int:
+    """
+    Time at which the last job completes.
+
+    Every scheduler here is work-conserving and switches for free, so the
+    makespan depends only on arrivals and bursts, not on the policy.
+    """
+    clock = 0
+    for job in sorted(jobs, key=lambda j: j.arrival_time):
+        clock = max(clock, job.arrival_time) + job.burst_time
+    return clock
+
+
+class ExperimentHandle:
+    """
+    One submitted experiment. Each selected scheduler runs as its own pool task.
+
+    Iterate ``async for result in handle.results()`` to receive results as
+    each scheduler finishes, or ``await handle.wait()`` for all of them in
+    selection order. ``progress`` holds the latest ExperimentProgress per
+    scheduler. If the experiment is cancelled, times out or a run fails,
+    both raise that error (SimulationCancelled, TimeoutError or the run's
+    exception) once the results finished before it are delivered.
+    """
+
+    def __init__(
+        self,
+        experiment_id: int,
+        scheduler_names: list[str],
+        horizon: int,
+        on_progress: Callable[[ExperimentProgress], None] | None,
+    ) -> None:
+        self.experiment_id = experiment_id
+        self.scheduler_names = list(scheduler_names)
+        self.horizon = horizon
+        self.progress = {
+            name: ExperimentProgress(experiment_id, name, 0, horizon)
+            for name in self.scheduler_names
+        }
+        self.error: BaseException | None = None
+        self._finished = False
+        self._on_progress = on_progress
+        self._results: list[PlatformRunResult] = []
+        self._changed = asyncio.Condition()
+        self._stop = threading.Event()  # read by the worker threads
+        self._futures: list[asyncio.Future] = []
+        self._task: asyncio.Task | None = None
+
+    def done(self) -> bool:
+        return self._finished
+
+    def cancel(self) -> None:
+        """
+        Stop the experiment (call from the event loop thread). Queued runs are
+        dropped and running ones stop at their next progress report.
+        """
+        self._stop.set()
+        for future in self._futures:
+            future.cancel()
+
+    async def results(self) -> AsyncIterator[PlatformRunResult]:
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(
+                    lambda: index < len(self._results) or self.done()
+                )
+            while index < len(self._results):
+                yield self._results[index]
+                index += 1
+            if self.done():
+                if self.error is not None:
+                    raise self.error
+                return
+
+    async def wait(self) -> list[PlatformRunResult]:
+        async for _ in self.results():
+            pass
+        order = {name: idx for idx, name in enumerate(self.scheduler_names)}
+        return sorted(self._results, key=lambda r: order[r.scheduler_name])
+
+    def _report(self, name: str, simulated_time: int) -> None:
+        progress = ExperimentProgress(self.experiment_id, name, simulated_time, self.horizon)
+        self.progress[name] = progress
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+    async def _add(self, result: PlatformRunResult, requested_name: str) -> None:
+        self._report(requested_name, self.horizon)
+        async with self._changed:
+            self._results.append(result)
+            self._changed.notify_all()
+
+    async def _finish(self, error: BaseException | None) -> None:
+        self.error = error
+        self._finished = True
+        async with self._changed:
+            self._changed.notify_all()
+
+
+class AsyncExperimentService:
+    """
+    Runs experiments on a bounded thread pool without blocking the event loop.
+
+    At most ``max_workers`` scheduler simulations run at a time across all
+    experiments; the rest queue in submission order. Simulations share the
+    GIL, so the pool bounds concurrency rather than adding throughput (use
+    ``main.py --jobs`` for CPU-parallel grids). Results are shared through
+    ``cache`` exactly as in run_platform_experiment.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cache: SimulationCache | None = RESULT_CACHE,
+    ) -> None:
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.cache = cache
+        self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="experiment")
+        self._ids = itertools.count(1)
+        self.experiments: dict[int, ExperimentHandle] = {}
+
+    def submit(
+        self,
+        jobs: list[Job],
+        scheduler_names: list[str],
+        quantum: int,
+        starvation_threshold: int,
+        lottery_seed: int,
+        timeout: float | None = None,
+        on_progress: Callable[[ExperimentProgress], None] | None = None,
+    ) -> ExperimentHandle:
+        """Start an experiment; must be called from a running event loop."""
+        _check_inputs(jobs, scheduler_names)
+        loop = asyncio.get_running_loop()
+        handle = ExperimentHandle(
+            next(self._ids), scheduler_names, simulation_horizon(jobs), on_progress
+        )
+        digest = workload_digest(jobs) if self.cache is not None else ""
+        handle._futures = [
+            loop.run_in_executor(
+                self._pool,
+                self._run_one,
+                handle,
+                loop,
+                jobs,
+                name,
+                quantum,
+                starvation_threshold,
+                lottery_seed,
+                digest,
+            )
+            for name in handle.scheduler_names
+        ]
+        handle._task = loop.create_task(self._supervise(handle, timeout))
+        self.experiments[handle.experiment_id] = handle
+        return handle
+
+    def get(self, experiment_id: int) -> ExperimentHandle:
+        return self.experiments[experiment_id]
+
+    async def close(self) -> None:
+        """Cancel unfinished experiments and release the pool."""
+        handles = [h for h in self.experiments.values() if not h.done()]
+        for handle in handles:
+            handle.cancel()
+        await asyncio.gather(*(h._task for h in handles), return_exceptions=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncExperimentService":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def _run_one(
+        self,
+        handle: ExperimentHandle,
+        loop: asyncio.AbstractEventLoop,
+        jobs: list[Job],
+        name: str,
+        quantum: int,
+        starvation_threshold: int,
+        lottery_seed: int,
+        digest: str,
+    ) -> tuple[str, PlatformRunResult]:
+        # Runs on a pool thread; everything touching the handle goes through the loop.
+        def report(current_time: int, completed: int) -> None:
+            if handle._stop.is_set():
+                raise SimulationCancelled
+            loop.call_soon_threadsafe(handle._report, name, current_time)
+
+        if handle._stop.is_set():
+            raise SimulationCancelled
+        result = run_platform_scheduler(
+            jobs,
+            name,
+            quantum,
+            starvation_threshold,
+            lottery_seed,
+            self.cache,
+            digest,
+            progress=report,
+        )
+        return name, result
+
+    async def _supervise(
+        self,
+        handle: ExperimentHandle,
+        timeout: float | None,
+    ) -> None:
+        error: BaseException | None = None
+        try:
+            await asyncio.wait_for(self._collect(handle), timeout)
+        except asyncio.CancelledError:
+            error = SimulationCancelled(f"Experiment {handle.experiment_id} cancelled")
+        except asyncio.TimeoutError:
+            error = TimeoutError(
+                f"Experiment {handle.experiment_id} timed out after {timeout:g}s"
+            )
+        except Exception as err:
+            error = err
+        if error is not None:
+            handle.cancel()
+            for future in handle._futures:
+                if not future.cancelled():
+                    future.exception()  # runs that stopped early; the error is `error`
+        await handle._finish(error)
+
+    async def _collect(self, handle: ExperimentHandle) -> None:
+        for next_done in asyncio.as_completed(handle._futures):
+            name, result = await next_done
+            await handle._add(result, name)
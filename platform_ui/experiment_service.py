@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
+from typing import Any, Callable
 
 from models.job import Job
 from schedulers.base import Scheduler
@@ -11,10 +13,15 @@ from schedulers.mlfq import MLFQScheduler
 from schedulers.priority_aging import PriorityAgingScheduler
 from schedulers.round_robin import RoundRobinScheduler
 from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
-from simulation.engine import SimulationEngine
+from simulation.cache import SimulationCache, simulation_key, workload_digest
+from simulation.engine import SimulationCancelled, SimulationEngine
 from simulation.metrics import SimulationMetrics, compute_metrics
 
 
+# Shared across reruns of the UI script so repeated clicks reuse earlier runs.
+RESULT_CACHE = SimulationCache(max_entries=64)
+
+
 @dataclass
 class PlatformRunResult:
     scheduler_name: str
@@ -33,19 +40,20 @@ def available_scheduler_names() -> list[str]:
     ]
 
 
-def build_scheduler(name: str, lottery_seed: int | None = None) -> Scheduler:
+def build_scheduler(name: str, lottery_seed: int | None = None, **params: Any) -> Scheduler:
+    """``params`` are passed to the scheduler's constructor (e.g. age_interval=3)."""
     if name == "Round Robin":
-        return RoundRobinScheduler()
+        return RoundRobinScheduler(**params)
     if name == "SJF":
-        return SJFScheduler()
+        return SJFScheduler(**params)
     if name == "SRTF":
-        return SRTFScheduler()
+        return SRTFScheduler(**params)
     if name == "Priority+Aging":
-        return PriorityAgingScheduler()
+        return PriorityAgingScheduler(**params)
     if name == "Lottery":
-        return LotteryScheduler(seed=lottery_seed)
+        return LotteryScheduler(**{"seed": lottery_seed, **params})
     if name == "MLFQ":
-        return MLFQScheduler()
+        return MLFQScheduler(**params)
     raise ValueError(f"Unknown scheduler: {name}")
 
 
@@ -55,24 +63,145 @@ def run_platform_experiment(
     quantum: int,
     starvation_threshold: int,
     lottery_seed: int,
+    cache: SimulationCache | None = RESULT_CACHE,
 ) -> list[PlatformRunResult]:
+    _check_inputs(jobs, scheduler_names)
+    digest = workload_digest(jobs) if cache is not None else ""
+    return [
+        run_platform_scheduler(
+            jobs, name, quantum, starvation_threshold, lottery_seed, cache, digest
+        )
+        for name in scheduler_names
+    ]
+
+
+def run_platform_scheduler(
+    jobs: list[Job],
+    scheduler_name: str,
+    quantum: int,
+    starvation_threshold: int,
+    lottery_seed: int,
+    cache: SimulationCache | None = RESULT_CACHE,
+    digest: str = "",
+    progress: Callable[[int, int], None] | None = None,
+    scheduler_params: dict[str, Any] | None = None,
+) -> PlatformRunResult:
+    """Run (or fetch from ``cache``) one scheduler; ``digest`` is workload_digest(jobs)."""
+    scheduler = build_scheduler(
+        scheduler_name, lottery_seed=lottery_seed, **(scheduler_params or {})
+    )
+    key = simulation_key(scheduler, quantum, digest) if cache is not None else None
+    completed_jobs = cache.get(key) if key else None
+    if completed_jobs is None:
+        engine = SimulationEngine(
+            scheduler=scheduler,
+            quantum=quantum,
+            progress=progress,
+            progress_interval=max(1, len(jobs) // 100),
+        )
+        completed_jobs = engine.run(jobs)
+        if key:
+            cache.put(key, completed_jobs)
+    metrics = compute_metrics(completed_jobs, starvation_threshold=starvation_threshold)
+    return PlatformRunResult(
+        scheduler_name=scheduler.name,
+        metrics=metrics,
+        completed_jobs=completed_jobs,
+    )
+
+
+def _check_inputs(jobs: list[Job], scheduler_names: list[str]) -> None:
     if not jobs:
         raise ValueError("Workload is empty")
     if not scheduler_names:
         raise ValueError("At least one scheduler must be selected")
 
-    results: list[PlatformRunResult] = []
-    for scheduler_name in scheduler_names:
-        scheduler = build_scheduler(scheduler_name, lottery_seed=lottery_seed)
-        engine = SimulationEngine(scheduler=scheduler, quantum=quantum)
-        completed_jobs = engine.run(jobs)
-        metrics = compute_metrics(completed_jobs, starvation_threshold=starvation_threshold)
-        results.append(
-            PlatformRunResult(
-                scheduler_name=scheduler.name,
-                metrics=metrics,
-                completed_jobs=completed_jobs,
-            )
-        )
 
-    return results
+class BackgroundExperiment:
+    """
+    run_platform_experiment on a daemon thread, observable while it runs.
+
+    Schedulers run one after another. snapshot() reports the fraction of
+    jobs each one has completed so far and the results of those that have
+    finished. cancel() stops the current simulation at its next progress
+    report (every 1% of the jobs) and skips the rest.
+    """
+
+    def __init__(
+        self,
+        jobs: list[Job],
+        scheduler_names: list[str],
+        quantum: int,
+        starvation_threshold: int,
+        lottery_seed: int,
+        cache: SimulationCache | None = RESULT_CACHE,
+    ) -> None:
+        _check_inputs(jobs, scheduler_names)
+        self.jobs = jobs
+        self.scheduler_names = list(scheduler_names)
+        self.quantum = quantum
+        self.starvation_threshold = starvation_threshold
+        self.lottery_seed = lottery_seed
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._progress = {name: 0.0 for name in self.scheduler_names}
+        self._results: list[PlatformRunResult] = []
+        self._error: str | None = None
+        self._thread = threading.Thread(target=self._run, name="platform-experiment", daemon=True)
+
+    def start(self) -> "BackgroundExperiment":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def snapshot(self) -> tuple[dict[str, float], list[PlatformRunResult], str | None]:
+        """Copies of (per-scheduler progress, finished results, error message)."""
+        with self._lock:
+            return dict(self._progress), list(self._results), self._error
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        total = len(self.jobs)
+        try:
+            digest = workload_digest(self.jobs) if self.cache is not None else ""
+            for name in self.scheduler_names:
+                if self._cancel.is_set():
+                    return
+
+                def report(current_time: int, completed: int, name: str = name) -> None:
+                    if self._cancel.is_set():
+                        raise SimulationCancelled
+                    with self._lock:
+                        self._progress[name] = completed / total
+
+                result = run_platform_scheduler(
+                    self.jobs,
+                    name,
+                    self.quantum,
+                    self.starvation_threshold,
+                    self.lottery_seed,
+                    self.cache,
+                    digest,
+                    progress=report,
+                )
+                with self._lock:
+                    self._progress[name] = 1.0
+                    self._results.append(result)
+        except SimulationCancelled:
+            pass
+        except Exception as err:  # surfaced to the UI instead of dying silently
+            with self._lock:
+                self._error = str(err)
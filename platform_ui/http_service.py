@@ -0,0 +1,534 @@
+"""Local HTTP/JSON simulation service.
+
+Run from the project root::
+
+    python -m platform_ui.http_service --port 8765 --workers 4
+
+Endpoints:
+
+    POST /simulate  run schedulers on a workload, return their metrics
+    GET  /stats     throughput, latency and batching counters
+    GET  /health    liveness check
+
+A /simulate body looks like::
+
+    {
+      "workload": {"path": "traces/day1.swl"},
+      "schedulers": ["SJF", {"name": "MLFQ", "params": {"boost_interval": 25}}],
+      "quantum": 4, "starvation_threshold": 100, "lottery_seed": 42
+    }
+
+``workload`` is either ``{"path": ...}`` (.swl, .csv, .jsonl or .json on
+the server's disk), ``{"jobs": [{...}, ...]}`` or ``{"format": "csv",
+"content": "..."}``; ``schedulers`` defaults to all of them. The server
+only binds to loopback addresses, since it reads any path it is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import ipaddress
+import json
+import os
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable
+
+from models.job import Job
+from schedulers.base import Scheduler
+from platform_ui.experiment_service import (
+    available_scheduler_names,
+    build_scheduler,
+    run_platform_scheduler,
+)
+from platform_ui.workload_io import _rows_to_jobs, parse_workload_text, parse_workload_upload
+from simulation.cache import simulation_key, workload_digest
+from simulation.metrics import SimulationMetrics
+from workloads.binary import SUFFIX as BINARY_SUFFIX, BinaryWorkload
+
+MAX_BODY_BYTES = 256 << 20
+REQUEST_TIMEOUT = 300.0  # seconds a request may wait for its load and simulations
+LATENCY_WINDOW = 1024  # most recent requests kept for latency percentiles
+
+
+COLUMNS = ("job_id", "arrival_time", "burst_time", "priority")
+
+
+@dataclass
+class LoadedWorkload:
+    """
+    A workload held as int64 columns in a shared memory block.
+
+    Pool tasks carry only ``digest`` and the block's name; a worker copies
+    the columns out on a cache miss. Rows keep their original order, since
+    that decides how same-time arrivals are admitted. The block is freed
+    when the LoadedWorkload is garbage collected.
+    """
+
+    digest: str
+    num_jobs: int
+    memory: SharedMemory  # the COLUMNS, one after another
+
+    @classmethod
+    def from_jobs(cls, jobs: list[Job]) -> "LoadedWorkload":
+        if not jobs:
+            raise ValueError("Workload is empty")
+        n = len(jobs)
+        memory = SharedMemory(create=True, size=len(COLUMNS) * n * 8)
+        try:
+            with memory.buf.cast("q") as flat:
+                for i, field in enumerate(COLUMNS):
+                    flat[i * n : (i + 1) * n] = array("q", map(attrgetter(field), jobs))
+        except BaseException:
+            _free(memory)
+            raise
+        workload = cls(digest=workload_digest(jobs), num_jobs=n, memory=memory)
+        weakref.finalize(workload, _free, memory)
+        return workload
+
+
+def _free(memory: SharedMemory) -> None:
+    memory.close()
+    memory.unlink()
+
+
+def _read_columns(name: str, num_jobs: int) -> list[Job]:
+    memory = SharedMemory(name=name)
+    try:
+        with memory.buf.cast("q") as flat:
+            columns = [
+                flat[i * num_jobs : (i + 1) * num_jobs].tolist() for i in range(len(COLUMNS))
+            ]
+    finally:
+        memory.close()
+    return [
+        Job(job_id=job_id, arrival_time=arrival, burst_time=burst, priority=priority)
+        for job_id, arrival, burst, priority in zip(*columns)
+    ]
+
+
+class _SingleFlight:
+    """
+    Collapses concurrent requests for the same key into one computation.
+
+    submit() returns the Future of the computation already in flight for
+    ``key`` if there is one, else starts it with ``start()``; the last
+    ``keep`` successful results are also remembered.
+    """
+
+    def __init__(self, keep: int) -> None:
+        self.keep = keep
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[Any, Future] = {}
+        self._done: OrderedDict[Any, Future] = OrderedDict()
+
+    def submit(self, key: Any, start: Callable[[], Future]) -> Future:
+        with self._lock:
+            existing = self._inflight.get(key) or self._done.get(key)
+            if existing is not None:
+                if key in self._done:
+                    self._done.move_to_end(key)
+                self.shared += 1
+                return existing
+            self.calls += 1
+            future = self._inflight[key] = Future()
+        future.add_done_callback(lambda f: self._settle(key, f))
+        try:
+            _chain(start(), future)
+        except BaseException as err:
+            future.set_exception(err)
+        return future
+
+    def _settle(self, key: Any, future: Future) -> None:
+        with self._lock:
+            del self._inflight[key]
+            if self.keep and not future.cancelled() and future.exception() is None:
+                self._done[key] = future
+                if len(self._done) > self.keep:
+                    self._done.popitem(last=False)
+
+
+def _chain(source: Future, target: Future) -> None:
+    def copy(done: Future) -> None:
+        if done.cancelled():
+            target.cancel()
+        elif done.exception() is not None:
+            target.set_exception(done.exception())
+        else:
+            target.set_result(done.result())
+
+    source.add_done_callback(copy)
+
+
+def _run_now(fn: Callable[[], Any]) -> Future:
+    future: Future = Future()
+    try:
+        future.set_result(fn())
+    except Exception as err:
+        future.set_exception(err)
+    return future
+
+
+class ServiceStats:
+    """Request counters and a sliding window of latencies; thread-safe."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.requests = 0
+        self.failed = 0
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._window: deque[tuple[float, float]] = deque(maxlen=LATENCY_WINDOW)
+
+    def begin(self) -> float:
+        with self._lock:
+            self.in_flight += 1
+        return time.monotonic()
+
+    def end(self, started: float, ok: bool) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.failed += not ok
+            self._window.append((now, now - started))
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            window = list(self._window)
+            counts = {
+                "requests": self.requests,
+                "failed": self.failed,
+                "in_flight": self.in_flight,
+            }
+        uptime = now - self.started
+        latencies = sorted(latency for _, latency in window)
+        span = now - min(end - latency for end, latency in window) if window else 0.0
+        return {
+            **counts,
+            "uptime_s": round(uptime, 3),
+            "throughput_rps": round(counts["requests"] / uptime, 3) if uptime else 0.0,
+            "recent_throughput_rps": round(len(window) / span, 3) if span else 0.0,
+            "latency_ms": {
+                name: round(_nearest_rank(latencies, p) * 1000, 3)
+                for name, p in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+            },
+        }
+
+
+def _nearest_rank(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * percentile // 100))
+    return values[int(rank) - 1]
+
+
+# Per-process state of the pool workers.
+_WORKER_JOBS: OrderedDict[str, list[Job]] = OrderedDict()
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _simulate(
+    digest: str,
+    memory_name: str,
+    num_jobs: int,
+    scheduler_name: str,
+    params: dict[str, Any],
+    quantum: int,
+    starvation_threshold: int,
+    lottery_seed: int,
+) -> SimulationMetrics:
+    jobs = _WORKER_JOBS.get(digest)
+    if jobs is None:
+        jobs = _WORKER_JOBS[digest] = _read_columns(memory_name, num_jobs)
+        if len(_WORKER_JOBS) > 2:
+            _WORKER_JOBS.popitem(last=False)
+    result = run_platform_scheduler(
+        jobs,
+        scheduler_name,
+        quantum,
+        starvation_threshold,
+        lottery_seed,
+        cache=None,
+        scheduler_params=params,
+    )
+    return result.metrics
+
+
+class SimulationService:
+    """
+    Loads workloads and runs simulations for the HTTP handler.
+
+    Simulations run on a process pool started (and warmed) up front. Requests
+    for the same workload share one load and requests for the same
+    (workload, scheduler config, quantum, threshold) share one simulation,
+    both while in flight and for a few recent results.
+    """
+
+    def __init__(self, workers: int | None = None, timeout: float = REQUEST_TIMEOUT) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        # Workers must share this process's tracker, or one of theirs would
+        # unlink the workloads' shared memory when that worker exits.
+        resource_tracker.ensure_running()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        for future in [self.pool.submit(_warm) for _ in range(self.workers)]:
+            future.result()
+        self.stats = ServiceStats()
+        self.loads = _SingleFlight(keep=4)
+        self.simulations = _SingleFlight(keep=256)
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+    def counters(self) -> dict[str, Any]:
+        return {
+            **self.stats.snapshot(),
+            "workers": self.workers,
+            "workload_loads": self.loads.calls,
+            "workload_loads_shared": self.loads.shared,
+            "simulations": self.simulations.calls,
+            "simulations_shared": self.simulations.shared,
+        }
+
+    def simulate(self, request: dict[str, Any]) -> dict[str, Any]:
+        quantum = _positive_int(request, "quantum", 4)
+        starvation_threshold = _positive_int(request, "starvation_threshold", 100)
+        lottery_seed = int(request.get("lottery_seed", 42))
+        # Every config is validated before anything is loaded or submitted.
+        configs = [
+            _scheduler_config(entry, lottery_seed)
+            for entry in request.get("schedulers") or available_scheduler_names()
+        ]
+        deadline = time.monotonic() + self.timeout
+        workload = self.load(request.get("workload"), deadline)
+
+        # Submit everything before waiting so one request's schedulers run in parallel.
+        pending = []
+        for name, params, scheduler in configs:
+            key = simulation_key(scheduler, quantum, workload.digest)
+            args = (
+                workload.digest,
+                workload.memory.name,
+                workload.num_jobs,
+                name,
+                params,
+                quantum,
+                starvation_threshold,
+                lottery_seed,
+            )
+            start = lambda args=args: _keep_alive(self.pool.submit(_simulate, *args), workload)
+            if key is None:  # not reproducible, so never shared
+                future = start()
+            else:
+                future = self.simulations.submit((key, starvation_threshold), start)
+            pending.append((scheduler.name, params, future))
+
+        return {
+            "workload": {"digest": workload.digest, "num_jobs": workload.num_jobs},
+            "results": [
+                {
+                    "scheduler": name,
+                    "params": params,
+                    "metrics": asdict(future.result(_remaining(deadline))),
+                }
+                for name, params, future in pending
+            ],
+        }
+
+    def load(self, spec: Any, deadline: float | None = None) -> LoadedWorkload:
+        if not isinstance(spec, dict):
+            raise ValueError("'workload' must be an object with 'path', 'jobs' or 'content'")
+        if "path" in spec:
+            path = Path(spec["path"]).expanduser().resolve()
+            stat = path.stat()  # FileNotFoundError -> 404
+            key = ("path", str(path), stat.st_mtime_ns, stat.st_size)
+            return self._load(key, lambda: _read_path(path), deadline)
+        if "jobs" in spec:
+            rows = spec["jobs"]
+            if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+                raise ValueError("'jobs' must be a list of objects")
+            read = lambda: _rows_to_jobs(rows)
+        elif "content" in spec:
+            fmt = str(spec.get("format", "csv"))
+            content = str(spec["content"])
+            read = lambda: parse_workload_text(content, fmt).jobs
+        else:
+            raise ValueError("'workload' must have one of 'path', 'jobs' or 'content'")
+        encoded = json.dumps(spec, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return self._load(("inline", hashlib.sha256(encoded).hexdigest()), read, deadline)
+
+    def _load(
+        self, key: Any, read: Callable[[], list[Job]], deadline: float | None
+    ) -> LoadedWorkload:
+        # The first request for ``key`` reads it on its own thread; the rest wait.
+        future = self.loads.submit(key, lambda: _run_now(lambda: LoadedWorkload.from_jobs(read())))
+        return future.result(None if deadline is None else _remaining(deadline))
+
+
+def _keep_alive(future: Future, workload: LoadedWorkload) -> Future:
+    # The task may outlive the request that submitted it (a timeout, or a
+    # shared simulation), so its shared memory block must too.
+    future.add_done_callback(lambda _: workload)
+    return future
+
+
+def _remaining(deadline: float) -> float:
+    return max(0.0, deadline - time.monotonic())
+
+
+def _read_path(path: Path) -> list[Job]:
+    if path.suffix.lower() == BINARY_SUFFIX:
+        with BinaryWorkload.open(str(path)) as workload:
+            return workload.to_jobs()
+    return parse_workload_upload(path.name, path.read_bytes()).jobs
+
+
+def _scheduler_config(entry: Any, lottery_seed: int) -> tuple[str, dict[str, Any], Scheduler]:
+    """
+    Parse one ``schedulers`` entry and build its scheduler.
+
+    The constructors reject out-of-range parameters (e.g. a zero quantum or
+    age_interval) with ValueError and unknown names with TypeError, so a bad
+    config is a 400 instead of a hung or crashed simulation.
+    """
+    if isinstance(entry, str):
+        name, params = entry, {}
+    elif isinstance(entry, dict) and isinstance(entry.get("name"), str):
+        name, params = entry["name"], entry.get("params") or {}
+        if not isinstance(params, dict):
+            raise ValueError("Scheduler 'params' must be an object")
+    else:
+        raise ValueError("Each scheduler must be a name or {\"name\": ..., \"params\": {...}}")
+    return name, params, build_scheduler(name, lottery_seed=lottery_seed, **params)
+
+
+def _positive_int(request: dict[str, Any], field: str, default: int) -> int:
+    value = request.get(field, default)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise ValueError(f"'{field}' must be an integer >= 1")
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "SimulationHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send(200, self.server.service.counters())
+        else:
+            self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/simulate":
+            self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+            return
+        service = self.server.service
+        started = service.stats.begin()
+        status, body = 200, None
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                status, body = 413, {"error": "Request body too large"}
+                self.close_connection = True  # the body was not read
+            else:
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("Request body must be a JSON object")
+                body = service.simulate(request)
+        except FileNotFoundError as err:
+            status, body = 404, {"error": f"Workload file not found: {err.filename}"}
+        except (TimeoutError, FutureTimeout):  # distinct classes before Python 3.11
+            status, body = 504, {"error": f"Request timed out after {service.timeout:g}s"}
+        except (ValueError, TypeError) as err:  # includes JSON and workload errors
+            status, body = 400, {"error": str(err)}
+        except Exception as err:
+            status, body = 500, {"error": f"{type(err).__name__}: {err}"}
+        service.stats.end(started, ok=status == 200)
+        body["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
+        self._send(status, body)
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SimulationHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int | None = None,
+        verbose: bool = False,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> None:
+        if not ipaddress.ip_address(host).is_loopback:
+            raise ValueError(f"Refusing to bind to non-loopback address {host}")
+        self.verbose = verbose
+        # Warm the pool before binding so the first request does not pay for it.
+        self.service = SimulationService(workers, timeout)
+        super().__init__((host, port), _Handler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON simulation service")
+    parser.add_argument("--host", default="127.0.0.1", help="Loopback address to bind")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Simulation processes (0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=REQUEST_TIMEOUT, help="Seconds before a request gets 504"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = SimulationHTTPServer(
+        args.host, args.port, args.workers or None, args.verbose, args.timeout
+    )
+    print(f"Serving on http://{args.host}:{server.server_port} ({server.service.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Iterator, Optional, Sequence, TextIO
 
 from models.job import Job
+from workloads.binary import BinaryWorkload
 
 
 @dataclass
@@ -18,50 +20,325 @@ class WorkloadParseResult:
 
 
 REQUIRED_COLUMNS = {"arrival_time", "burst_time"}
+OPTIONAL_COLUMNS = ("job_id", "priority")
+CHUNK_ROWS = 1 << 14
+MAX_ERRORS = 100
+
+
+class WorkloadValidationError(ValueError):
+    """Row-level problems in a workload; ``errors`` holds each message in row order.
+
+    The exception text is the first message, followed by a count of the rest.
+    """
+
+    def __init__(self, errors: list[str], truncated: bool = False) -> None:
+        self.errors = errors
+        self.truncated = truncated
+        message = errors[0]
+        if len(errors) > 1:
+            more = f"{len(errors) - 1}{'+' if truncated else ''}"
+            message += f" (and {more} more row errors)"
+        super().__init__(message)
 
 
 def parse_workload_text(content: str, fmt: str) -> WorkloadParseResult:
-    """Parse workload data from text in CSV or JSON format."""
+    """Parse workload data from text in CSV, JSON or JSON Lines format."""
     fmt = fmt.lower().strip()
-    if fmt == "csv":
-        rows = _parse_csv_rows(content)
+    if fmt in {"csv", "jsonl"}:
+        jobs = list(iter_workload_jobs(io.StringIO(content), fmt, require_sorted=False))
+        jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
     elif fmt == "json":
-        rows = _parse_json_rows(content)
+        jobs = _rows_to_jobs(_parse_json_rows(content))
     else:
         raise ValueError(f"Unsupported format: {fmt}")
 
-    jobs = _rows_to_jobs(rows)
     return WorkloadParseResult(jobs=jobs, source_summary=f"{len(jobs)} jobs from {fmt.upper()}")
 
 
 def parse_workload_upload(filename: str, payload: bytes) -> WorkloadParseResult:
     """Parse uploaded workload file based on extension."""
     suffix = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
-    if suffix not in {"csv", "json"}:
-        raise ValueError("Upload must be a .csv or .json file")
+    if suffix == "swl":
+        workload = BinaryWorkload.from_bytes(payload)
+        jobs = workload.to_jobs()
+        return WorkloadParseResult(jobs=jobs, source_summary=f"{len(jobs)} jobs from SWL")
+    if suffix not in {"csv", "json", "jsonl"}:
+        raise ValueError("Upload must be a .csv, .json, .jsonl or .swl file")
 
     text = payload.decode("utf-8")
     return parse_workload_text(text, suffix)
 
 
-def _parse_csv_rows(content: str) -> list[dict[str, Any]]:
-    reader = csv.DictReader(io.StringIO(content))
-    if not reader.fieldnames:
+def iter_workload_jobs(
+    source: str | TextIO,
+    fmt: str,
+    chunk_rows: int = CHUNK_ROWS,
+    max_errors: int = MAX_ERRORS,
+    require_sorted: bool = True,
+) -> Iterator[Job]:
+    """
+    Stream Jobs from a CSV or JSON Lines file (path or text stream).
+
+    Rows are read ``chunk_rows`` at a time and each chunk is validated as a
+    whole before its jobs are yielded, so the result can be passed straight to
+    SimulationEngine.run_stream(). Row errors use the same messages as
+    parse_workload_text(); they are collected (up to ``max_errors``) and
+    raised together as WorkloadValidationError, and no jobs are yielded after
+    the first one. With ``require_sorted`` rows must be in arrival order.
+    """
+    fmt = fmt.lower().strip()
+    if fmt not in {"csv", "jsonl"}:
+        raise ValueError(f"Unsupported streaming format: {fmt}")
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as f:
+            yield from iter_workload_jobs(f, fmt, chunk_rows, max_errors, require_sorted)
+        return
+
+    builder = _JobBuilder(max_errors, require_sorted)
+    chunks = _csv_chunks(source, chunk_rows) if fmt == "csv" else _jsonl_chunks(source, chunk_rows)
+    for columns, row_at, size in chunks:
+        jobs = builder.add_chunk(columns, row_at, size)
+        if not builder.errors:
+            yield from jobs
+    if builder.errors:
+        raise WorkloadValidationError(builder.errors)
+    if not builder.rows:
+        raise ValueError("CSV has a header but no rows" if fmt == "csv" else "JSONL has no rows")
+
+
+_Chunk = tuple[dict[str, Optional[Sequence[Any]]], Callable[[int], dict[str, Any]], int]
+
+
+def _csv_chunks(stream: TextIO, chunk_rows: int) -> Iterator[_Chunk]:
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if not header:
         raise ValueError("CSV appears to be empty")
 
-    columns = {c.strip() for c in reader.fieldnames if c is not None}
-    missing = REQUIRED_COLUMNS - columns
+    index = {name.strip(): i for i, name in enumerate(header)}  # last duplicate wins
+    missing = REQUIRED_COLUMNS - index.keys()
     if missing:
         raise ValueError(
             "CSV is missing required columns: " + ", ".join(sorted(missing))
         )
+    names = [name for name in (*sorted(REQUIRED_COLUMNS), *OPTIONAL_COLUMNS) if name in index]
+    width = len(header)
+
+    while True:
+        # csv.DictReader skips blank lines; so do we, so row numbers agree.
+        rows = [row for row in itertools.islice(reader, chunk_rows) if row]
+        if not rows:
+            return
+        if all(len(row) == width for row in rows):
+            transposed = list(zip(*rows))
+            columns = {name: transposed[index[name]] for name in names}
+        else:
+            columns = {
+                name: [row[index[name]] if index[name] < len(row) else None for row in rows]
+                for name in names
+            }
+
+        def row_at(i: int, rows: list[list[str]] = rows) -> dict[str, Any]:
+            row = rows[i]
+            return {name: (row[index[name]] if index[name] < len(row) else None) for name in names}
+
+        yield columns, row_at, len(rows)
+
+
+def _jsonl_chunks(stream: TextIO, chunk_rows: int) -> Iterator[_Chunk]:
+    row_idx = 0
+    lines = (line for line in stream if line.strip())
+    while True:
+        block = list(itertools.islice(lines, chunk_rows))
+        if not block:
+            return
+        rows: list[dict[str, Any]] = []
+        for line in block:
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as err:
+                item = _RowError(f"Invalid JSON in row {row_idx + 1}: {err.msg}")
+            if not isinstance(item, (dict, _RowError)):
+                item = _RowError(f"JSON entry {row_idx} must be an object")
+            rows.append(item)
+            row_idx += 1
+        yield _dict_columns(rows), rows.__getitem__, len(rows)
+
+
+def _dict_columns(rows: list[dict[str, Any]]) -> dict[str, Optional[list[Any]]]:
+    """Column lists from dict rows; an optional field no row has maps to None."""
+    columns: dict[str, Optional[list[Any]]] = {
+        name: [row.get(name) for row in rows] for name in sorted(REQUIRED_COLUMNS)
+    }
+    for name in OPTIONAL_COLUMNS:
+        present = any(name in row for row in rows)
+        columns[name] = [row.get(name) for row in rows] if present else None
+    return columns
+
+
+class _RowError(dict):
+    """Placeholder row that failed to parse; validation reports ``message``."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__()
+        self.message = message
+
+
+class _JobIdSet:
+    """Seen job ids: one bit per id in a bitmap over dense ids, a set for the rest.
+
+    The bitmap only grows to ``_BITS_PER_ID`` bits per id seen (and never past
+    ``bitmap_limit``), so a few huge ids cannot make it allocate megabytes;
+    ids beyond its reach go to ``overflow``. Dense ids therefore cost a bit
+    each rather than a Python object.
+    """
+
+    def __init__(self, bitmap_limit: int = 1 << 28) -> None:
+        self.bitmap_limit = bitmap_limit
+        self.bits = bytearray()
+        self.overflow: set[int] = set()
+        self.count = 0
+
+    def add(self, job_id: int) -> bool:
+        """Record ``job_id``; False if it was already present."""
+        bits = self.bits
+        if job_id >= len(bits) << 3 and not self._grow(job_id):
+            if job_id in self.overflow:
+                return False
+            self.overflow.add(job_id)
+            self.count += 1
+            return True
+        byte, bit = job_id >> 3, 1 << (job_id & 7)
+        if bits[byte] & bit:
+            return False
+        bits[byte] |= bit
+        self.count += 1
+        return True
+
+    def _grow(self, job_id: int) -> bool:
+        """Extend the bitmap to cover ``job_id`` if ids are dense enough."""
+        limit = min(self.bitmap_limit, max(_MIN_BITMAP_BITS, self.count * _BITS_PER_ID))
+        if job_id >= limit:
+            return False
+        bits = self.bits
+        size = min(max((job_id >> 3) + 1, 2 * len(bits)), -(-limit // 8))
+        bits.extend(bytes(size - len(bits)))
+        covered = [i for i in self.overflow if i < size << 3]
+        for i in covered:
+            self.overflow.discard(i)
+            bits[i >> 3] |= 1 << (i & 7)
+        return True
+
+
+_BITS_PER_ID = 64
+_MIN_BITMAP_BITS = 1 << 16
+
+
+def _bulk_ints(values: Sequence[Any]) -> list[int]:
+    # Same results as _read_int for ints and clean numeric strings; anything
+    # else raises and sends the chunk to the row-by-row path.
+    return [v if type(v) is int else int(v.strip()) for v in values]
+
+
+class _JobBuilder:
+    """Validates chunks of rows and turns them into Jobs, accumulating row errors."""
+
+    def __init__(self, max_errors: int, require_sorted: bool) -> None:
+        self.max_errors = max_errors
+        self.require_sorted = require_sorted
+        self.rows = 0
+        self.errors: list[str] = []
+        self.job_ids = _JobIdSet()
+        self.last_arrival = 0
+
+    def _error(self, message: str) -> None:
+        self.errors.append(message)
+        if len(self.errors) >= self.max_errors:
+            raise WorkloadValidationError(self.errors, truncated=True)
+
+    def add_chunk(
+        self,
+        columns: dict[str, Optional[Sequence[Any]]],
+        row_at: Callable[[int], dict[str, Any]],
+        size: int,
+    ) -> list[Job]:
+        start = self.rows
+        self.rows += size
+        try:
+            arrivals = _bulk_ints(columns["arrival_time"])
+            bursts = _bulk_ints(columns["burst_time"])
+            id_column = columns.get("job_id")
+            job_ids = _bulk_ints(id_column) if id_column is not None else range(start, self.rows)
+            priority_column = columns.get("priority")
+            priorities = (
+                _bulk_ints(priority_column) if priority_column is not None else [0] * size
+            )
+        except (ValueError, TypeError, AttributeError):
+            return self._add_rows(row_at, start, size)
+        if min(arrivals) < 0 or min(bursts) < 1 or (id_column is not None and min(job_ids) < 0):
+            return self._add_rows(row_at, start, size)
+
+        jobs: list[Job] = []
+        add_id = self.job_ids.add
+        for i, (job_id, arrival, burst, priority) in enumerate(
+            zip(job_ids, arrivals, bursts, priorities)
+        ):
+            if not add_id(job_id):
+                self._error(f"Duplicate job_id={job_id} at row {start + i + 1}")
+                continue
+            if self.require_sorted and arrival < self.last_arrival:
+                self._error(self._order_message(start + i, arrival))
+                continue
+            self.last_arrival = arrival
+            jobs.append(Job(job_id=job_id, arrival_time=arrival, burst_time=burst, priority=priority))
+        return jobs
+
+    def _add_rows(self, row_at: Callable[[int], dict[str, Any]], start: int, size: int) -> list[Job]:
+        """Row-by-row validation with the original per-field checks and messages."""
+        jobs: list[Job] = []
+        for i in range(size):
+            idx = start + i
+            row = row_at(i)
+            if isinstance(row, _RowError):
+                self._error(row.message)
+                continue
+            try:
+                job = self._row_to_job(row, idx)
+            except ValueError as err:
+                self._error(str(err))
+                continue
+            jobs.append(job)
+        return jobs
+
+    def _row_to_job(self, row: dict[str, Any], idx: int) -> Job:
+        arrival = _read_int(row, "arrival_time", idx, minimum=0)
+        burst = _read_int(row, "burst_time", idx, minimum=1)
 
-    rows: list[dict[str, Any]] = []
-    for row in reader:
-        rows.append({(k.strip() if k else ""): (v.strip() if isinstance(v, str) else v) for k, v in row.items()})
-    if not rows:
-        raise ValueError("CSV has a header but no rows")
-    return rows
+        has_job_id = "job_id" in row and str(row["job_id"]).strip() != ""
+        if has_job_id:
+            job_id = _read_int(row, "job_id", idx, minimum=0)
+        else:
+            job_id = idx
+
+        if not self.job_ids.add(job_id):
+            raise ValueError(f"Duplicate job_id={job_id} at row {idx + 1}")
+
+        if "priority" in row and str(row["priority"]).strip() != "":
+            priority = _read_int(row, "priority", idx)
+        else:
+            priority = 0
+
+        if self.require_sorted:
+            if arrival < self.last_arrival:
+                raise ValueError(self._order_message(idx, arrival))
+            self.last_arrival = arrival
+        return Job(job_id=job_id, arrival_time=arrival, burst_time=burst, priority=priority)
+
+    def _order_message(self, idx: int, arrival: int) -> str:
+        return (
+            f"'arrival_time' in row {idx + 1} must be >= {self.last_arrival} "
+            "(rows must be ordered by arrival_time)"
+        )
 
 
 def _parse_json_rows(content: str) -> list[dict[str, Any]]:
@@ -89,36 +366,13 @@ def _parse_json_rows(content: str) -> list[dict[str, Any]]:
 
 
 def _rows_to_jobs(rows: list[dict[str, Any]]) -> list[Job]:
+    builder = _JobBuilder(MAX_ERRORS, require_sorted=False)
     jobs: list[Job] = []
-    used_job_ids: set[int] = set()
-
-    for idx, row in enumerate(rows):
-        arrival = _read_int(row, "arrival_time", idx, minimum=0)
-        burst = _read_int(row, "burst_time", idx, minimum=1)
-
-        has_job_id = "job_id" in row and str(row["job_id"]).strip() != ""
-        if has_job_id:
-            job_id = _read_int(row, "job_id", idx, minimum=0)
-        else:
-            job_id = idx
-
-        if job_id in used_job_ids:
-            raise ValueError(f"Duplicate job_id={job_id} at row {idx + 1}")
-        used_job_ids.add(job_id)
-
-        if "priority" in row and str(row["priority"]).strip() != "":
-            priority = _read_int(row, "priority", idx)
-        else:
-            priority = 0
-
-        jobs.append(
-            Job(
-                job_id=job_id,
-                arrival_time=arrival,
-                burst_time=burst,
-                priority=priority,
-            )
-        )
+    for start in range(0, len(rows), CHUNK_ROWS):
+        chunk = rows[start : start + CHUNK_ROWS]
+        jobs.extend(builder.add_chunk(_dict_columns(chunk), chunk.__getitem__, len(chunk)))
+    if builder.errors:
+        raise WorkloadValidationError(builder.errors)
 
     jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
     return jobs
@@ -0,0 +1,140 @@
+"""Min-heap whose entries can be looked up, re-keyed or removed by job_id."""
+
+import heapq
+from typing import Any, Dict, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class AddressableHeap(Generic[T]):
+    """
+    Min-heap of ``(key, job_id, item)`` entries with a job_id index.
+
+    Entries are ordered by ``key`` and then ``job_id``, the same order as
+    ``(key, job_id, job)`` tuples in a plain ``heapq`` list. Job ids need not
+    be unique: pushing a queued job_id again adds a second entry (equal keys
+    then pop in push order). The methods that take a job_id address the most
+    recently pushed entry for it; earlier duplicates can only be popped.
+
+    The heap itself is a plain ``heapq`` list of tuples so sifting stays in C.
+    remove() and update() just replace or drop the job's live entry; entries no
+    longer live are discarded whenever they reach the top, and the list
+    is rebuilt once they outnumber live ones. push, pop, update (decrease or
+    increase key) and remove are therefore amortized O(log n), and peek is O(1)
+    because the top entry is always live.
+    """
+
+    def __init__(self) -> None:
+        # (key, job_id, seq, item); seq is unique per push, so items are never
+        # compared and an entry is live exactly while its seq is in _entries.
+        self._heap: List[Tuple[Any, int, int, T]] = []
+        self._entries: Dict[int, Tuple[Any, int, int, T]] = {}  # seq -> live entry
+        self._index: Dict[int, Tuple[Any, int, int, T]] = {}  # job_id -> newest live entry
+        self._seq = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __contains__(self, job_id: int) -> bool:
+        return job_id in self._index
+
+    def push(self, job_id: int, key: Any, item: T) -> None:
+        seq = self._seq
+        entry = (key, job_id, seq, item)
+        self._seq = seq + 1
+        self._entries[seq] = entry
+        self._index[job_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def peek(self) -> Tuple[Any, int, T]:
+        """Smallest ``(key, job_id, item)`` without removing it."""
+        if not self._entries:
+            raise IndexError("peek from an empty heap")
+        key, job_id, _, item = self._heap[0]
+        return key, job_id, item
+
+    def pop(self) -> Tuple[Any, int, T]:
+        """Remove and return the smallest ``(key, job_id, item)``."""
+        if not self._entries:
+            raise IndexError("pop from an empty heap")
+        entry = heapq.heappop(self._heap)
+        key, job_id, seq, item = entry
+        del self._entries[seq]
+        if self._index.get(job_id) is entry:
+            del self._index[job_id]
+        if self._stale:
+            self._discard_stale_top()
+        return key, job_id, item
+
+    def items(self) -> List[T]:
+        """Queued items, in no particular order."""
+        return [entry[3] for entry in self._entries.values()]
+
+    def key(self, job_id: int) -> Any:
+        return self._index[job_id][0]
+
+    def remove(self, job_id: int) -> T:
+        """Remove a queued job and return its item."""
+        entry = self._index.pop(job_id)
+        self._invalidate(entry)
+        return entry[3]
+
+    def discard(self, job_id: int) -> None:
+        """Remove the job if it is queued."""
+        entry = self._index.pop(job_id, None)
+        if entry is not None:
+            self._invalidate(entry)
+
+    def update(self, job_id: int, key: Any) -> None:
+        """Change the key of a queued job (either direction)."""
+        self.set_key(job_id, key, self._index[job_id][3])
+
+    def set_key(self, job_id: int, key: Any, item: T) -> None:
+        """Push the job, or change its key if it is already queued (item must be unchanged)."""
+        entries = self._entries
+        entry = self._index.get(job_id)
+        if entry is not None and key == entry[0]:
+            return
+        seq = self._seq
+        fresh = (key, job_id, seq, item)
+        self._seq = seq + 1
+        entries[seq] = fresh
+        self._index[job_id] = fresh
+        heap = self._heap
+        if entry is None:
+            heapq.heappush(heap, fresh)
+        elif heap[0] is entry:
+            # Re-keying the top entry (the common aging-promotion case) is one sift.
+            del entries[entry[2]]
+            heapq.heapreplace(heap, fresh)
+            if self._stale:
+                self._discard_stale_top()
+        else:
+            del entries[entry[2]]
+            heapq.heappush(heap, fresh)
+            self._stale += 1
+            if self._stale > len(entries) + 64:
+                self._rebuild()
+
+    def _invalidate(self, entry: Tuple[Any, int, int, T]) -> None:
+        del self._entries[entry[2]]
+        self._stale += 1
+        if self._heap[0] is entry:
+            self._discard_stale_top()
+        elif self._stale > len(self._entries) + 64:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def _discard_stale_top(self) -> None:
+        heap, entries = self._heap, self._entries
+        while heap and heap[0][2] not in entries:
+            heapq.heappop(heap)
+            self._stale -= 1
@@ -1,7 +1,7 @@
 """Abstract base scheduler interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
 
@@ -11,6 +11,10 @@ class Scheduler(ABC):
 
     name: str = "Base"
 
+    # Set to True when re-dispatching a lone job at a quantum boundary leaves the
+    # scheduler in a state that coalesce_quanta() can reproduce in one step.
+    supports_quantum_coalescing: bool = False
+
     @abstractmethod
     def add_job(self, job: Job, current_time: int) -> None:
         """Add a ready job to the scheduler's queue."""
@@ -26,6 +30,49 @@ class Scheduler(ABC):
         """Return True if there are jobs ready to run."""
         pass
 
+    def get_config(self) -> Optional[dict[str, Any]]:
+        """Constructor parameters that determine this scheduler's decisions.
+
+        Used to key cached results. The default, None, keeps results of
+        schedulers that do not declare their parameters out of the cache;
+        override it to return the parameters (``{}`` if there are none).
+        """
+        return None
+
+    def reconfigure(self, current_time: int, **params: Any) -> None:
+        """Change constructor parameters of a scheduler that may already hold jobs.
+
+        Used by SimulationSnapshot.fork(). Overrides pop the parameters they
+        support, pass the rest here (which rejects them), then rebuild the
+        state derived from them as of ``current_time``.
+        """
+        if params:
+            raise ValueError(
+                f"{self.name} cannot change {', '.join(sorted(params))} mid-run"
+            )
+
     def on_job_preempted(self, job: Job, current_time: int) -> None:
         """Called when a job is preempted (e.g., quantum expired). Override if needed."""
         self.add_job(job, current_time)
+
+    def on_job_completed(self, job: Job, current_time: int) -> None:
+        """Called when a job finishes. Override to release any per-job state."""
+        pass
+
+    def coalesce_quanta(self, job: Job, run_start: int, quantum: int, horizon: int) -> int:
+        """Fast-forward a job that is running with no competitor ready.
+
+        Skips every quantum boundary strictly before ``horizon`` as if the job had
+        been preempted and immediately re-dispatched at each one, and returns the
+        start time of the final slice. Only called when supports_quantum_coalescing
+        is set; the default assumes a fixed ``quantum`` and no per-job state.
+        """
+        skipped = (horizon - run_start - 1) // quantum
+        return run_start + max(0, skipped) * quantum
+
+
+def check_int(name: str, value: Any, minimum: int = 1) -> int:
+    """Return ``value`` if it is an int >= ``minimum``, else raise ValueError naming it."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise ValueError(f"{name} must be an integer >= {minimum}, got {value!r}")
+    return value
@@ -1,37 +1,130 @@
 """Lottery Scheduling - CPU time allocated probabilistically via tickets."""
 
 import random
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
 from .base import Scheduler
 
 
+class _TicketIndex:
+    """Fenwick tree over ticket weights, kept in ready-queue (insertion) order.
+
+    Each enqueued job takes the next free slot; removal zeroes its weight and
+    leaves a hole. Slots are compacted when they run out, so add, draw and
+    remove are O(log n) amortized while prefix sums follow queue order.
+    """
+
+    _MIN_CAPACITY = 16
+
+    def __init__(self) -> None:
+        self._reset(self._MIN_CAPACITY)
+
+    def _reset(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.tree: list[int] = [0] * (capacity + 1)  # 1-based Fenwick array
+        self.jobs: list[Optional[Job]] = [None] * capacity
+        self.weights: list[int] = [0] * capacity
+        self.next_slot = 0
+        self.size = 0
+        self.total = 0
+        self._top_bit = 1 << (capacity.bit_length() - 1)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, job: Job, weight: int) -> None:
+        if self.next_slot == self.capacity:
+            self._compact()
+        slot = self.next_slot
+        self.next_slot += 1
+        self.jobs[slot] = job
+        self.weights[slot] = weight
+        self.size += 1
+        self.total += weight
+        i = slot + 1
+        tree = self.tree
+        while i <= self.capacity:
+            tree[i] += weight
+            i += i & -i
+
+    def pop_winner(self, ticket: int) -> Job:
+        """Remove and return the first job whose cumulative tickets reach ``ticket``."""
+        tree = self.tree
+        pos = 0
+        remaining = ticket
+        step = self._top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.capacity and tree[nxt] < remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return self._remove(pos)
+
+    def _remove(self, slot: int) -> Job:
+        job = self.jobs[slot]
+        weight = self.weights[slot]
+        self.jobs[slot] = None
+        self.weights[slot] = 0
+        self.size -= 1
+        self.total -= weight
+        i = slot + 1
+        tree = self.tree
+        while i <= self.capacity:
+            tree[i] -= weight
+            i += i & -i
+        return job
+
+    def _compact(self) -> None:
+        """Drop holes and rebuild the tree in O(n), growing when mostly full."""
+        live = [(j, w) for j, w in zip(self.jobs, self.weights) if j is not None]
+        self._reset(max(self._MIN_CAPACITY, 2 * len(live)))
+        tree = self.tree
+        for slot, (job, weight) in enumerate(live):
+            self.jobs[slot] = job
+            self.weights[slot] = weight
+            tree[slot + 1] = weight
+        for i in range(1, self.capacity + 1):
+            parent = i + (i & -i)
+            if parent <= self.capacity:
+                tree[parent] += tree[i]
+        self.next_slot = len(live)
+        self.size = len(live)
+        self.total = sum(w for _, w in live)
+
+
 class LotteryScheduler(Scheduler):
     """Probabilistic scheduling based on tickets. Jobs get tickets = 1 + priority."""
 
     name = "Lottery"
 
     def __init__(self, seed: Optional[int] = None) -> None:
-        self.ready_queue: list[Job] = []
+        self.seed = seed
+        self.ready_queue = _TicketIndex()
         self.rng = random.Random(seed)
 
     def add_job(self, job: Job, current_time: int) -> None:
-        self.ready_queue.append(job)
+        self.ready_queue.add(job, max(1, job.priority + 1))
 
     def get_next_job(self, current_time: int) -> Optional[Job]:
         if not self.ready_queue:
             return None
-        total_tickets = sum(max(1, j.priority + 1) for j in self.ready_queue)
-        if total_tickets <= 0:
-            return self.ready_queue.pop(0)
-        r = self.rng.randint(1, total_tickets)
-        acc = 0
-        for i, j in enumerate(self.ready_queue):
-            acc += max(1, j.priority + 1)
-            if r <= acc:
-                return self.ready_queue.pop(i)
-        return self.ready_queue.pop(-1)
+        # Every job holds at least one ticket, so the total is positive here.
+        r = self.rng.randint(1, self.ready_queue.total)
+        return self.ready_queue.pop_winner(r)
+
+    def reconfigure(self, current_time: int, **params: Any) -> None:
+        reseed = "seed" in params
+        seed = params.pop("seed", None)
+        super().reconfigure(current_time, **params)
+        if reseed:
+            self.seed = seed
+            self.rng = random.Random(seed)
+
+    def get_config(self) -> Optional[dict[str, Any]]:
+        # An unseeded draw sequence differs on every run.
+        return None if self.seed is None else {"seed": self.seed}
 
     def has_ready_jobs(self) -> bool:
         return len(self.ready_queue) > 0
@@ -1,16 +1,17 @@
 """Multi-Level Feedback Queue scheduler."""
 
 from collections import deque
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
-from .base import Scheduler
+from .base import Scheduler, check_int
 
 
 class MLFQScheduler(Scheduler):
     """Multiple queues with dynamic priority. Top queue = highest priority."""
 
     name = "MLFQ"
+    supports_quantum_coalescing = True
 
     def __init__(
         self,
@@ -18,52 +19,169 @@ class MLFQScheduler(Scheduler):
         quanta: Optional[list[int]] = None,
         boost_interval: int = 50,
     ) -> None:
-        self.num_queues = num_queues
-        self.quanta = quanta or [1, 2, 4]  # quantum per level
-        self.boost_interval = boost_interval  # Rule 5: periodic priority boost
-        while len(self.quanta) < num_queues:
-            self.quanta.append(self.quanta[-1] * 2)
+        self.num_queues = check_int("num_queues", num_queues)
+        self.quanta = _check_quanta(quanta or [1, 2, 4], num_queues)  # quantum per level
+        # Rule 5: periodic priority boost
+        self.boost_interval = check_int("boost_interval", boost_interval)
         self.queues: list[deque[Job]] = [deque() for _ in range(num_queues)]
+        # Rule 5 is applied lazily: a boost splices the lower queues onto the end of
+        # queue 0 as whole segments and bumps boost_epoch. Segments in
+        # boosted_segments run before queues[0], which receives new appends.
+        self.boosted_segments: deque[deque[Job]] = deque()
+        self.boost_epoch: int = 0
+        self.level_counts: list[int] = [0] * num_queues
+        self.nonempty_mask: int = 0  # bit i set when level i has ready jobs
         self.job_level: dict[int, int] = {}  # job_id -> queue level
+        self.job_epoch: dict[int, int] = {}  # job_id -> boost_epoch when job_level was set
         self.job_used: dict[int, int] = {}  # job_id -> time used in current level
         self.last_boost_time: int = 0
 
-    def add_job(self, job: Job, current_time: int) -> None:
-        self.job_level[job.job_id] = 0
+    def reconfigure(self, current_time: int, **params: Any) -> None:
+        num_queues = check_int("num_queues", params.pop("num_queues", self.num_queues))
+        quanta = _check_quanta(params.pop("quanta", self.quanta), num_queues)
+        boost_interval = check_int(
+            "boost_interval", params.pop("boost_interval", self.boost_interval)
+        )
+        super().reconfigure(current_time, **params)
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        if num_queues > self.num_queues:
+            extra = num_queues - self.num_queues
+            self.queues.extend(deque() for _ in range(extra))
+            self.level_counts.extend([0] * extra)
+        elif num_queues < self.num_queues:
+            # Levels below the new bottom join it, in level order.
+            bottom = num_queues - 1
+            for level in range(num_queues, self.num_queues):
+                self.queues[bottom].extend(self.queues[level])
+                self.level_counts[bottom] += self.level_counts[level]
+            del self.queues[num_queues:]
+            del self.level_counts[num_queues:]
+            for job_id, level in self.job_level.items():
+                if level > bottom:
+                    self.job_level[job_id] = bottom
+            self.nonempty_mask = sum(1 << lv for lv, n in enumerate(self.level_counts) if n)
+        self.num_queues = num_queues
+
+    def _level_of(self, job_id: int) -> int:
+        """Current level; any boost since the level was recorded resets it to 0."""
+        if self.job_epoch.get(job_id) != self.boost_epoch:
+            return 0
+        return self.job_level.get(job_id, 0)
+
+    def _enqueue(self, job: Job, level: int) -> None:
+        self.job_level[job.job_id] = level
+        self.job_epoch[job.job_id] = self.boost_epoch
         self.job_used[job.job_id] = 0
-        self.queues[0].append(job)
+        self.queues[level].append(job)
+        self.level_counts[level] += 1
+        self.nonempty_mask |= 1 << level
+
+    def add_job(self, job: Job, current_time: int) -> None:
+        self._enqueue(job, 0)
 
     def _maybe_boost(self, current_time: int) -> None:
         """periodically move all jobs back to the topmost queue."""
         if current_time - self.last_boost_time >= self.boost_interval:
             self.last_boost_time = current_time
-            for level in range(1, self.num_queues):
-                while self.queues[level]:
-                    job = self.queues[level].popleft()
-                    self.job_level[job.job_id] = 0
-                    self.job_used[job.job_id] = 0
-                    self.queues[0].append(job)
+            if self.nonempty_mask & ~1:
+                # O(num_queues): relink the queues instead of moving their jobs.
+                self.boosted_segments.append(self.queues[0])
+                for level in range(1, self.num_queues):
+                    if self.queues[level]:
+                        self.boosted_segments.append(self.queues[level])
+                self.queues = [deque() for _ in range(self.num_queues)]
+                self.level_counts = [sum(self.level_counts)] + [0] * (self.num_queues - 1)
+                self.nonempty_mask = 1
+                self.boost_epoch += 1
 
     def get_next_job(self, current_time: int) -> Optional[Job]:
         self._maybe_boost(current_time)
-        for q in self.queues:
-            if q:
-                return q.popleft()
-        return None
+        mask = self.nonempty_mask
+        if not mask:
+            return None
+        level = (mask & -mask).bit_length() - 1
+        if level == 0:
+            segments = self.boosted_segments
+            while segments and not segments[0]:
+                segments.popleft()
+            job = segments[0].popleft() if segments else self.queues[0].popleft()
+        else:
+            job = self.queues[level].popleft()
+        self.level_counts[level] -= 1
+        if not self.level_counts[level]:
+            self.nonempty_mask &= ~(1 << level)
+        return job
+
+    def get_config(self) -> Optional[dict[str, Any]]:
+        return {
+            "num_queues": self.num_queues,
+            "quanta": list(self.quanta),
+            "boost_interval": self.boost_interval,
+        }
 
     def has_ready_jobs(self) -> bool:
-        return any(q for q in self.queues)
+        return self.nonempty_mask != 0
 
     def get_quantum(self, job: Job) -> int:
         """Return the time slice for this job based on its current MLFQ level."""
-        level = self.job_level.get(job.job_id, 0)
+        level = self._level_of(job.job_id)
         return self.quanta[min(level, len(self.quanta) - 1)]
 
+    def coalesce_quanta(self, job: Job, run_start: int, quantum: int, horizon: int) -> int:
+        # Replay the demote-then-maybe-boost sequence a lone job goes through at
+        # each boundary. Once at the bottom level the quantum is constant, so the
+        # stretch up to the next boost (or the horizon) is skipped arithmetically.
+        level = self._level_of(job.job_id)
+        bottom = self.num_queues - 1
+        t = run_start
+        level_zero_since: Optional[int] = None
+        while True:
+            q = self.quanta[min(level, len(self.quanta) - 1)]
+            if t + q >= horizon:
+                break
+            if level == bottom:
+                last = (horizon - 1 - t) // q  # boundaries t + i*q < horizon
+                until_boost = self.last_boost_time + self.boost_interval - t
+                steps = max(1, -(-until_boost // q))  # first boundary that boosts
+                if steps > last:
+                    t += last * q
+                    break
+                t += steps * q
+            else:
+                t += q
+                level += 1
+            if t - self.last_boost_time >= self.boost_interval:
+                if level_zero_since is not None:
+                    # Boost-to-boost cycles repeat exactly; skip the whole ones.
+                    period = t - level_zero_since
+                    t += (horizon - 1 - t) // period * period
+                self.last_boost_time = t
+                level = 0
+                level_zero_since = t
+        self.job_level[job.job_id] = level
+        self.job_epoch[job.job_id] = self.boost_epoch
+        self.job_used[job.job_id] = 0
+        return t
+
+    def on_job_completed(self, job: Job, current_time: int) -> None:
+        self.job_level.pop(job.job_id, None)
+        self.job_epoch.pop(job.job_id, None)
+        self.job_used.pop(job.job_id, None)
+
     def on_job_preempted(self, job: Job, current_time: int) -> None:
         # A preemption means the job used its full quantum at the current level.
         # Demote it to the next lower-priority queue (or stay at the bottom).
-        level = self.job_level.get(job.job_id, 0)
+        level = self._level_of(job.job_id)
         new_level = min(level + 1, self.num_queues - 1)
-        self.job_level[job.job_id] = new_level
-        self.job_used[job.job_id] = 0
-        self.queues[new_level].append(job)  # back of lower-priority queue
+        self._enqueue(job, new_level)  # back of lower-priority queue
+
+
+def _check_quanta(quanta: list[int], num_queues: int) -> list[int]:
+    """Validated copy of ``quanta``, doubling the last one until every level has one."""
+    if not isinstance(quanta, (list, tuple)) or not quanta:
+        raise ValueError(f"quanta must be a non-empty list of integers, got {quanta!r}")
+    checked = [check_int("quanta", q) for q in quanta]
+    while len(checked) < num_queues:
+        checked.append(checked[-1] * 2)
+    return checked
@@ -1,10 +1,10 @@
 """Priority with Aging scheduler - prevents starvation by aging waiting jobs."""
 
-import heapq
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
-from .base import Scheduler
+from .addressable_heap import AddressableHeap
+from .base import Scheduler, check_int
 
 
 class PriorityAgingScheduler(Scheduler):
@@ -16,12 +16,17 @@ class PriorityAgingScheduler(Scheduler):
     """
 
     name = "Priority+Aging"
+    # A lone job re-dispatched at a boundary accrues no wait, so aging is unaffected.
+    supports_quantum_coalescing = True
 
     def __init__(self, age_interval: int = 5, max_age_bonus: int = 10) -> None:
-        self.age_interval = age_interval
-        self.max_age_bonus = max_age_bonus
-        # (neg_effective_priority, enqueue_time, job_id, job) - negate for max-heap
-        self.ready_queue: list[tuple[int, int, int, Job]] = []
+        self.age_interval = check_int("age_interval", age_interval)
+        self.max_age_bonus = check_int("max_age_bonus", max_age_bonus, minimum=0)
+        # Keyed by (neg_effective_priority, enqueue_time) - negate for max-heap.
+        # A job's key is decreased in place whenever its aging bonus steps up.
+        self.ready_queue: AddressableHeap[Job] = AddressableHeap()
+        # Keyed by the time a queued job's bonus next steps up.
+        self.promotions: AddressableHeap[Job] = AddressableHeap()
         self.job_enqueue_time: dict[int, int] = {}   # job_id -> last enqueue timestamp
         self.job_accumulated_wait: dict[int, int] = {}  # job_id -> frozen total wait
 
@@ -29,11 +34,7 @@ class PriorityAgingScheduler(Scheduler):
         self.job_enqueue_time[job.job_id] = current_time
         if job.job_id not in self.job_accumulated_wait:
             self.job_accumulated_wait[job.job_id] = 0
-        effective = self._effective_priority(job, current_time)
-        heapq.heappush(
-            self.ready_queue,
-            (-effective, current_time, job.job_id, job),
-        )
+        self._push(job, current_time)
 
     def _effective_priority(self, job: Job, current_time: int) -> int:
         enqueue = self.job_enqueue_time.get(job.job_id, current_time)
@@ -45,17 +46,47 @@ class PriorityAgingScheduler(Scheduler):
         )
         return job.priority + age_bonus
 
+    def _push(self, job: Job, current_time: int) -> None:
+        """Set the job's heap key for its bonus at current_time and schedule its next step."""
+        job_id = job.job_id
+        enqueue = self.job_enqueue_time[job_id]
+        total_wait = self.job_accumulated_wait[job_id] + current_time - enqueue
+        age_bonus = (total_wait // self.age_interval) * 2
+        # The bonus is a step function of wait; it next changes when total wait
+        # reaches the following multiple of age_interval, unless already capped.
+        if age_bonus < self.max_age_bonus:
+            step_at = current_time + self.age_interval - total_wait % self.age_interval
+            self.promotions.set_key(job_id, step_at, job)
+        else:
+            age_bonus = self.max_age_bonus
+            self.promotions.discard(job_id)
+        self.ready_queue.set_key(job_id, (-(job.priority + age_bonus), enqueue), job)
+
+    def reconfigure(self, current_time: int, **params: Any) -> None:
+        age_interval = check_int("age_interval", params.pop("age_interval", self.age_interval))
+        max_age_bonus = check_int(
+            "max_age_bonus", params.pop("max_age_bonus", self.max_age_bonus), minimum=0
+        )
+        super().reconfigure(current_time, **params)
+        self.age_interval = age_interval
+        self.max_age_bonus = max_age_bonus
+        # Heap keys and promotion times were computed with the old values.
+        for job in self.ready_queue.items():
+            self._push(job, current_time)
+
     def get_next_job(self, current_time: int) -> Optional[Job]:
         if not self.ready_queue:
             return None
-        # Refresh all effective priorities to account for accumulated aging.
-        updated = []
-        for _, _, _, job in self.ready_queue:
-            eff = self._effective_priority(job, current_time)
-            updated.append((-eff, self.job_enqueue_time[job.job_id], job.job_id, job))
-        heapq.heapify(updated)
-        self.ready_queue = updated
-        _, _, _, job = heapq.heappop(self.ready_queue)
+        # Apply the aging steps that are due; each job steps at most
+        # max_age_bonus / 2 + 1 times per stint, so this is O(log n) amortized.
+        promotions = self.promotions
+        while promotions:
+            step_at, _, job = promotions.peek()
+            if step_at > current_time:
+                break
+            self._push(job, current_time)
+        _, job_id, job = self.ready_queue.pop()
+        promotions.discard(job_id)
         # Freeze the wait accumulated during this ready-queue stint before running.
         enqueue = self.job_enqueue_time.get(job.job_id, current_time)
         self.job_accumulated_wait[job.job_id] = (
@@ -63,15 +94,18 @@ class PriorityAgingScheduler(Scheduler):
         )
         return job
 
+    def get_config(self) -> Optional[dict[str, Any]]:
+        return {"age_interval": self.age_interval, "max_age_bonus": self.max_age_bonus}
+
     def has_ready_jobs(self) -> bool:
         return len(self.ready_queue) > 0
 
+    def on_job_completed(self, job: Job, current_time: int) -> None:
+        self.job_enqueue_time.pop(job.job_id, None)
+        self.job_accumulated_wait.pop(job.job_id, None)
+
     def on_job_preempted(self, job: Job, current_time: int) -> None:
         # Re-enter queue. New wait stint starts from now;
         # accumulated_wait already has frozen wait from previous stints.
         self.job_enqueue_time[job.job_id] = current_time
-        effective = self._effective_priority(job, current_time)
-        heapq.heappush(
-            self.ready_queue,
-            (-effective, current_time, job.job_id, job),
-        )
+        self._push(job, current_time)
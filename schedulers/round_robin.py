@@ -1,7 +1,7 @@
 """Round Robin scheduler - fixed time slices shared equally."""
 
 from collections import deque
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
 from .base import Scheduler
@@ -11,6 +11,7 @@ class RoundRobinScheduler(Scheduler):
     """Fixed quantum, FIFO queue, equal share of CPU."""
 
     name = "Round Robin"
+    supports_quantum_coalescing = True
 
     def __init__(self) -> None:
         self.ready_queue: deque[Job] = deque()
@@ -23,5 +24,8 @@ class RoundRobinScheduler(Scheduler):
             return None
         return self.ready_queue.popleft()
 
+    def get_config(self) -> Optional[dict[str, Any]]:
+        return {}
+
     def has_ready_jobs(self) -> bool:
         return len(self.ready_queue) > 0
@@ -1,16 +1,12 @@
 """SJF (Shortest Job First) and SRTF (Shortest Remaining Time First) schedulers."""
 
-import heapq
-from typing import Optional
+from typing import Any, Optional
 
 from models.job import Job
+from .addressable_heap import AddressableHeap
 from .base import Scheduler
 
 
-def _key_remaining(job: Job) -> int:
-    return job.remaining_time
-
-
 class SJFScheduler(Scheduler):
     """Shortest Job First - non-preemptive. Uses burst_time at arrival."""
 
@@ -18,17 +14,20 @@ class SJFScheduler(Scheduler):
     preempts_on_quantum = False  # non-preemptive: run to completion once started
 
     def __init__(self) -> None:
-        self.ready_queue: list[tuple[int, int, Job]] = []  # (burst_time, job_id, job)
+        self.ready_queue: AddressableHeap[Job] = AddressableHeap()  # keyed by burst_time
 
     def add_job(self, job: Job, current_time: int) -> None:
-        heapq.heappush(self.ready_queue, (job.burst_time, job.job_id, job))
+        self.ready_queue.push(job.job_id, job.burst_time, job)
 
     def get_next_job(self, current_time: int) -> Optional[Job]:
         if not self.ready_queue:
             return None
-        _, _, job = heapq.heappop(self.ready_queue)
+        _, _, job = self.ready_queue.pop()
         return job
 
+    def get_config(self) -> Optional[dict[str, Any]]:
+        return {}
+
     def has_ready_jobs(self) -> bool:
         return len(self.ready_queue) > 0
 
@@ -42,17 +41,20 @@ class SRTFScheduler(Scheduler):
     preempts_on_arrival = True
 
     def __init__(self) -> None:
-        self.ready_queue: list[tuple[int, int, Job]] = []  # (remaining_time, job_id, job)
+        self.ready_queue: AddressableHeap[Job] = AddressableHeap()  # keyed by remaining_time
 
     def add_job(self, job: Job, current_time: int) -> None:
-        heapq.heappush(self.ready_queue, (job.remaining_time, job.job_id, job))
+        self.ready_queue.push(job.job_id, job.remaining_time, job)
 
     def get_next_job(self, current_time: int) -> Optional[Job]:
         if not self.ready_queue:
             return None
-        _, _, job = heapq.heappop(self.ready_queue)
+        _, _, job = self.ready_queue.pop()
         return job
 
+    def get_config(self) -> Optional[dict[str, Any]]:
+        return {}
+
     def has_ready_jobs(self) -> bool:
         return len(self.ready_queue) > 0
 
@@ -60,4 +62,4 @@ class SRTFScheduler(Scheduler):
         return new_arrival.remaining_time < current.remaining_time
 
     def on_job_preempted(self, job: Job, current_time: int) -> None:
-        heapq.heappush(self.ready_queue, (job.remaining_time, job.job_id, job))
+        self.ready_queue.push(job.job_id, job.remaining_time, job)
@@ -1,4 +1,23 @@
-from .engine import SimulationEngine
+from .engine import SimulationCancelled, SimulationEngine
 from .metrics import SimulationMetrics, compute_metrics
+from .accumulator import MetricsAccumulator
+from .cache import SimulationCache
+from .checkpoint import SimulationSnapshot
+from .lanes import LaneResults, run_lane_arrays, run_lanes
+from .trace import TraceEvent, TraceReader, TraceRecorder
 
-__all__ = ["SimulationEngine", "SimulationMetrics", "compute_metrics"]
+__all__ = [
+    "SimulationEngine",
+    "SimulationCancelled",
+    "SimulationMetrics",
+    "compute_metrics",
+    "MetricsAccumulator",
+    "SimulationCache",
+    "SimulationSnapshot",
+    "LaneResults",
+    "run_lanes",
+    "run_lane_arrays",
+    "TraceEvent",
+    "TraceReader",
+    "TraceRecorder",
+]
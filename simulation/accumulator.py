@@ -0,0 +1,132 @@
+"""Online metrics: aggregate completions as they happen instead of keeping every Job."""
+
+from typing import Dict, Iterable, List, Sequence
+
+from models.job import Job
+from .metrics import SimulationMetrics, _rank
+
+
+class LogLinearHistogram:
+    """
+    Fixed-memory quantile sketch in the style of an HDR histogram.
+
+    Values below ``2**sub_bucket_bits`` are counted exactly; larger values
+    share buckets of relative width ``2**-(sub_bucket_bits - 1)``, so memory
+    grows only with the number of powers of two spanned, not with the count.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 11) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.exact_limit = 1 << sub_bucket_bits
+        self.counts: List[int] = [0] * self.exact_limit
+        self.total = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.exact_limit:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (shift << (self.sub_bucket_bits - 1)) + (value >> shift)
+
+    def _lowest_value(self, index: int) -> int:
+        if index < self.exact_limit:
+            return index
+        shift = (index >> (self.sub_bucket_bits - 1)) - 1
+        return (index - (shift << (self.sub_bucket_bits - 1))) << shift
+
+    def add(self, value: int) -> None:
+        idx = self._index(max(0, value))
+        if idx >= len(self.counts):
+            self.counts.extend([0] * (idx + 1 - len(self.counts)))
+        self.counts[idx] += 1
+        self.total += 1
+
+    def value_at_rank(self, rank: int) -> int:
+        """Lowest value of the bucket holding the ``rank``-th smallest sample (0-based)."""
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return self._lowest_value(idx)
+        return 0
+
+    def percentile(self, fraction: float) -> int:
+        if not self.total:
+            return 0
+        return self.value_at_rank(_rank(self.total, fraction))
+
+
+class MetricsAccumulator:
+    """
+    Running version of compute_metrics that the engine feeds one completion at a time.
+
+    Means and starvation rates (for every threshold in ``starvation_thresholds``)
+    are exact; percentiles come from LogLinearHistogram sketches and are exact
+    while values stay below ``2**sub_bucket_bits``. Memory does not depend on
+    the number of jobs.
+    """
+
+    def __init__(
+        self,
+        starvation_thresholds: Iterable[int] = (100,),
+        percentiles: Sequence[float] = (),
+        sub_bucket_bits: int = 11,
+    ) -> None:
+        self.starvation_thresholds = tuple(starvation_thresholds)
+        self.percentiles = tuple(percentiles)
+        self.count = 0
+        self.sum_turnaround = 0
+        self.sum_response = 0
+        self.starved: Dict[int, int] = {t: 0 for t in self.starvation_thresholds}
+        self.lifetime_starved: Dict[int, int] = {t: 0 for t in self.starvation_thresholds}
+        self.turnaround = LogLinearHistogram(sub_bucket_bits)
+        self.response = LogLinearHistogram(sub_bucket_bits)
+
+    def add(self, job: Job) -> None:
+        turnaround = job.completion_time - job.arrival_time
+        response = job.first_run_time - job.arrival_time
+        total_wait = turnaround - job.burst_time
+        self.count += 1
+        self.sum_turnaround += turnaround
+        self.sum_response += response
+        for t in self.starvation_thresholds:
+            if response > t:
+                self.starved[t] += 1
+            if total_wait > t:
+                self.lifetime_starved[t] += 1
+        self.turnaround.add(turnaround)
+        self.response.add(response)
+
+    __call__ = add  # usable directly as a run_stream sink
+
+    def metrics(self, starvation_threshold: int | None = None) -> SimulationMetrics:
+        """Snapshot as SimulationMetrics for one of the tracked thresholds (default: first)."""
+        if starvation_threshold is None:
+            starvation_threshold = self.starvation_thresholds[0]
+        if starvation_threshold not in self.starved:
+            raise ValueError(f"Starvation threshold {starvation_threshold} is not tracked")
+        n = self.count
+        if not n:
+            return SimulationMetrics(
+                avg_turnaround_time=0.0,
+                avg_response_time=0.0,
+                tail_latency_p95=0.0,
+                starvation_rate=0.0,
+                lifetime_starvation_rate=0.0,
+                total_jobs=0,
+                completed_jobs=0,
+                turnaround_percentiles={p: 0.0 for p in self.percentiles},
+                response_percentiles={p: 0.0 for p in self.percentiles},
+            )
+        return SimulationMetrics(
+            avg_turnaround_time=self.sum_turnaround / n,
+            avg_response_time=self.sum_response / n,
+            tail_latency_p95=self.turnaround.percentile(0.95),
+            starvation_rate=self.starved[starvation_threshold] / n,
+            lifetime_starvation_rate=self.lifetime_starved[starvation_threshold] / n,
+            total_jobs=n,
+            completed_jobs=n,
+            turnaround_percentiles={
+                p: self.turnaround.percentile(p / 100) for p in self.percentiles
+            },
+            response_percentiles={p: self.response.percentile(p / 100) for p in self.percentiles},
+        )
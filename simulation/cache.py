@@ -0,0 +1,164 @@
+"""Content-addressed cache of simulation results with LRU eviction."""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from models.job import Job
+from schedulers.base import Scheduler
+
+# Bump when engine or scheduler behaviour changes so stale disk entries are ignored.
+CACHE_VERSION = 1
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # memory + disk
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # memory + disk
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def workload_digest(jobs: List[Job]) -> str:
+    """Stable hash of a workload's contents (order-sensitive: ties run in list order)."""
+    h = hashlib.sha256()
+    pack = struct.Struct("<4q").pack
+    for j in jobs:
+        h.update(pack(j.job_id, j.arrival_time, j.burst_time, j.priority))
+    return h.hexdigest()
+
+
+def simulation_key(
+    scheduler: Scheduler,
+    quantum: int,
+    digest: str,
+) -> Optional[str]:
+    """Cache key for running ``scheduler`` on a workload, or None if not cacheable."""
+    config = scheduler.get_config()
+    if config is None:
+        return None
+    payload = {
+        "version": CACHE_VERSION,
+        "scheduler": f"{type(scheduler).__module__}.{type(scheduler).__qualname__}",
+        "name": scheduler.name,
+        "config": config,
+        "quantum": quantum,
+        "workload": digest,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SimulationCache:
+    """
+    Two-tier LRU cache mapping a simulation key to its completed jobs.
+
+    The memory tier holds up to ``max_entries`` results. The optional disk tier
+    (``cache_dir``) stores one pickle per key and evicts least recently used
+    files once their total size exceeds ``max_disk_bytes``. Cached job lists
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, List[Job]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self._disk_bytes = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.pkl"))
+
+    def get(self, key: str) -> Optional[List[Job]]:
+        with self._lock:
+            completed = self._memory.get(key)
+            if completed is not None:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                return completed
+            completed = self._read_disk(key)
+            if completed is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._remember(key, completed)
+            return completed
+
+    def put(self, key: str, completed: List[Job]) -> None:
+        with self._lock:
+            self._remember(key, completed)
+            self._write_disk(key, completed)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers (statistics are kept)."""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir is not None:
+                for path in self.cache_dir.glob("*.pkl"):
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, key: str, completed: List[Job]) -> None:
+        self._memory[key] = completed
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[List[Job]]:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(path, "rb") as f:
+                completed = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        os.utime(path)  # mtime doubles as the disk tier's recency stamp
+        return completed
+
+    def _write_disk(self, key: str, completed: List[Job]) -> None:
+        if self.cache_dir is None:
+            return
+        path = self.cache_dir / f"{key}.pkl"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(completed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        old_size = path.stat().st_size if path.exists() else 0
+        os.replace(tmp, path)
+        self._disk_bytes += path.stat().st_size - old_size
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        files = sorted(self.cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            self._disk_bytes -= size
+            self.stats.evictions += 1
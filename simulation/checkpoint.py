@@ -0,0 +1,90 @@
+"""Snapshots of a paused simulation that can be saved, restored and forked."""
+
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
+
+from models.job import Job
+from schedulers.base import Scheduler
+
+if TYPE_CHECKING:
+    from .accumulator import MetricsAccumulator
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class SimulationSnapshot:
+    """
+    Full state of a simulation paused by SimulationEngine.run_until().
+
+    Every event at or before ``time`` has been processed; ``clock`` is the time
+    of the last one. The scheduler (with all its per-job internals), the job
+    on the CPU and the pending arrivals share Job objects exactly as in the
+    live run, which copy/pickle preserve. Engine settings such as the quantum
+    are not part of the snapshot; they come from the engine that resumes it.
+    """
+
+    time: int
+    clock: int
+    scheduler: Scheduler
+    pending: List[Job]  # not yet arrived, in admission order
+    current_job: Optional[Job] = None
+    job_run_start: int = 0
+    completed_jobs: List[Job] = field(default_factory=list)
+    all_jobs: List[Job] = field(default_factory=list)
+    retain_jobs: bool = True
+    accumulator: Optional["MetricsAccumulator"] = None
+    version: int = SNAPSHOT_VERSION
+
+    def copy(self) -> "SimulationSnapshot":
+        """Independent deep copy (Job identities are kept consistent within it)."""
+        return copy.deepcopy(self)
+
+    def fork(
+        self,
+        arrivals: Iterable[Job] = (),
+        replace_pending: bool = False,
+        **scheduler_params: Any,
+    ) -> "SimulationSnapshot":
+        """
+        Copy of this snapshot with different future arrivals or scheduler parameters.
+
+        ``arrivals`` are added to the pending arrivals (after any pending job
+        arriving at the same time), or replace them when ``replace_pending`` is
+        set; each must arrive after ``time``. ``scheduler_params`` go to the
+        forked scheduler's reconfigure() at ``time``, e.g. ``fork(age_interval=10)``,
+        which rebuilds its queues for them or raises ValueError.
+        """
+        forked = self.copy()
+        new_jobs = [job.copy_for_simulation() for job in arrivals]
+        for job in new_jobs:
+            if job.arrival_time <= self.time:
+                raise ValueError(
+                    f"Forked arrival {job.job_id} at {job.arrival_time} is not after "
+                    f"the snapshot time {self.time}"
+                )
+        if replace_pending:
+            dropped = {id(job) for job in forked.pending}
+            forked.all_jobs = [job for job in forked.all_jobs if id(job) not in dropped]
+            forked.pending = []
+        if new_jobs:
+            forked.pending = sorted(forked.pending + new_jobs, key=lambda j: j.arrival_time)
+            if forked.retain_jobs:
+                forked.all_jobs.extend(new_jobs)
+        if scheduler_params:
+            forked.scheduler.reconfigure(self.time, **scheduler_params)
+        return forked
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "SimulationSnapshot":
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+        if not isinstance(snapshot, cls) or snapshot.version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a simulation snapshot (version {SNAPSHOT_VERSION})")
+        return snapshot
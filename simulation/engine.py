@@ -1,11 +1,26 @@
 """Discrete-event simulation engine for CPU scheduling."""
 
+import copy
 import heapq
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from models.job import Job
 from models.event import Event, EventType
 from schedulers.base import Scheduler
+from . import jit_backend
+from .checkpoint import SimulationSnapshot
+from .profiling import ProfileReport, SchedulerProfiler
+from .trace import TraceEvent, TraceRecorder
+
+if TYPE_CHECKING:
+    from .accumulator import MetricsAccumulator
+
+# "numba" runs run() through jit_backend when it can and falls back to "python".
+BACKENDS = ("python", "numba")
+
+
+class SimulationCancelled(Exception):
+    """Raised from an engine progress callback to stop the running simulation."""
 
 
 class SimulationEngine:
@@ -16,10 +31,37 @@ class SimulationEngine:
         scheduler: Scheduler,
         quantum: int = 4,
         use_preemptive_quantum: bool = True,
+        coalesce_quanta: bool = True,
+        accumulator: Optional["MetricsAccumulator"] = None,
+        retain_jobs: bool = True,
+        trace: Optional[TraceRecorder] = None,
+        profile: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        progress_interval: int = 1000,
+        backend: str = "python",
     ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(BACKENDS)}")
         self.scheduler = scheduler
         self.quantum = quantum
         self.use_preemptive_quantum = use_preemptive_quantum
+        # Skip quantum boundaries of a job running alone when the scheduler allows it.
+        self.coalesce_quanta = coalesce_quanta
+        # Fed every completed job; with retain_jobs=False run() keeps no Job records.
+        self.accumulator = accumulator
+        self.retain_jobs = retain_jobs
+        # Optional dispatch/preempt/complete log; costs one None check per event when unset.
+        self.trace = trace
+        # When set, each run times scheduler callbacks and fills profile_report.
+        self.profile = profile
+        self.profile_report: Optional[ProfileReport] = None
+        # Called as progress(current_time, completed) every progress_interval
+        # completions; raising SimulationCancelled from it aborts the run.
+        self.progress = progress
+        self.progress_interval = progress_interval
+        # run() uses the compiled loop when backend="numba" and
+        # jit_backend.supports() this engine; anything else runs in Python.
+        self.backend = backend
         self.current_time = 0
         self.completed_jobs: List[Job] = []
         self.all_jobs: List[Job] = []
@@ -29,27 +71,229 @@ class SimulationEngine:
         Run simulation on the given jobs.
         Returns list of completed jobs with turnaround/response times filled.
         """
+        if self.backend == "numba":
+            completed = jit_backend.run(self, jobs)
+            if completed is not None:
+                return completed
+        arrivals = self._start(jobs)
+        self._simulate(arrivals, self._run_hook())
+        return self.completed_jobs
+
+    def run_until(self, jobs: List[Job], until: int) -> SimulationSnapshot:
+        """
+        Run the simulation of ``jobs`` up to simulated time ``until`` and pause.
+
+        Every event at or before ``until`` is processed. The returned snapshot
+        can be resumed (any number of times), forked or saved to disk, so a
+        shared prefix is simulated once.
+        """
+        arrivals = self._start(jobs)
+        state = self._simulate(arrivals, self._run_hook(), until=until)
+        return self._snapshot(until, arrivals, *state)
+
+    def resume(self, snapshot: SimulationSnapshot) -> List[Job]:
+        """
+        Continue a snapshot to the end; returns completed jobs like run().
+
+        The engine takes a copy of the snapshot's scheduler (and accumulator,
+        if it has one), so the snapshot itself stays reusable.
+        """
+        arrivals, current_job, job_run_start = self._restore(snapshot)
+        self._simulate(arrivals, self._run_hook(), current_job, job_run_start)
+        return self.completed_jobs
+
+    def resume_until(self, snapshot: SimulationSnapshot, until: int) -> SimulationSnapshot:
+        """Continue a snapshot up to ``until`` and pause again."""
+        arrivals, current_job, job_run_start = self._restore(snapshot)
+        state = self._simulate(arrivals, self._run_hook(), current_job, job_run_start, until)
+        return self._snapshot(until, arrivals, *state)
+
+    def _start(self, jobs: List[Job]) -> Iterator[Job]:
+        """Reset run state for ``jobs`` and return their arrivals in admission order."""
         self.completed_jobs = []
         self.current_time = 0
-        self.all_jobs = [j.copy_for_simulation() for j in jobs]
-
+        copies = [j.copy_for_simulation() for j in jobs]
         arrivals: List[Event] = [
-            Event(job.arrival_time, EventType.ARRIVAL, job) for job in self.all_jobs
+            Event(job.arrival_time, EventType.ARRIVAL, job) for job in copies
         ]
         heapq.heapify(arrivals)
+        self.all_jobs = copies if self.retain_jobs else []
+        return _drain(arrivals)
+
+    def _run_hook(self) -> Callable[[Job], None]:
+        sink = self.completed_jobs.append if self.retain_jobs else None
+        return self._completion_hook(sink)
+
+    def _restore(self, snapshot: SimulationSnapshot) -> Tuple[Iterator[Job], Optional[Job], int]:
+        state = snapshot.copy()
+        self.scheduler = state.scheduler
+        if state.accumulator is not None:
+            self.accumulator = state.accumulator
+        self.retain_jobs = state.retain_jobs
+        self.completed_jobs = state.completed_jobs
+        self.all_jobs = state.all_jobs
+        self.current_time = state.clock
+        return iter(state.pending), state.current_job, state.job_run_start
+
+    def _snapshot(
+        self,
+        until: int,
+        arrivals: Iterator[Job],
+        next_arrival: Optional[Job],
+        current_job: Optional[Job],
+        job_run_start: int,
+    ) -> SimulationSnapshot:
+        pending = [next_arrival] if next_arrival is not None else []
+        pending.extend(arrivals)
+        # One deepcopy keeps the Job objects shared between the scheduler, the
+        # running job and the job lists consistent, and detaches them from this engine.
+        return copy.deepcopy(
+            SimulationSnapshot(
+                time=until,
+                clock=self.current_time,
+                scheduler=self.scheduler,
+                pending=pending,
+                current_job=current_job,
+                job_run_start=job_run_start,
+                completed_jobs=self.completed_jobs,
+                all_jobs=self.all_jobs,
+                retain_jobs=self.retain_jobs,
+                accumulator=self.accumulator,
+            )
+        )
+
+    def run_stream(
+        self,
+        jobs: Iterable[Job],
+        sink: Optional[Callable[[Job], None]] = None,
+    ) -> int:
+        """
+        Run simulation pulling jobs lazily from an arrival-ordered iterable.
+
+        Each job is copied only when its arrival is reached, and finished jobs are
+        passed to ``sink`` (or dropped) instead of being kept in completed_jobs, so
+        memory is bounded by the number of live jobs. Same-time arrivals are
+        admitted in iteration order. Returns the number of completed jobs.
+        """
+        self.completed_jobs = []
+        self.all_jobs = []
+        self.current_time = 0
+
+        completed = 0
+        hook = self._completion_hook(sink)
+
+        def on_complete(job: Job) -> None:
+            nonlocal completed
+            completed += 1
+            hook(job)
+
+        self._simulate(_ordered_copies(jobs), on_complete)
+        return completed
+
+    def _completion_hook(self, sink: Optional[Callable[[Job], None]]) -> Callable[[Job], None]:
+        """Combine the caller's sink with the metrics accumulator and progress callback, if any."""
+        hook = self._sink_hook(sink)
+        progress = self.progress
+        if progress is None:
+            return hook
+        interval = self.progress_interval
+        completed = 0
 
-        current_job: Optional[Job] = None
-        job_run_start: int = 0
+        def on_complete(job: Job) -> None:
+            nonlocal completed
+            hook(job)
+            completed += 1
+            if completed % interval == 0:
+                progress(self.current_time, completed)
+
+        return on_complete
+
+    def _sink_hook(self, sink: Optional[Callable[[Job], None]]) -> Callable[[Job], None]:
+        accumulator = self.accumulator
+        if accumulator is None:
+            return sink if sink is not None else _discard
+        if sink is None:
+            return accumulator.add
+
+        def on_complete(job: Job) -> None:
+            accumulator.add(job)
+            sink(job)
+
+        return on_complete
+
+    def _simulate(
+        self,
+        arrivals: Iterator[Job],
+        on_complete: Callable[[Job], None],
+        current_job: Optional[Job] = None,
+        job_run_start: int = 0,
+        until: Optional[int] = None,
+    ) -> Tuple[Optional[Job], Optional[Job], int]:
+        """
+        Event loop shared by run(), run_stream() and resume(); arrivals must be time-ordered.
+
+        Returns the unadmitted next arrival, the running job and its run start,
+        which are only meaningful when the loop paused at ``until``.
+        """
+        if not self.profile:
+            return self._event_loop(
+                arrivals, on_complete, None, current_job, job_run_start, until
+            )
+        profiler = SchedulerProfiler(self.scheduler)
+        profiler.attach()
+        try:
+            return self._event_loop(
+                arrivals, on_complete, profiler, current_job, job_run_start, until
+            )
+        finally:
+            self.profile_report = profiler.detach()
+
+    def _event_loop(
+        self,
+        arrivals: Iterator[Job],
+        on_complete: Callable[[Job], None],
+        profiler: Optional[SchedulerProfiler],
+        current_job: Optional[Job],
+        job_run_start: int,
+        until: Optional[int],
+    ) -> Tuple[Optional[Job], Optional[Job], int]:
+        next_arrival: Optional[Job] = next(arrivals, None)
+        trace = self.trace
+        # First time the loop must not reach; also caps coalescing so a fork's
+        # new arrivals after ``until`` are never skipped over.
+        stop = float("inf") if until is None else until + 1
 
         # Whether this scheduler supports quantum-based preemption.
         preempts_on_quantum = getattr(self.scheduler, "preempts_on_quantum", True)
         # Optional per-job quantum hook (e.g. MLFQ per-level quanta).
         get_quantum = getattr(self.scheduler, "get_quantum", None)
+        coalesce = (
+            self.coalesce_quanta
+            and preempts_on_quantum
+            and getattr(self.scheduler, "supports_quantum_coalescing", False)
+        )
 
-        while arrivals or current_job or self.scheduler.has_ready_jobs():
-            next_arrival_time = arrivals[0].time if arrivals else float("inf")
+        while next_arrival is not None or current_job or self.scheduler.has_ready_jobs():
+            if profiler is not None:
+                profiler.on_iteration()
+            next_arrival_time = (
+                next_arrival.arrival_time if next_arrival is not None else float("inf")
+            )
 
             if current_job is not None:
+                # Nothing else is ready and no arrival is due before the horizon:
+                # jump over the intermediate preempt/re-dispatch cycles.
+                if coalesce and not self.scheduler.has_ready_jobs():
+                    horizon = min(
+                        next_arrival_time, job_run_start + current_job.remaining_time, stop
+                    )
+                    new_start = self.scheduler.coalesce_quanta(
+                        current_job, job_run_start, self.quantum, int(horizon)
+                    )
+                    if trace is not None and new_start != job_run_start:
+                        trace.record(new_start, current_job.job_id, TraceEvent.COALESCE)
+                    current_job.remaining_time -= new_start - job_run_start
+                    job_run_start = new_start
                 effective_quantum = get_quantum(current_job) if get_quantum else self.quantum
                 if preempts_on_quantum:
                     run_duration = min(effective_quantum, current_job.remaining_time)
@@ -60,7 +304,7 @@ class SimulationEngine:
                 next_completion = float("inf")
 
             next_time = min(next_arrival_time, next_completion)
-            if next_time == float("inf"):
+            if next_time == float("inf") or next_time >= stop:
                 break
 
             self.current_time = int(next_time)
@@ -72,19 +316,24 @@ class SimulationEngine:
                 if current_job.remaining_time <= 0:
                     current_job.state = "done"
                     current_job.completion_time = self.current_time
-                    self.completed_jobs.append(current_job)
+                    if trace is not None:
+                        trace.record(self.current_time, current_job.job_id, TraceEvent.COMPLETE)
+                    self.scheduler.on_job_completed(current_job, self.current_time)
+                    on_complete(current_job)
                 else:
                     current_job.state = "ready"
+                    if trace is not None:
+                        trace.record(self.current_time, current_job.job_id, TraceEvent.PREEMPT)
                     self.scheduler.on_job_preempted(current_job, self.current_time)
                 current_job = None
 
             # Process all arrivals at current_time
-            while arrivals and arrivals[0].time == self.current_time:
-                ev = heapq.heappop(arrivals)
-                job = ev.job
-                if job is None:
-                    continue
+            while next_arrival is not None and next_arrival.arrival_time == self.current_time:
+                job = next_arrival
+                next_arrival = next(arrivals, None)
                 job.state = "ready"
+                if trace is not None:
+                    trace.record(self.current_time, job.job_id, TraceEvent.ARRIVAL)
                 self.scheduler.add_job(job, self.current_time)
 
                 # Preemption on arrival (e.g., for SRTF)
@@ -96,6 +345,8 @@ class SimulationEngine:
                     elapsed = self.current_time - job_run_start
                     current_job.remaining_time -= elapsed
                     current_job.state = "ready"
+                    if trace is not None:
+                        trace.record(self.current_time, current_job.job_id, TraceEvent.PREEMPT)
                     self.scheduler.on_job_preempted(current_job, self.current_time)
                     current_job = None
 
@@ -108,5 +359,32 @@ class SimulationEngine:
                     if current_job.first_run_time is None:
                         current_job.first_run_time = self.current_time
                     job_run_start = self.current_time
+                    if trace is not None:
+                        trace.record(self.current_time, current_job.job_id, TraceEvent.DISPATCH)
 
-        return self.completed_jobs
+        if trace is not None:
+            trace.flush()
+        return next_arrival, current_job, job_run_start
+
+
+def _discard(job: Job) -> None:
+    pass
+
+
+def _drain(arrivals: List[Event]) -> Iterator[Job]:
+    """Pop arrival events in heap order, releasing them as the simulation advances."""
+    while arrivals:
+        yield heapq.heappop(arrivals).job
+
+
+def _ordered_copies(jobs: Iterable[Job]) -> Iterator[Job]:
+    """Yield simulation copies of ``jobs``, rejecting out-of-order arrivals."""
+    last_arrival: Optional[int] = None
+    for job in jobs:
+        if last_arrival is not None and job.arrival_time < last_arrival:
+            raise ValueError(
+                f"Streamed jobs must be ordered by arrival_time "
+                f"(job {job.job_id} arrives at {job.arrival_time} after {last_arrival})"
+            )
+        last_arrival = job.arrival_time
+        yield job.copy_for_simulation()
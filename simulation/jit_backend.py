@@ -0,0 +1,590 @@
+"""Optional Numba-compiled event loop for the built-in schedulers.
+
+SimulationEngine(backend="numba") runs the engine's event loop, and array
+versions of the Round Robin, SJF, SRTF, Priority+Aging and MLFQ queues,
+as one compiled function over int64 job columns. Completion and first-run
+times are exactly those of the Python engine, including the heap order in
+which same-time arrivals are admitted.
+
+run() returns None whenever the compiled loop cannot reproduce a run (Numba
+or NumPy missing, another scheduler, a trace, profiling or progress
+callback, duplicate job ids), and the engine then uses its Python loop.
+Lottery is never compiled: its draws come from ``random.Random``.
+"""
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, List, Optional
+
+from models.job import Job
+from schedulers.mlfq import MLFQScheduler
+from schedulers.priority_aging import PriorityAgingScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+
+if TYPE_CHECKING:
+    from .engine import SimulationEngine
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is optional
+    numba = None
+
+# Compiled when Numba is installed. Otherwise the kernels below stay plain
+# Python (run() never calls them then), which keeps them readable and checkable.
+_jit = numba.njit(cache=True, nogil=True) if numba is not None else (lambda f: f)
+
+_RR, _SJF, _SRTF, _PRIORITY, _MLFQ = range(5)
+_POLICIES = {
+    RoundRobinScheduler: _RR,
+    SJFScheduler: _SJF,
+    SRTFScheduler: _SRTF,
+    PriorityAgingScheduler: _PRIORITY,
+    MLFQScheduler: _MLFQ,
+}
+
+_NEVER = 1 << 62
+
+
+def available() -> bool:
+    """Whether the compiled backend can run here (Numba and NumPy importable)."""
+    return numba is not None and np is not None
+
+
+def supports(engine: "SimulationEngine") -> bool:
+    """Whether ``engine``'s configuration can run compiled (jobs aside)."""
+    scheduler = engine.scheduler
+    return (
+        available()
+        # Exact types only: a subclass may override any callback.
+        and type(scheduler) in _POLICIES
+        and not scheduler.has_ready_jobs()
+        and engine.trace is None
+        and not engine.profile
+        and engine.progress is None
+    )
+
+
+def run(engine: "SimulationEngine", jobs: List[Job]) -> Optional[List[Job]]:
+    """
+    engine.run(jobs) through the compiled loop, or None if it cannot be used.
+
+    Fills engine.completed_jobs / all_jobs / current_time and feeds the
+    accumulator in completion order, as the Python loop does.
+    """
+    if not supports(engine):
+        return None
+    n = len(jobs)
+    columns = [
+        np.fromiter(map(attrgetter(attr), jobs), dtype=np.int64, count=n)
+        for attr in ("job_id", "arrival_time", "burst_time", "priority")
+    ]
+    job_id, arrival, burst, priority = columns
+    # The Python schedulers key their state by job_id, so ids must be unique.
+    if n and np.unique(job_id).size != n:
+        return None
+
+    scheduler = engine.scheduler
+    policy = _POLICIES[type(scheduler)]
+    quanta = np.zeros(1, dtype=np.int64)
+    age_interval = max_age_bonus = boost_interval = last_boost = 0
+    if policy == _PRIORITY:
+        age_interval, max_age_bonus = scheduler.age_interval, scheduler.max_age_bonus
+    elif policy == _MLFQ:
+        quanta = np.asarray(scheduler.quanta[: scheduler.num_queues], dtype=np.int64)
+        boost_interval, last_boost = scheduler.boost_interval, scheduler.last_boost_time
+    coalesce = engine.coalesce_quanta and scheduler.supports_quantum_coalescing
+
+    first_run, completion, remaining, done_order, end_time, last_boost = _event_loop(
+        policy,
+        job_id,
+        arrival,
+        burst,
+        priority,
+        engine.quantum,
+        coalesce,
+        age_interval,
+        max_age_bonus,
+        quanta,
+        boost_interval,
+        last_boost,
+    )
+    if policy == _MLFQ:
+        scheduler.last_boost_time = int(last_boost)
+
+    engine.completed_jobs = []
+    engine.current_time = int(end_time)
+    if not engine.retain_jobs and engine.accumulator is None:
+        engine.all_jobs = []
+        return engine.completed_jobs  # nothing would see the finished jobs
+    copies = [j.copy_for_simulation() for j in jobs]
+    engine.all_jobs = copies if engine.retain_jobs else []
+    on_complete = engine._run_hook()
+    first_run, completion, remaining = first_run.tolist(), completion.tolist(), remaining.tolist()
+    for k in done_order.tolist():
+        job = copies[k]
+        job.remaining_time = remaining[k]
+        job.state = "done"
+        job.first_run_time = first_run[k]
+        job.completion_time = completion[k]
+        on_complete(job)
+    return engine.completed_jobs
+
+
+@_jit
+def _admission_order(arrival):
+    """Indices in the order heapq pops Events built from ``arrival`` (compared by time)."""
+    n = arrival.size
+    heap = np.arange(n)
+    for i in range(n // 2 - 1, -1, -1):
+        _heapq_siftup(heap, i, n, arrival)
+    order = np.empty(n, dtype=np.int64)
+    size = n
+    for k in range(n):
+        size -= 1
+        last = heap[size]
+        if size:
+            order[k] = heap[0]
+            heap[0] = last
+            _heapq_siftup(heap, 0, size, arrival)
+        else:
+            order[k] = last
+    return order
+
+
+@_jit
+def _heapq_siftup(heap, pos, end, time):
+    # heapq._siftup then heapq._siftdown, comparing with time[a] < time[b] only.
+    start = pos
+    item = heap[pos]
+    child = 2 * pos + 1
+    while child < end:
+        right = child + 1
+        if right < end and not time[heap[child]] < time[heap[right]]:
+            child = right
+        heap[pos] = heap[child]
+        pos = child
+        child = 2 * pos + 1
+    while pos > start:
+        parent = (pos - 1) >> 1
+        if time[item] < time[heap[parent]]:
+            heap[pos] = heap[parent]
+            pos = parent
+            continue
+        break
+    heap[pos] = item
+
+
+# Addressable min-heap of job indices ordered by (k1, k2, job_id), as
+# AddressableHeap orders (key, job_id); pos[j] is j's slot or -1.
+
+
+@_jit
+def _less(a, b, k1, k2, ids):
+    if k1[a] != k1[b]:
+        return k1[a] < k1[b]
+    if k2[a] != k2[b]:
+        return k2[a] < k2[b]
+    return ids[a] < ids[b]
+
+
+@_jit
+def _sift_up(heap, pos, i, k1, k2, ids):
+    j = heap[i]
+    while i > 0:
+        parent = heap[(i - 1) >> 1]
+        if not _less(j, parent, k1, k2, ids):
+            break
+        heap[i] = parent
+        pos[parent] = i
+        i = (i - 1) >> 1
+    heap[i] = j
+    pos[j] = i
+
+
+@_jit
+def _sift_down(heap, pos, size, i, k1, k2, ids):
+    j = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _less(heap[child + 1], heap[child], k1, k2, ids):
+            child += 1
+        if not _less(heap[child], j, k1, k2, ids):
+            break
+        heap[i] = heap[child]
+        pos[heap[i]] = i
+        i = child
+    heap[i] = j
+    pos[j] = i
+
+
+@_jit
+def _heap_set(heap, pos, size, j, key1, key2, k1, k2, ids):
+    """Push j, or re-key it if queued; returns the new size."""
+    k1[j] = key1
+    k2[j] = key2
+    if pos[j] < 0:
+        heap[size] = j
+        _sift_up(heap, pos, size, k1, k2, ids)
+        return size + 1
+    _sift_up(heap, pos, pos[j], k1, k2, ids)
+    _sift_down(heap, pos, size, pos[j], k1, k2, ids)
+    return size
+
+
+@_jit
+def _heap_remove(heap, pos, size, j, k1, k2, ids):
+    """Drop j if queued; returns the new size."""
+    i = pos[j]
+    if i < 0:
+        return size
+    pos[j] = -1
+    size -= 1
+    if i < size:
+        last = heap[size]
+        heap[i] = last
+        _sift_up(heap, pos, i, k1, k2, ids)
+        _sift_down(heap, pos, size, pos[last], k1, k2, ids)
+    return size
+
+
+@_jit
+def _aging_push(
+    j,
+    t,
+    priority,
+    enqueued,
+    waited,
+    age_interval,
+    max_age_bonus,
+    ready,
+    ready_pos,
+    ready_size,
+    rk1,
+    rk2,
+    steps,
+    steps_pos,
+    steps_size,
+    sk1,
+    sk2,
+    ids,
+):
+    # PriorityAgingScheduler._push: key for the bonus at t, and when it next steps.
+    total_wait = waited[j] + t - enqueued[j]
+    bonus = (total_wait // age_interval) * 2
+    if bonus < max_age_bonus:
+        step_at = t + age_interval - total_wait % age_interval
+        steps_size = _heap_set(steps, steps_pos, steps_size, j, step_at, 0, sk1, sk2, ids)
+    else:
+        bonus = max_age_bonus
+        steps_size = _heap_remove(steps, steps_pos, steps_size, j, sk1, sk2, ids)
+    ready_size = _heap_set(
+        ready, ready_pos, ready_size, j, -(priority[j] + bonus), enqueued[j], rk1, rk2, ids
+    )
+    return ready_size, steps_size
+
+
+@_jit
+def _mlfq_coalesce(
+    j,
+    run_start,
+    horizon,
+    quanta,
+    level,
+    epoch,
+    boost_epoch,
+    last_boost,
+    boost_interval,
+):
+    """MLFQScheduler.coalesce_quanta; returns the final slice start and last boost time."""
+    lv = level[j] if epoch[j] == boost_epoch else 0
+    bottom = quanta.size - 1
+    t = run_start
+    level_zero_since = -1
+    while True:
+        q = quanta[lv]
+        if t + q >= horizon:
+            break
+        if lv == bottom:
+            last = (horizon - 1 - t) // q
+            until_boost = last_boost + boost_interval - t
+            steps = max(1, -(-until_boost // q))
+            if steps > last:
+                t += last * q
+                break
+            t += steps * q
+        else:
+            t += q
+            lv += 1
+        if t - last_boost >= boost_interval:
+            if level_zero_since >= 0:
+                period = t - level_zero_since
+                t += (horizon - 1 - t) // period * period
+            last_boost = t
+            lv = 0
+            level_zero_since = t
+    level[j] = lv
+    epoch[j] = boost_epoch
+    return t, last_boost
+
+
+@_jit
+def _event_loop(
+    policy,
+    job_id,
+    arrival,
+    burst,
+    priority,
+    quantum,
+    coalesce,
+    age_interval,
+    max_age_bonus,
+    quanta,
+    boost_interval,
+    last_boost,
+):
+    """SimulationEngine._event_loop over job columns for one built-in scheduler."""
+    n = arrival.size
+    order = _admission_order(arrival)
+    remaining = burst.copy()
+    first_run = np.full(n, -1, dtype=np.int64)
+    completion = np.full(n, -1, dtype=np.int64)
+    done_order = np.empty(n, dtype=np.int64)
+    done = 0
+    preempts_on_quantum = policy == _RR or policy == _PRIORITY or policy == _MLFQ
+
+    # Heaps: SJF/SRTF/Priority ready queue, Priority aging steps.
+    ready = np.empty(n, dtype=np.int64)
+    ready_pos = np.full(n, -1, dtype=np.int64)
+    rk1 = np.zeros(n, dtype=np.int64)
+    rk2 = np.zeros(n, dtype=np.int64)
+    steps = np.empty(n, dtype=np.int64)
+    steps_pos = np.full(n, -1, dtype=np.int64)
+    sk1 = np.zeros(n, dtype=np.int64)
+    sk2 = np.zeros(n, dtype=np.int64)
+    steps_size = 0
+    enqueued = np.zeros(n, dtype=np.int64)
+    waited = np.zeros(n, dtype=np.int64)
+    # FIFOs as linked lists, one per level (Round Robin uses level 0), so an
+    # MLFQ boost splices whole levels onto level 0 in O(levels).
+    levels = quanta.size if policy == _MLFQ else 1
+    link = np.full(n, -1, dtype=np.int64)
+    head = np.full(levels, -1, dtype=np.int64)
+    tail = np.full(levels, -1, dtype=np.int64)
+    count = np.zeros(levels, dtype=np.int64)
+    level = np.zeros(n, dtype=np.int64)
+    epoch = np.zeros(n, dtype=np.int64)  # a job's level is 0 unless set this epoch
+    boost_epoch = 0
+    queued = 0  # ready_size for heaps, total FIFO length otherwise
+
+    now = 0
+    a = 0  # next position in order
+    cur = -1
+    run_start = 0
+    slice_ = 0
+    while a < n or cur >= 0 or queued > 0:
+        next_arrival = arrival[order[a]] if a < n else _NEVER
+        if cur >= 0:
+            if coalesce and queued == 0:
+                horizon = min(next_arrival, run_start + remaining[cur])
+                if policy == _MLFQ:
+                    t, last_boost = _mlfq_coalesce(
+                        cur,
+                        run_start,
+                        horizon,
+                        quanta,
+                        level,
+                        epoch,
+                        boost_epoch,
+                        last_boost,
+                        boost_interval,
+                    )
+                    slice_ = quanta[level[cur]]
+                else:
+                    # Scheduler.coalesce_quanta: Round Robin and Priority+Aging
+                    # re-dispatch a lone job unchanged at every boundary.
+                    t = run_start + max(0, (horizon - run_start - 1) // slice_) * slice_
+                remaining[cur] -= t - run_start
+                run_start = t
+            if preempts_on_quantum:
+                next_completion = run_start + min(slice_, remaining[cur])
+            else:
+                next_completion = run_start + remaining[cur]
+        else:
+            next_completion = _NEVER
+        if min(next_arrival, next_completion) == _NEVER:
+            break
+        now = min(next_arrival, next_completion)
+
+        back = -1  # job to hand back to the scheduler via on_job_preempted
+        if cur >= 0 and next_completion <= next_arrival:
+            remaining[cur] -= now - run_start
+            if remaining[cur] <= 0:
+                completion[cur] = now
+                done_order[done] = cur
+                done += 1
+            else:
+                back = cur
+            cur = -1
+
+        while True:
+            if back >= 0:
+                # on_job_preempted
+                if policy == _RR or policy == _MLFQ:
+                    lv = 0
+                    if policy == _MLFQ:
+                        lv = min(level[back] + 1 if epoch[back] == boost_epoch else 1, levels - 1)
+                    level[back] = lv
+                    epoch[back] = boost_epoch
+                    if tail[lv] >= 0:
+                        link[tail[lv]] = back
+                    else:
+                        head[lv] = back
+                    tail[lv] = back
+                    link[back] = -1
+                    count[lv] += 1
+                    queued += 1
+                elif policy == _PRIORITY:
+                    enqueued[back] = now
+                    queued, steps_size = _aging_push(
+                        back,
+                        now,
+                        priority,
+                        enqueued,
+                        waited,
+                        age_interval,
+                        max_age_bonus,
+                        ready,
+                        ready_pos,
+                        queued,
+                        rk1,
+                        rk2,
+                        steps,
+                        steps_pos,
+                        steps_size,
+                        sk1,
+                        sk2,
+                        job_id,
+                    )
+                else:
+                    key = burst[back] if policy == _SJF else remaining[back]
+                    queued = _heap_set(ready, ready_pos, queued, back, key, 0, rk1, rk2, job_id)
+                back = -1
+            if a == n or arrival[order[a]] != now:
+                break
+            # add_job
+            j = order[a]
+            a += 1
+            if policy == _RR or policy == _MLFQ:
+                level[j] = 0
+                epoch[j] = boost_epoch
+                if tail[0] >= 0:
+                    link[tail[0]] = j
+                else:
+                    head[0] = j
+                tail[0] = j
+                link[j] = -1
+                count[0] += 1
+                queued += 1
+            elif policy == _PRIORITY:
+                enqueued[j] = now
+                queued, steps_size = _aging_push(
+                    j,
+                    now,
+                    priority,
+                    enqueued,
+                    waited,
+                    age_interval,
+                    max_age_bonus,
+                    ready,
+                    ready_pos,
+                    queued,
+                    rk1,
+                    rk2,
+                    steps,
+                    steps_pos,
+                    steps_size,
+                    sk1,
+                    sk2,
+                    job_id,
+                )
+            else:
+                key = burst[j] if policy == _SJF else remaining[j]
+                queued = _heap_set(ready, ready_pos, queued, j, key, 0, rk1, rk2, job_id)
+            # SRTF preempts when the arrival is shorter than the running job's
+            # remaining time as of its dispatch.
+            if policy == _SRTF and cur >= 0 and remaining[j] < remaining[cur]:
+                remaining[cur] -= now - run_start
+                back = cur
+                cur = -1
+
+        if cur < 0 and queued > 0:
+            # get_next_job
+            if policy == _RR or policy == _MLFQ:
+                if policy == _MLFQ and now - last_boost >= boost_interval:
+                    last_boost = now
+                    if count[0] < queued:
+                        for lv in range(1, levels):
+                            if count[lv]:
+                                if tail[0] >= 0:
+                                    link[tail[0]] = head[lv]
+                                else:
+                                    head[0] = head[lv]
+                                tail[0] = tail[lv]
+                                count[0] += count[lv]
+                                head[lv] = -1
+                                tail[lv] = -1
+                                count[lv] = 0
+                        boost_epoch += 1
+                lv = 0
+                while count[lv] == 0:
+                    lv += 1
+                cur = head[lv]
+                head[lv] = link[cur]
+                if head[lv] < 0:
+                    tail[lv] = -1
+                count[lv] -= 1
+                queued -= 1
+                slice_ = quantum
+                if policy == _MLFQ:
+                    slice_ = quanta[level[cur] if epoch[cur] == boost_epoch else 0]
+            else:
+                if policy == _PRIORITY:
+                    while steps_size and sk1[steps[0]] <= now:
+                        queued, steps_size = _aging_push(
+                            steps[0],
+                            now,
+                            priority,
+                            enqueued,
+                            waited,
+                            age_interval,
+                            max_age_bonus,
+                            ready,
+                            ready_pos,
+                            queued,
+                            rk1,
+                            rk2,
+                            steps,
+                            steps_pos,
+                            steps_size,
+                            sk1,
+                            sk2,
+                            job_id,
+                        )
+                cur = ready[0]
+                queued = _heap_remove(ready, ready_pos, queued, cur, rk1, rk2, job_id)
+                if policy == _PRIORITY:
+                    steps_size = _heap_remove(steps, steps_pos, steps_size, cur, sk1, sk2, job_id)
+                    waited[cur] += now - enqueued[cur]
+                slice_ = quantum
+            if first_run[cur] < 0:
+                first_run[cur] = now
+            run_start = now
+
+    return first_run, completion, remaining, done_order[:done], now, last_boost
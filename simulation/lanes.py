@@ -0,0 +1,494 @@
+"""Lockstep batched simulation of many small workloads with NumPy lanes.
+
+Each lane is an independent simulation of one workload under the same
+policy. Lane state lives in arrays of shape (lanes,) and (lanes, jobs), and
+every step of the loop advances each unfinished lane by one event (its own
+next arrival, completion or quantum expiry) with array operations, so the
+Python overhead is paid per step instead of per lane-event.
+
+Supported policies are Round Robin, SJF and SRTF (and FCFS, which is Round
+Robin with a quantum no shorter than any burst). Per lane, first-run and
+completion times are exactly those of SimulationEngine.run(), including
+the admission order of same-time arrivals.
+"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Iterable, List, Sequence, Type, Union
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+from workloads.vectorized import ColumnarWorkload
+from .metrics import SimulationMetrics, metrics_from_columns
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+LANE_POLICIES = {
+    RoundRobinScheduler.name: RoundRobinScheduler,
+    SJFScheduler.name: SJFScheduler,
+    SRTFScheduler.name: SRTFScheduler,
+}
+
+_NEVER = np.iinfo(np.int64).max // 2 if np is not None else None
+
+
+@dataclass
+class LaneResults:
+    """Per-job columns of every lane, padded to (lanes, max jobs) in input order."""
+
+    scheduler_name: str
+    sizes: "np.ndarray"  # jobs per lane; columns past sizes[l] are padding
+    job_id: "np.ndarray"
+    arrival: "np.ndarray"
+    burst: "np.ndarray"
+    priority: "np.ndarray"
+    first_run: "np.ndarray"
+    completion: "np.ndarray"
+    steps: int  # loop iterations, i.e. event times in the busiest lane
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def completed_jobs(self, lane: int) -> List[Job]:
+        """The lane's jobs as SimulationEngine.run() returns them (completion order)."""
+        n = int(self.sizes[lane])
+        order = np.argsort(self.completion[lane, :n], kind="stable")
+        jobs = []
+        for c in order.tolist():
+            job = Job(
+                job_id=int(self.job_id[lane, c]),
+                arrival_time=int(self.arrival[lane, c]),
+                burst_time=int(self.burst[lane, c]),
+                priority=int(self.priority[lane, c]),
+            )
+            job.remaining_time = 0
+            job.state = "done"
+            job.first_run_time = int(self.first_run[lane, c])
+            job.completion_time = int(self.completion[lane, c])
+            jobs.append(job)
+        return jobs
+
+    def metrics(
+        self, starvation_threshold: int = 100, percentiles: Sequence[float] = ()
+    ) -> List[SimulationMetrics]:
+        """compute_metrics() of every lane."""
+        return [
+            metrics_from_columns(
+                self.arrival[lane, :n],
+                self.burst[lane, :n],
+                self.first_run[lane, :n],
+                self.completion[lane, :n],
+                starvation_threshold,
+                percentiles,
+            )
+            for lane, n in enumerate(self.sizes.tolist())
+        ]
+
+
+def run_lanes(
+    workloads: Sequence[Union[Sequence[Job], ColumnarWorkload]],
+    scheduler: Union[str, Type[Scheduler]] = RoundRobinScheduler,
+    quantum: Union[int, Sequence[int]] = 4,
+) -> LaneResults:
+    """
+    Simulate every workload under ``scheduler`` (a class or its name).
+
+    A workload is a sequence of Jobs or a ColumnarWorkload; if every one is
+    columnar, the lanes are built from their arrays without creating Jobs.
+    ``quantum`` may differ per lane, so a quantum sweep over one workload is
+    a single call with the workload repeated. SJF and SRTF ignore it, as
+    they do in SimulationEngine.
+    """
+    _require_numpy()
+    cls = _policy(scheduler)
+    lanes = len(workloads)
+    sizes = np.fromiter((len(w) for w in workloads), dtype=np.int64, count=lanes)
+    if all(isinstance(w, ColumnarWorkload) for w in workloads):
+        flat = [
+            np.concatenate([getattr(w, field) for w in workloads]) if lanes else sizes
+            for field in ("job_id", "arrival", "burst", "priority")
+        ]
+    else:
+        jobs = [j for w in workloads for j in _iter_jobs(w)]
+        flat = [
+            np.fromiter(map(attrgetter(attr), jobs), dtype=np.int64, count=len(jobs))
+            for attr in ("job_id", "arrival_time", "burst_time", "priority")
+        ]
+    width = max(1, int(sizes.max())) if lanes else 1
+    row = np.repeat(np.arange(lanes), sizes)
+    col = np.arange(len(row)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    grids = []
+    for values, fill in zip(flat, (0, _NEVER, 0, 0)):
+        grid = np.full((lanes, width), fill, dtype=np.int64)
+        grid[row, col] = values
+        grids.append(grid)
+    return _run(cls, sizes, *grids, quantum)
+
+
+def run_lane_arrays(
+    arrival,
+    burst,
+    scheduler: Union[str, Type[Scheduler]] = RoundRobinScheduler,
+    quantum: Union[int, Sequence[int]] = 4,
+    job_id=None,
+    priority=None,
+    sizes=None,
+) -> LaneResults:
+    """
+    run_lanes() on (lanes, jobs) arrays, e.g. many seeds drawn in one call.
+
+    Row ``l`` holds lane l's jobs in input order, and only its first
+    ``sizes[l]`` columns are used (all of them by default). ``job_id``
+    defaults to the column index and ``priority`` to 0.
+    """
+    _require_numpy()
+    cls = _policy(scheduler)
+    arrival = np.array(arrival, dtype=np.int64, ndmin=2)
+    lanes, width = arrival.shape
+    if job_id is None:
+        job_id = np.arange(width)
+    if priority is None:
+        priority = 0
+    grids = [
+        np.array(np.broadcast_to(np.asarray(values, dtype=np.int64), (lanes, width)))
+        for values in (job_id, burst, priority)
+    ]
+    if sizes is None:
+        sizes = np.full(lanes, width, dtype=np.int64)
+    else:
+        sizes = np.broadcast_to(np.asarray(sizes, dtype=np.int64), (lanes,)).copy()
+        if ((sizes < 0) | (sizes > width)).any():
+            raise ValueError(f"sizes must be between 0 and {width}")
+        padding = np.arange(width) >= sizes[:, None]
+        arrival[padding] = _NEVER
+        for grid in grids:
+            grid[padding] = 0
+    job_id, burst, priority = grids
+    if lanes and width:
+        return _run(cls, sizes, job_id, arrival, burst, priority, quantum)
+    # No jobs at all; _simulate needs at least one column.
+    return run_lanes([[] for _ in range(lanes)], cls, quantum)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for run_lanes(). Install with: pip install numpy")
+
+
+def _policy(scheduler: Union[str, Type[Scheduler]]) -> Type[Scheduler]:
+    cls = LANE_POLICIES.get(scheduler) if isinstance(scheduler, str) else scheduler
+    if cls not in LANE_POLICIES.values():
+        raise ValueError(
+            f"run_lanes supports {', '.join(LANE_POLICIES)}; got {getattr(scheduler, 'name', scheduler)}"
+        )
+    return cls
+
+
+def _iter_jobs(workload: Union[Sequence[Job], ColumnarWorkload]) -> Iterable[Job]:
+    return workload.iter_jobs() if isinstance(workload, ColumnarWorkload) else workload
+
+
+def _run(cls, sizes, job_id, arrival, burst, priority, quantum) -> LaneResults:
+    quanta = np.broadcast_to(np.asarray(quantum, dtype=np.int64), sizes.shape).copy()
+    if (quanta < 1).any():
+        raise ValueError("quantum must be >= 1")
+    first_run, completion, steps = _simulate(cls, job_id, arrival, burst, sizes, quanta)
+    return LaneResults(
+        scheduler_name=cls.name,
+        sizes=sizes,
+        job_id=job_id,
+        arrival=arrival,
+        burst=burst,
+        priority=priority,
+        first_run=first_run,
+        completion=completion,
+        steps=steps,
+    )
+
+
+def _admission_order(arrival: "np.ndarray", sizes: "np.ndarray") -> "np.ndarray":
+    """
+    Column of the job each lane admits k-th, as the engine's arrival heap pops them.
+
+    Events compare by time only, so same-time arrivals come out in heapq's
+    order rather than input order; lanes with such ties replay the heap.
+    """
+    order = np.argsort(arrival, axis=1, kind="stable")
+    ordered = np.take_along_axis(arrival, order, axis=1)
+    real = np.arange(1, arrival.shape[1]) < sizes[:, None]  # pairs of real jobs
+    ties = (np.diff(ordered, axis=1) == 0) & real
+    tied = np.flatnonzero(ties.any(axis=1))
+    if tied.size:
+        ties = ties[tied]
+        # Pops after a lane's last tie follow the sorted order, so the replay
+        # stops there.
+        pops = ties.shape[1] + 1 - np.argmax(ties[:, ::-1], axis=1)
+        # Dense ranks of the times compare the same way and fit next to a column.
+        dense = np.zeros((tied.size, arrival.shape[1]), dtype=np.int64)
+        np.cumsum(~ties & real[tied], axis=1, out=dense[:, 1:])
+        ranks = np.empty_like(dense)
+        np.put_along_axis(ranks, order[tied], dense, axis=1)
+        replayed = order[tied]
+        head = np.arange(arrival.shape[1]) < pops[:, None]
+        replayed[head] = _heap_pop_order(ranks, sizes[tied], pops)[head]
+        order[tied] = replayed
+    return order
+
+
+def _heap_pop_order(ranks: "np.ndarray", sizes: "np.ndarray", pops: "np.ndarray") -> "np.ndarray":
+    """
+    Per row, the columns heapq.heapify() then pops[r] heappop()s yield.
+
+    ``ranks`` stands in for the times (equal times, equal ranks) and the
+    first sizes[r] columns of row r take part. All rows run heapq's
+    algorithm in lockstep, comparing ranks with ``<`` only. Entries past
+    pops[r] are unspecified.
+    """
+    lanes, width = ranks.shape
+    shift = width.bit_length()
+    column = (1 << shift) - 1
+    sentinel = width << shift  # ranks past the end of every heap, above any real one
+    by_pops = np.argsort(-pops, kind="stable")  # rows still popping are a prefix
+    ranked = pops[by_pops]
+    size = sizes[by_pops]
+    # heap[p * lanes + r] is slot p of row by_pops[r]: lockstep accesses to
+    # one slot are contiguous. Entries are rank, then column.
+    heap = np.full((width + 1, lanes), sentinel, dtype=np.int64)
+    heap[:width] = ((ranks[by_pops] << shift) | np.arange(width)).T
+    heap[np.arange(width + 1)[:, None] >= size] = sentinel
+    heap = heap.ravel()
+    popped = np.zeros((width, lanes), dtype=np.int64)  # popped[j, r]: r's j-th pop
+
+    # heapify() sifts every inner slot after its children. Slots of one depth
+    # head disjoint subtrees, so a whole depth is sifted at once, deepest first.
+    inner = int(size.max()) // 2
+    for depth in range(inner.bit_length() - 1, -1, -1):
+        slots = np.arange((1 << depth) - 1, min((2 << depth) - 1, inner))
+        pairs = np.flatnonzero(size // 2 > slots[:, None])  # over (slot, row)
+        pos, r = slots[pairs // lanes], pairs % lanes
+        _siftup(heap, lanes, ~column, r, pos, size[r])
+    # Rows with pops > j are the first k.
+    for j in range(int(ranked[0])):
+        k = int(np.searchsorted(-ranked, -j, side="left"))
+        popped[j, :k] = heap[:k] & column
+        end = size[:k] - j - 1  # heap length after this pop
+        r = np.flatnonzero(end > 0)
+        end = end[r]
+        last = end * lanes + r
+        heap[r] = heap[last]
+        heap[last] = sentinel
+        _siftup(heap, lanes, ~column, r, np.zeros(r.size, dtype=np.int64), end)
+    order = np.empty_like(ranks)
+    order[by_pops] = popped.T
+    return order
+
+
+def _siftup(heap, lanes, rank_bits, r, pos, end) -> None:
+    """
+    heapq's _siftup at ``pos`` in the heaps of rows ``r`` (see _heap_pop_order).
+
+    Moves the smaller child into the hole down to a leaf, then lets the
+    displaced item rise back towards ``pos``. Slots from ``end`` on hold the
+    sentinel, so a missing right child is never the smaller one.
+    """
+    # Work on flat slots: slot p of row r is p * lanes + r, its left child
+    # is twice that plus lanes - r, and it has children while p < end // 2.
+    at = pos * lanes + r
+    start = at.copy()
+    item = heap[at]
+    step = lanes - r
+    leaf = (end >> 1) * lanes + r
+    live = np.flatnonzero(at < leaf)
+    while live.size:
+        whole = live.size == at.size
+        hole = at if whole else at[live]
+        child = 2 * hole + (step if whole else step[live])
+        left_item, right_item = heap[child], heap[child + lanes]
+        use_right = left_item >= (right_item & rank_bits)  # not (left rank < right rank)
+        heap[hole] = np.where(use_right, right_item, left_item)
+        child += use_right * lanes
+        if whole:
+            at = child
+            live = np.flatnonzero(child < leaf)
+        else:
+            at[live] = child
+            live = live[child < leaf[live]]
+    live = np.flatnonzero(at > start)
+    while live.size:
+        hole, lr = at[live], r[live]
+        parent = ((hole - lr) // lanes - 1 >> 1) * lanes + lr
+        above = heap[parent]
+        up = np.flatnonzero(item[live] < (above & rank_bits))  # item rank < parent rank
+        live, hole, parent, above = live[up], hole[up], parent[up], above[up]
+        heap[hole] = above
+        at[live] = parent
+        live = live[parent > start[live]]
+    heap[at] = item
+
+
+def _group_ends(times: "np.ndarray") -> "np.ndarray":
+    """For sorted rows, the index just past the run of equal times starting at each column."""
+    lanes, width = times.shape
+    last = np.ones((lanes, width), dtype=bool)
+    last[:, :-1] = times[:, 1:] != times[:, :-1]
+    ends = np.where(last, np.arange(1, width + 1), width)
+    return np.minimum.accumulate(ends[:, ::-1], axis=1)[:, ::-1]
+
+
+def _simulate(cls, job_id, arrival, burst, sizes, quanta):
+    lanes, width = arrival.shape
+    round_robin = cls is RoundRobinScheduler
+    preempts_on_arrival = cls is SRTFScheduler
+
+    if round_robin:
+        order = _admission_order(arrival, sizes)
+    else:  # the ready queue is keyed by (time, job_id), so admission order is irrelevant
+        order = np.argsort(arrival, axis=1, kind="stable")
+    # Per-job state is stored column-major and read and written at
+    # column * lanes + lane: lanes at similar progress touch nearby memory.
+    # admit_time has one extra _NEVER column, so a lane's next arrival can
+    # be read at sizes[l].
+    admit_time = np.full((width + 1, lanes), _NEVER, dtype=np.int64)
+    admit_time[:width] = np.take_along_axis(arrival, order, axis=1).T
+    group_end = _group_ends(admit_time[:width].T).T.ravel()
+    admit_time = admit_time.ravel()
+    order = order.T.ravel()
+    remaining = burst.T.flatten()
+    first_run = np.full(width * lanes, -1, dtype=np.int64)
+    completion = np.full(width * lanes, -1, dtype=np.int64)
+    if round_robin:
+        fifo = np.zeros(width * lanes, dtype=np.int64)  # ring buffer of columns per lane
+    else:
+        # Heap order is (key, job_id): rank job ids within each lane to break
+        # ties, and pack both into one int64 per queued job (_NEVER if absent).
+        by_id = np.argsort(job_id, axis=1, kind="stable")
+        column_of = by_id.T.ravel()  # column of the job with each id rank
+        id_rank = np.argsort(by_id, axis=1).T.ravel()
+        key = remaining if preempts_on_arrival else burst.T.ravel()
+        ready = np.full((width, lanes), _NEVER, dtype=np.int64)
+        ready_flat = ready.ravel()
+
+    # Per-lane state, indexed by position among the live lanes. Finished
+    # lanes are no-ops (their next event is _NEVER) and are dropped now and then.
+    lane = np.flatnonzero(sizes > 0)
+    size = sizes[lane]
+    quantum = quanta[lane]
+    admitted = np.zeros(lane.size, dtype=np.int64)  # index into order of the next arrival
+    current = np.full(lane.size, -1, dtype=np.int64)  # running column, -1 = idle
+    current_left = np.zeros(lane.size, dtype=np.int64)  # its remaining time as of run_start
+    run_start = np.zeros(lane.size, dtype=np.int64)
+    queued = np.zeros(lane.size, dtype=np.int64)  # ready-queue length
+    head = np.zeros(lane.size, dtype=np.int64)  # Round Robin: FIFO read position
+
+    def enqueue(at, ln, cs, offset=0):
+        # ``offset`` orders several jobs pushed onto one lane's FIFO at once.
+        if round_robin:
+            fifo[(head[at] + queued[at] + offset) % width * lanes + ln] = cs
+        else:
+            slot = cs * lanes + ln
+            ready_flat[slot] = key[slot] * width + id_rank[slot]
+
+    steps = 0
+    while lane.size:
+        if steps % 16 == 15:
+            live = (current >= 0) | (queued > 0) | (admitted < size)
+            if not live.all():
+                lane, size, quantum, admitted, current, current_left, run_start, queued, head = (
+                    a[live]
+                    for a in (
+                        lane, size, quantum, admitted, current, current_left, run_start, queued, head
+                    )
+                )
+                if not lane.size:
+                    break
+        next_arrival = admit_time[admitted * lanes + lane]
+        running = current >= 0
+        if round_robin:
+            # Quantum coalescing as in the engine: a lone job skips the
+            # boundaries before the next arrival or its own completion.
+            lone = np.flatnonzero(running & (queued == 0))
+            if lone.size:
+                start, q = run_start[lone], quantum[lone]
+                reach = np.minimum(next_arrival[lone], start + current_left[lone]) - start - 1
+                skip = reach // q * q
+                run_start[lone] += skip
+                current_left[lone] -= skip
+            duration = np.minimum(quantum, current_left)
+        else:
+            duration = current_left
+        next_completion = np.where(running, run_start + duration, _NEVER)
+        now = np.minimum(next_arrival, next_completion)
+        if now.min() >= _NEVER:
+            break
+        steps += 1
+
+        # Completion or quantum expiry, before same-time arrivals.
+        ends = np.flatnonzero(running & (next_completion <= next_arrival))
+        if ends.size:
+            el, ec, t = lane[ends], current[ends], now[ends]
+            slot = ec * lanes + el
+            rest = current_left[ends] - (t - run_start[ends])
+            remaining[slot] = rest
+            completion[slot] = np.where(rest > 0, -1, t)
+            if round_robin:  # only quanta expire; SJF and SRTF run a job to completion
+                # Finished jobs land past the FIFO's tail, where nothing reads them.
+                enqueue(ends, el, ec)
+                queued[ends] += rest > 0
+            current[ends] = -1
+
+        # Admit every arrival at ``now`` at once, in admission order.
+        due = np.flatnonzero((next_arrival == now) & (now < _NEVER))
+        if due.size:
+            first, dl = admitted[due], lane[due]
+            end = np.minimum(group_end[first * lanes + dl], size[due])
+            count = end - first
+            starts = np.cumsum(count) - count
+            offset = np.arange(int(count.sum())) - np.repeat(starts, count)
+            at = np.repeat(due, count)
+            ln = np.repeat(dl, count)
+            rc = order[(np.repeat(first, count) + offset) * lanes + ln]
+            enqueue(at, ln, rc, offset)
+            queued[due] += count
+            admitted[due] = end
+            if preempts_on_arrival:
+                # Preempt if any arrival is shorter than the running job's
+                # remaining time as of its dispatch (the engine's comparison).
+                shortest = np.minimum.reduceat(remaining[rc * lanes + ln], starts)
+                pcur = current[due]
+                hit = (pcur >= 0) & (shortest < current_left[due])
+                if hit.any():
+                    p, pc = due[hit], pcur[hit]
+                    pl = lane[p]
+                    remaining[pc * lanes + pl] = current_left[p] - (now[p] - run_start[p])
+                    enqueue(p, pl, pc)
+                    queued[p] += 1
+                    current[p] = -1
+
+        # Dispatch on idle lanes with a ready job.
+        idle = np.flatnonzero((current < 0) & (queued > 0))
+        if idle.size:
+            il = lane[idle]
+            if round_robin:
+                dc = fifo[head[idle] % width * lanes + il]
+                head[idle] += 1
+            else:
+                best = ready.min(axis=0)[il]  # a contiguous pass beats gathering columns
+                dc = column_of[best % width * lanes + il]
+                ready_flat[dc * lanes + il] = _NEVER
+            queued[idle] -= 1
+            t = now[idle]
+            slot = dc * lanes + il
+            started = first_run[slot]
+            first_run[slot] = np.where(started < 0, t, started)
+            run_start[idle] = t
+            current[idle] = dc
+            current_left[idle] = remaining[slot]
+
+    first_run = np.ascontiguousarray(first_run.reshape(width, lanes).T)
+    completion = np.ascontiguousarray(completion.reshape(width, lanes).T)
+    return first_run, completion, steps
@@ -1,10 +1,18 @@
 """Metrics computation for scheduling evaluation."""
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence
 
 from models.job import Job
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+_JOB_COLUMNS = ("arrival_time", "burst_time", "first_run_time", "completion_time")
+
 
 @dataclass
 class SimulationMetrics:
@@ -17,14 +25,21 @@ class SimulationMetrics:
     lifetime_starvation_rate: float  # fraction of jobs with total wait > threshold
     total_jobs: int
     completed_jobs: int
+    # Extra percentiles requested from compute_metrics, keyed as given (e.g. 99.9).
+    turnaround_percentiles: Dict[float, float] = field(default_factory=dict)
+    response_percentiles: Dict[float, float] = field(default_factory=dict)
 
 
 def compute_metrics(
     completed_jobs: List[Job],
     starvation_threshold: int = 100,
+    percentiles: Sequence[float] = (),
 ) -> SimulationMetrics:
     """
     Compute all evaluation metrics from completed jobs.
+
+    ``percentiles`` (in percent, e.g. ``(50, 90, 99, 99.9)``) are reported for
+    both turnaround and response time using the same rank rule as p95.
     """
     if not completed_jobs:
         return SimulationMetrics(
@@ -35,8 +50,103 @@ def compute_metrics(
             lifetime_starvation_rate=0.0,
             total_jobs=0,
             completed_jobs=0,
+            turnaround_percentiles={p: 0.0 for p in percentiles},
+            response_percentiles={p: 0.0 for p in percentiles},
         )
 
+    # Pull each column out with a C-level scan instead of repeated property calls.
+    n = len(completed_jobs)
+    if np is not None:
+        try:
+            columns = [
+                np.fromiter(map(attrgetter(name), completed_jobs), dtype=np.int64, count=n)
+                for name in _JOB_COLUMNS
+            ]
+        except TypeError:  # some job has no first_run_time/completion_time
+            return _compute_metrics_partial(completed_jobs, starvation_threshold, percentiles)
+    else:
+        columns = [list(map(attrgetter(name), completed_jobs)) for name in _JOB_COLUMNS]
+        if None in columns[2] or None in columns[3]:
+            return _compute_metrics_partial(completed_jobs, starvation_threshold, percentiles)
+    return metrics_from_columns(*columns, starvation_threshold, percentiles)
+
+
+def _rank(n: int, fraction: float) -> int:
+    return min(int(n * fraction), n - 1)
+
+
+def metrics_from_columns(
+    arrival: Sequence[int],
+    burst: Sequence[int],
+    first_run: Sequence[int],
+    completion: Sequence[int],
+    starvation_threshold: int = 100,
+    percentiles: Sequence[float] = (),
+) -> SimulationMetrics:
+    """
+    Compute metrics from per-job columns of finished jobs (lists or arrays).
+
+    Uses NumPy when available: sums and starvation counts are vectorized and
+    every percentile, p95 included, comes from one ``np.partition`` call
+    instead of a full sort. Results match the pure-Python path exactly.
+    """
+    n = len(arrival)
+    if n == 0:
+        return compute_metrics([], starvation_threshold, percentiles)
+    ranks = [_rank(n, 0.95)] + [_rank(n, p / 100) for p in percentiles]
+
+    if np is not None:
+        a = np.asarray(arrival, dtype=np.int64)
+        tt = np.asarray(completion, dtype=np.int64) - a
+        rt = np.asarray(first_run, dtype=np.int64) - a
+        sum_tt = int(tt.sum())
+        sum_rt = int(rt.sum())
+        starved = int(np.count_nonzero(rt > starvation_threshold))
+        life_starved = int(
+            np.count_nonzero(tt - np.asarray(burst, dtype=np.int64) > starvation_threshold)
+        )
+        kth = sorted(set(ranks))
+        tt_sel = np.partition(tt, kth)
+        tt_at = [int(tt_sel[r]) for r in ranks]
+        if percentiles:
+            rt_sel = np.partition(rt, kth)
+            rt_at = [int(rt_sel[r]) for r in ranks]
+        else:
+            rt_at = []
+    else:
+        tt_list = [c - a for c, a in zip(completion, arrival)]
+        rt_list = [f - a for f, a in zip(first_run, arrival)]
+        sum_tt = sum(tt_list)
+        sum_rt = sum(rt_list)
+        starved = sum(1 for r in rt_list if r > starvation_threshold)
+        life_starved = sum(1 for t, b in zip(tt_list, burst) if t - b > starvation_threshold)
+        tt_list.sort()
+        tt_at = [tt_list[r] for r in ranks]
+        if percentiles:
+            rt_list.sort()
+            rt_at = [rt_list[r] for r in ranks]
+        else:
+            rt_at = []
+
+    return SimulationMetrics(
+        avg_turnaround_time=sum_tt / n,
+        avg_response_time=sum_rt / n,
+        tail_latency_p95=tt_at[0],
+        starvation_rate=starved / n,
+        lifetime_starvation_rate=life_starved / n,
+        total_jobs=n,
+        completed_jobs=n,
+        turnaround_percentiles=dict(zip(percentiles, tt_at[1:])),
+        response_percentiles=dict(zip(percentiles, rt_at[1:])),
+    )
+
+
+def _compute_metrics_partial(
+    completed_jobs: List[Job],
+    starvation_threshold: int,
+    percentiles: Sequence[float],
+) -> SimulationMetrics:
+    """Reference path for job lists where some jobs never ran or never finished."""
     turnaround_times = []
     response_times = []
     for j in completed_jobs:
@@ -52,6 +162,7 @@ def compute_metrics(
     p95_idx = int(len(sorted_tt) * 0.95)
     p95_idx = min(p95_idx, len(sorted_tt) - 1)
     tail_p95 = sorted_tt[p95_idx] if sorted_tt else 0.0
+    sorted_rt = sorted(response_times) if response_times else [0]
 
     # Starvation (first-run): jobs whose wait before first run > threshold.
     starvation_count = 0
@@ -82,4 +193,10 @@ def compute_metrics(
         lifetime_starvation_rate=lifetime_starvation_rate,
         total_jobs=len(completed_jobs),
         completed_jobs=len(completed_jobs),
+        turnaround_percentiles={
+            p: sorted_tt[_rank(len(sorted_tt), p / 100)] for p in percentiles
+        },
+        response_percentiles={
+            p: sorted_rt[_rank(len(sorted_rt), p / 100)] for p in percentiles
+        },
     )
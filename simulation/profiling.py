@@ -0,0 +1,154 @@
+"""Opt-in instrumentation of scheduler callbacks and the engine loop."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict
+
+from schedulers.base import Scheduler
+from .accumulator import LogLinearHistogram
+
+PROFILED_METHODS = (
+    "add_job",
+    "get_next_job",
+    "has_ready_jobs",
+    "on_job_preempted",
+    "on_job_completed",
+    "should_preempt",
+    "get_quantum",
+    "coalesce_quanta",
+)
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    total_ns: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+@dataclass
+class ProfileReport:
+    """Where one simulation run spent its time."""
+
+    scheduler_name: str
+    wall_time: float = 0.0
+    loop_iterations: int = 0
+    arrivals: int = 0
+    dispatches: int = 0
+    preemptions: int = 0
+    calls: Dict[str, CallStats] = field(default_factory=dict)
+    ready_queue_percentiles: Dict[float, int] = field(default_factory=dict)
+    max_ready_queue: int = 0
+
+    @property
+    def completions(self) -> int:
+        # Every dispatch ends in either a preemption or a completion.
+        return self.dispatches - self.preemptions
+
+    @property
+    def events(self) -> int:
+        return self.arrivals + self.dispatches + self.preemptions + self.completions
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_time if self.wall_time > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"{self.scheduler_name}: {self.wall_time * 1000:.1f} ms, "
+            f"{self.loop_iterations} loop iterations, {self.events} events "
+            f"({self.events_per_second:,.0f}/s)",
+            "  ready queue: "
+            + ", ".join(f"p{p:g}={v}" for p, v in self.ready_queue_percentiles.items())
+            + f", max={self.max_ready_queue}",
+            f"  {'callback':<18} {'calls':>10} {'total ms':>10} {'mean us':>9}",
+        ]
+        for name, stats in self.calls.items():
+            if not stats.calls:
+                continue
+            lines.append(
+                f"  {name:<18} {stats.calls:>10} {stats.total_ns / 1e6:>10.2f}"
+                f" {stats.mean_ns / 1e3:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+class SchedulerProfiler:
+    """
+    Counts and times scheduler callbacks by shadowing them on the instance.
+
+    attach() installs timing wrappers as instance attributes for every method in
+    PROFILED_METHODS the scheduler has; detach() removes them again, so an
+    unprofiled scheduler runs its methods untouched. The ready-queue length is
+    derived from outermost add/preempt/dispatch calls, so schedulers need no
+    support for it.
+    """
+
+    QUEUE_PERCENTILES = (50.0, 90.0, 99.0)
+
+    def __init__(self, scheduler: Scheduler) -> None:
+        self.scheduler = scheduler
+        self.report = ProfileReport(scheduler_name=scheduler.name)
+        self._ready = 0
+        self._depth = 0
+        self._queue_lengths = LogLinearHistogram()
+        self._started = 0.0
+
+    def attach(self) -> None:
+        for name in PROFILED_METHODS:
+            method = getattr(self.scheduler, name, None)
+            if method is not None:
+                stats = self.report.calls.setdefault(name, CallStats())
+                setattr(self.scheduler, name, self._wrap(name, method, stats))
+        self._started = time.perf_counter()
+
+    def detach(self) -> ProfileReport:
+        self.report.wall_time = time.perf_counter() - self._started
+        for name in self.report.calls:
+            self.scheduler.__dict__.pop(name, None)
+        hist = self._queue_lengths
+        self.report.ready_queue_percentiles = {
+            p: hist.percentile(p / 100) for p in self.QUEUE_PERCENTILES
+        }
+        return self.report
+
+    def on_iteration(self) -> None:
+        """Called by the engine once per event-loop iteration."""
+        self.report.loop_iterations += 1
+        ready = self._ready
+        self._queue_lengths.add(ready)
+        if ready > self.report.max_ready_queue:
+            self.report.max_ready_queue = ready
+
+    def _wrap(self, name: str, method: Callable[..., Any], stats: CallStats) -> Callable[..., Any]:
+        clock = time.perf_counter_ns
+        report = self.report
+        delta = {"add_job": 1, "on_job_preempted": 1}.get(name, 0)
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            outermost = self._depth == 0
+            self._depth += 1
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                stats.total_ns += clock() - start
+                stats.calls += 1
+                self._depth -= 1
+            if outermost:
+                if delta:
+                    self._ready += delta
+                    if name == "add_job":
+                        report.arrivals += 1
+                    else:
+                        report.preemptions += 1
+                elif name == "get_next_job" and result is not None:
+                    self._ready -= 1
+                    report.dispatches += 1
+            return result
+
+        return timed
+
@@ -0,0 +1,173 @@
+"""Compact schedule traces: fixed-width (time, job_id, event) records in typed arrays."""
+
+import mmap
+import os
+import struct
+from array import array
+from enum import IntEnum
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+MAGIC = b"SCHTRACE"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # magic, version, int64 fields per record
+FIELDS = 3  # time, job_id, code
+
+
+class TraceEvent(IntEnum):
+    ARRIVAL = 0
+    DISPATCH = 1
+    PREEMPT = 2
+    COMPLETE = 3
+    # The running job kept the CPU across skipped quantum boundaries (see
+    # Scheduler.coalesce_quanta); the record's time is the last boundary.
+    COALESCE = 4
+
+
+class TraceRecorder:
+    """
+    Append-only trace buffer of int64 (time, job_id, code) triples.
+
+    Records go into a preallocated ``array('q')`` chunk. With ``path`` set, a
+    full chunk is written to the file and reused, so memory stays at one chunk
+    for arbitrarily long runs; otherwise the chunk doubles in place.
+    """
+
+    def __init__(self, path: Optional[str] = None, capacity: int = 1 << 16) -> None:
+        self.path = path
+        self.capacity = capacity
+        self._buf = array("q", bytes(8 * FIELDS * capacity))
+        self._pos = 0  # next free slot in _buf (in int64 units)
+        self._flushed = 0  # records already written to the file
+        self._file = None
+        if path is not None:
+            self._file = open(path, "wb")
+            self._file.write(HEADER.pack(MAGIC, VERSION, FIELDS))
+
+    def record(self, time: int, job_id: int, code: int) -> None:
+        pos = self._pos
+        if pos == len(self._buf):
+            self._make_room()
+            pos = self._pos
+        buf = self._buf
+        buf[pos] = time
+        buf[pos + 1] = job_id
+        buf[pos + 2] = code
+        self._pos = pos + FIELDS
+
+    def _make_room(self) -> None:
+        if self._file is not None:
+            self.flush()
+        else:
+            self._buf.extend(array("q", bytes(8 * len(self._buf))))
+
+    def flush(self) -> None:
+        """Write buffered records to the trace file (no-op for in-memory traces)."""
+        if self._file is None or not self._pos:
+            return
+        self._file.write(memoryview(self._buf)[: self._pos])
+        self._file.flush()
+        self._flushed += self._pos // FIELDS
+        self._pos = 0
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self._flushed + self._pos // FIELDS
+
+    def reader(self) -> "TraceReader":
+        """
+        Reader over the recorded trace (flushes and closes a file-backed trace first).
+
+        An in-memory trace is read from a copy, so recording can go on (and
+        grow the buffer) while the reader is open.
+        """
+        if self.path is not None:
+            self.close()
+            return TraceReader.open(self.path)
+        return TraceReader(memoryview(self._buf[: self._pos]))
+
+
+class TraceReader:
+    """Zero-copy view over trace records, backed by a buffer or a memory-mapped file."""
+
+    def __init__(self, buffer: memoryview, _mmap: Optional[mmap.mmap] = None) -> None:
+        self._mmap = _mmap
+        self._raw = buffer
+        self._flat = buffer if buffer.format == "q" else buffer.cast("q")
+
+    @classmethod
+    def open(cls, path: str) -> "TraceReader":
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if size == HEADER.size:  # header only; mmap of the empty body is not allowed
+                header = f.read(HEADER.size)
+                _check_header(header)
+                return cls(memoryview(array("q")))
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(mm[: HEADER.size])
+        return cls(memoryview(mm)[HEADER.size :], _mmap=mm)
+
+    def __len__(self) -> int:
+        return len(self._flat) // FIELDS
+
+    def __getitem__(self, idx: int) -> Tuple[int, int, TraceEvent]:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("trace record index out of range")
+        base = idx * FIELDS
+        flat = self._flat
+        return flat[base], flat[base + 1], TraceEvent(flat[base + 2])
+
+    def __iter__(self) -> Iterator[Tuple[int, int, TraceEvent]]:
+        flat = self._flat
+        for base in range(0, len(flat) - FIELDS + 1, FIELDS):
+            yield flat[base], flat[base + 1], TraceEvent(flat[base + 2])
+
+    def as_array(self):
+        """(n, 3) int64 NumPy view of time, job_id, code without copying."""
+        if np is None:
+            raise RuntimeError("numpy is required for as_array(). Install with: pip install numpy")
+        return np.frombuffer(self._flat, dtype=np.int64).reshape(-1, FIELDS)
+
+    def close(self) -> None:
+        self._flat.release()
+        self._raw.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _check_header(header: bytes) -> None:
+    magic, version, fields = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION or fields != FIELDS:
+        raise ValueError("Not a scheduling trace file (bad header)")
+
+
+def gantt_segments(reader: TraceReader) -> List[Tuple[int, int, int]]:
+    """Collapse a trace into (job_id, start, end) CPU intervals for Gantt charts."""
+    segments: List[Tuple[int, int, int]] = []
+    running: Optional[Tuple[int, int]] = None  # (job_id, start)
+    for time, job_id, code in reader:
+        if code == TraceEvent.DISPATCH:
+            running = (job_id, time)
+        elif code in (TraceEvent.PREEMPT, TraceEvent.COMPLETE) and running is not None:
+            if time > running[1]:
+                segments.append((running[0], running[1], time))
+            running = None
+    return segments
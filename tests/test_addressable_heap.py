@@ -0,0 +1,65 @@
+"""AddressableHeap against a sorted-list model, including duplicate job ids."""
+
+import random
+
+import pytest
+
+from models.job import Job
+from schedulers.addressable_heap import AddressableHeap
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+from simulation.engine import SimulationEngine
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_sorted_model(seed):
+    rng = random.Random(seed)
+    heap: AddressableHeap[int] = AddressableHeap()
+    model = []  # [key, job_id, seq, item]; the last entry per job_id is addressable
+    seq = 0
+
+    addressable = {}  # job_id -> seq of the entry its job_id methods act on
+    for _ in range(400):
+        op = rng.random()
+        job_id = rng.randrange(12)
+        target = addressable.get(job_id)
+        if op < 0.4 or not model:
+            key = rng.randrange(6)
+            heap.push(job_id, key, seq)
+            model.append([key, job_id, seq, seq])
+            addressable[job_id] = seq
+            seq += 1
+        elif op < 0.65:
+            entry = min(model)
+            model.remove(entry)
+            if addressable.get(entry[1]) == entry[2]:
+                del addressable[entry[1]]
+            assert heap.pop() == (entry[0], entry[1], entry[3])
+        elif op < 0.85 and target is not None:
+            key = rng.randrange(6)
+            heap.update(job_id, key)
+            entry = next(e for e in model if e[2] == target)
+            if entry[0] != key:
+                entry[0], entry[2] = key, seq
+                addressable[job_id] = seq
+                seq += 1
+        elif target is not None:
+            entry = next(e for e in model if e[2] == target)
+            model.remove(entry)
+            del addressable[job_id]
+            assert heap.remove(job_id) == entry[3]
+        assert len(heap) == len(model)
+        assert (job_id in heap) == (job_id in addressable)
+        if model:
+            key, top_id, _, item = min(model)
+            assert heap.peek() == (key, top_id, item)
+
+
+@pytest.mark.parametrize(
+    "scheduler, completions",
+    [(SJFScheduler, [4, 6, 10, 13, 17]), (SRTFScheduler, [3, 6, 10, 13, 17])],
+)
+def test_duplicate_job_ids_are_scheduled(scheduler, completions):
+    # Equal (burst, job_id) pairs used to compare Job objects in the tuple heap.
+    jobs = [Job(1, 0, 4), Job(1, 0, 4), Job(1, 1, 2), Job(2, 1, 4), Job(1, 9, 3)]
+    done = SimulationEngine(scheduler(), quantum=2).run(jobs)
+    assert sorted(j.completion_time for j in done) == completions
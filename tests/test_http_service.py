@@ -0,0 +1,47 @@
+"""SimulationHTTPServer status codes over a real loopback socket."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from platform_ui.http_service import SimulationHTTPServer
+
+
+@pytest.fixture
+def server():
+    # A zero timeout expires every wait on the process pool.
+    server = SimulationHTTPServer(port=0, workers=1, timeout=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _post(server, body):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_port}/simulate", data=json.dumps(body).encode("utf-8")
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as err:
+        return err.code, json.load(err)
+
+
+def test_wait_timeout_is_504(server):
+    jobs = [{"arrival_time": i, "burst_time": 5} for i in range(2000)]
+    status, body = _post(server, {"workload": {"jobs": jobs}, "schedulers": ["SJF"]})
+    assert status == 504, body
+    assert "timed out" in body["error"]
+    assert server.service.counters()["failed"] == 1
+
+
+def test_bad_params_are_400(server):
+    body = {"workload": {"jobs": [{"arrival_time": 0, "burst_time": 1}]}}
+    body["schedulers"] = [{"name": "MLFQ", "params": {"quanta": [0]}}]
+    assert _post(server, body)[0] == 400
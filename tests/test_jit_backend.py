@@ -0,0 +1,93 @@
+"""backend="numba" must schedule exactly like the Python event loop.
+
+With Numba installed the compiled loop is checked. Without it the same
+kernels run as plain Python, which still checks their logic.
+"""
+
+import random
+from typing import Callable, List
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.mlfq import MLFQScheduler
+from schedulers.priority_aging import PriorityAgingScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+from simulation import jit_backend
+from simulation.engine import SimulationEngine
+from simulation.trace import TraceRecorder
+
+RUNS = 200
+
+SCHEDULERS: List[Callable[[random.Random], Scheduler]] = [
+    lambda rng: RoundRobinScheduler(),
+    lambda rng: SJFScheduler(),
+    lambda rng: SRTFScheduler(),
+    lambda rng: PriorityAgingScheduler(rng.randint(1, 8), rng.randint(0, 12)),
+    lambda rng: MLFQScheduler(
+        rng.randint(1, 4),
+        [rng.randint(1, 6) for _ in range(rng.randint(1, 4))],
+        rng.randint(1, 60),
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def kernels(monkeypatch):
+    """Run the kernels uncompiled when Numba is absent; count compiled runs."""
+    if jit_backend.numba is None:
+        monkeypatch.setattr(jit_backend, "numba", True)
+    calls = []
+    run = jit_backend.run
+
+    def counted(engine, jobs):
+        completed = run(engine, jobs)
+        calls.append(completed is not None)
+        return completed
+
+    monkeypatch.setattr(jit_backend, "run", counted)
+    return calls
+
+
+def _random_workload(rng: random.Random) -> List[Job]:
+    # Short spans force same-time arrivals, whose admission order matters.
+    n = rng.randint(0, 80)
+    span = rng.choice([1, 10, 50, 400])
+    ids = rng.sample(range(10 * n + 1), n)
+    return [
+        Job(ids[i], rng.randint(0, span), rng.randint(1, rng.choice([5, 30])), rng.randint(0, 5))
+        for i in range(n)
+    ]
+
+
+def _outcome(engine: SimulationEngine, jobs: List[Job]):
+    done = engine.run(jobs)
+    return engine.current_time, [(j.job_id, j.first_run_time, j.completion_time) for j in done]
+
+
+@pytest.mark.parametrize("index", range(len(SCHEDULERS)))
+def test_matches_python_loop(index, kernels):
+    rng = random.Random(index)
+    for _ in range(RUNS):
+        jobs = _random_workload(rng)
+        quantum = rng.randint(1, 6)
+        coalesce = rng.random() < 0.5
+        state = rng.getstate()
+        python = SimulationEngine(SCHEDULERS[index](rng), quantum, coalesce_quanta=coalesce)
+        rng.setstate(state)
+        compiled = SimulationEngine(
+            SCHEDULERS[index](rng), quantum, coalesce_quanta=coalesce, backend="numba"
+        )
+        assert _outcome(compiled, jobs) == _outcome(python, jobs), (quantum, coalesce, jobs)
+    assert all(kernels) and len(kernels) == RUNS
+
+
+def test_falls_back_for_traced_runs(kernels):
+    engine = SimulationEngine(RoundRobinScheduler(), backend="numba", trace=TraceRecorder())
+    jobs = [Job(0, 0, 5), Job(1, 0, 3)]
+    assert len(engine.run(jobs)) == 2
+    assert kernels == [False]
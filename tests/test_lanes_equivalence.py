@@ -0,0 +1,103 @@
+"""run_lanes / run_lane_arrays must schedule every lane exactly like SimulationEngine.run()."""
+
+import heapq
+import random
+from typing import List
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.job import Job
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.sjf_srtf import SJFScheduler, SRTFScheduler
+from simulation.engine import SimulationEngine
+from simulation.lanes import _admission_order, _NEVER, run_lane_arrays, run_lanes
+from simulation.metrics import compute_metrics
+from workloads.vectorized import ColumnarWorkload
+
+POLICIES = [RoundRobinScheduler, SJFScheduler, SRTFScheduler]
+
+
+def _random_workload(rng: random.Random) -> List[Job]:
+    # Short spans pile arrivals up at the same time, where heap order matters.
+    n = rng.randint(0, 40)
+    span = rng.choice([0, 5, 30, 200])
+    ids = rng.sample(range(1000), n) if rng.random() < 0.3 else range(n)
+    jobs = []
+    for job_id in ids:
+        burst = rng.randint(1, rng.choice([3, 20, 60]))
+        jobs.append(Job(job_id, rng.randint(0, span), burst, rng.randint(0, 3)))
+    return jobs
+
+
+def _outcome(jobs: List[Job]):
+    return [(j.job_id, j.first_run_time, j.completion_time) for j in jobs]
+
+
+@pytest.mark.parametrize("cls", POLICIES, ids=lambda cls: cls.name)
+def test_job_lists_match_engine(cls):
+    rng = random.Random(cls.name)
+    workloads = [_random_workload(rng) for _ in range(400)]
+    quanta = [rng.choice([1, 2, 3, 4, 8, 1000]) for _ in workloads]
+    results = run_lanes(workloads, cls, quanta)
+    lane_metrics = results.metrics(37, (50, 99))
+    for lane, jobs in enumerate(workloads):
+        expected = SimulationEngine(cls(), quanta[lane]).run(jobs)
+        assert _outcome(results.completed_jobs(lane)) == _outcome(expected), (quanta[lane], jobs)
+        if jobs:
+            assert lane_metrics[lane] == compute_metrics(expected, 37, (50, 99))
+
+
+@pytest.mark.parametrize("cls", POLICIES, ids=lambda cls: cls.name)
+def test_columnar_and_array_inputs_match_job_lists(cls):
+    rng = np.random.default_rng(5)
+    lanes, width = 200, 30
+    arrival = rng.integers(0, 40, (lanes, width))
+    burst = rng.integers(1, 12, (lanes, width))
+    priority = rng.integers(0, 4, (lanes, width))
+    sizes = rng.integers(0, width + 1, lanes)
+    job_id = np.argsort(rng.random((lanes, width)), axis=1)  # unique ids per lane
+
+    columnar = [
+        ColumnarWorkload(job_id[l, :n], arrival[l, :n], burst[l, :n], priority[l, :n])
+        for l, n in enumerate(sizes)
+    ]
+    jobs = [w.to_jobs() for w in columnar]
+    expected = run_lanes(jobs, cls, 3)
+    for got in (
+        run_lanes(columnar, cls, 3),
+        run_lane_arrays(arrival, burst, cls, 3, job_id=job_id, priority=priority, sizes=sizes),
+    ):
+        for lane in range(lanes):
+            assert _outcome(got.completed_jobs(lane)) == _outcome(expected.completed_jobs(lane))
+    for lane in range(0, lanes, 7):
+        engine = SimulationEngine(cls(), 3).run(jobs[lane])
+        assert _outcome(expected.completed_jobs(lane)) == _outcome(engine)
+
+
+def test_admission_order_matches_heapq():
+    class Arrival:
+        def __init__(self, time, column):
+            self.time, self.column = time, column
+
+        def __lt__(self, other):  # like the engine's Event: by time only
+            return self.time < other.time
+
+    rng = np.random.default_rng(11)
+    lanes, width = 300, 25
+    arrival = rng.integers(0, rng.integers(1, 30, (lanes, 1)), (lanes, width))
+    sizes = rng.integers(0, width + 1, lanes)
+    arrival[np.arange(width) >= sizes[:, None]] = _NEVER
+    order = _admission_order(arrival, sizes)
+    for lane in range(lanes):
+        heap = [Arrival(t, c) for c, t in enumerate(arrival[lane, : sizes[lane]].tolist())]
+        heapq.heapify(heap)
+        popped = [heapq.heappop(heap).column for _ in range(len(heap))]
+        assert order[lane, : sizes[lane]].tolist() == popped
+
+
+def test_empty_inputs():
+    assert len(run_lanes([], RoundRobinScheduler)) == 0
+    results = run_lane_arrays(np.zeros((3, 0)), np.zeros((3, 0)), SJFScheduler)
+    assert [results.completed_jobs(lane) for lane in range(3)] == [[], [], []]
@@ -0,0 +1,104 @@
+"""LotteryScheduler (Fenwick tree) must draw exactly like the linear scan it replaced."""
+
+import random
+from typing import List, Optional
+
+import pytest
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.lottery import LotteryScheduler, _TicketIndex
+from simulation.engine import SimulationEngine
+from workloads.generator import (
+    generate_batch_workload,
+    generate_interactive_workload,
+    generate_mixed_workload,
+)
+
+
+class LinearLotteryScheduler(Scheduler):
+    """Frozen copy of LotteryScheduler before the Fenwick tree; the oracle."""
+
+    name = "Lottery (linear)"
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.ready_queue: list[Job] = []
+        self.rng = random.Random(seed)
+
+    def add_job(self, job: Job, current_time: int) -> None:
+        self.ready_queue.append(job)
+
+    def get_next_job(self, current_time: int) -> Optional[Job]:
+        if not self.ready_queue:
+            return None
+        total_tickets = sum(max(1, j.priority + 1) for j in self.ready_queue)
+        if total_tickets <= 0:
+            return self.ready_queue.pop(0)
+        r = self.rng.randint(1, total_tickets)
+        acc = 0
+        for i, j in enumerate(self.ready_queue):
+            acc += max(1, j.priority + 1)
+            if r <= acc:
+                return self.ready_queue.pop(i)
+        return self.ready_queue.pop(-1)
+
+    def has_ready_jobs(self) -> bool:
+        return len(self.ready_queue) > 0
+
+
+def _schedule(scheduler: Scheduler, jobs: List[Job], quantum: int):
+    engine = SimulationEngine(scheduler, quantum)
+    done = engine.run(jobs)
+    return engine.current_time, [(j.job_id, j.first_run_time, j.completion_time) for j in done]
+
+
+STANDARD_WORKLOADS = {
+    "batch": generate_batch_workload,
+    "interactive": generate_interactive_workload,
+    "mixed": generate_mixed_workload,
+}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42, 2024])
+@pytest.mark.parametrize("workload", sorted(STANDARD_WORKLOADS))
+def test_standard_workloads(workload, seed):
+    jobs = STANDARD_WORKLOADS[workload]()
+    assert _schedule(LotteryScheduler(seed), jobs, 4) == _schedule(
+        LinearLotteryScheduler(seed), jobs, 4
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_workloads(seed):
+    # Up to 300 jobs queue at once, so the index compacts and grows repeatedly.
+    rng = random.Random(seed)
+    for _ in range(12):
+        n = rng.randint(1, 300)
+        span = rng.choice([1, 20, 500])
+        jobs = [
+            Job(i, rng.randint(0, span), rng.randint(1, 20), rng.randint(-3, 9)) for i in range(n)
+        ]
+        jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
+        quantum = rng.randint(1, 6)
+        assert _schedule(LotteryScheduler(seed), jobs, quantum) == _schedule(
+            LinearLotteryScheduler(seed), jobs, quantum
+        )
+
+
+def test_ticket_index_draws_in_queue_order():
+    rng = random.Random(3)
+    index, queue = _TicketIndex(), []
+    for step in range(3000):
+        if queue and rng.random() < 0.45:
+            ticket = rng.randint(1, index.total)
+            acc = 0
+            for i, (_, weight) in enumerate(queue):
+                acc += weight
+                if ticket <= acc:
+                    break
+            assert index.pop_winner(ticket) is queue.pop(i)[0]
+        else:
+            job, weight = Job(step, 0, 1), rng.randint(1, 10)
+            index.add(job, weight)
+            queue.append((job, weight))
+        assert len(index) == len(queue) and index.total == sum(w for _, w in queue)
@@ -0,0 +1,67 @@
+"""compute_metrics: the NumPy path, the pure-Python path and the reference loop agree exactly."""
+
+import random
+from dataclasses import asdict
+from typing import List
+
+import pytest
+
+from models.job import Job
+from simulation import metrics
+from simulation.metrics import _compute_metrics_partial, compute_metrics, metrics_from_columns
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _finished_jobs(rng: random.Random) -> List[Job]:
+    jobs = []
+    for i in range(rng.randint(0, 300)):
+        arrival, burst = rng.randint(0, 100), rng.randint(1, 50)
+        job = Job(i, arrival, burst)
+        job.first_run_time = arrival + rng.randint(0, 300)
+        job.completion_time = job.first_run_time + burst + rng.randint(0, 200)
+        jobs.append(job)
+    return jobs
+
+
+def _typed(result) -> list:
+    # Equal values of different types (numpy ints, float vs int) must not pass.
+    return [(key, value, type(value)) for key, value in sorted(asdict(result).items())]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_numpy_matches_pure_python_and_reference(seed, monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    for _ in range(50):
+        jobs = _finished_jobs(rng)
+        threshold = rng.randint(0, 300)
+        percentiles = rng.choice([(), PERCENTILES])
+        vectorized = compute_metrics(jobs, threshold, percentiles)
+        reference = _compute_metrics_partial(jobs, threshold, percentiles) if jobs else None
+        with monkeypatch.context() as patch:
+            patch.setattr(metrics, "np", None)
+            pure = compute_metrics(jobs, threshold, percentiles)
+        assert _typed(vectorized) == _typed(pure)
+        if reference is not None:
+            assert _typed(vectorized) == _typed(reference)
+
+
+def test_columns_entry_point_matches_jobs():
+    rng = random.Random(7)
+    jobs = _finished_jobs(rng) or _finished_jobs(rng)
+    columns = [
+        [getattr(j, name) for j in jobs]
+        for name in ("arrival_time", "burst_time", "first_run_time", "completion_time")
+    ]
+    assert metrics_from_columns(*columns, 50, PERCENTILES) == compute_metrics(jobs, 50, PERCENTILES)
+
+
+def test_unfinished_jobs_use_reference_path(monkeypatch):
+    jobs = _finished_jobs(random.Random(3))
+    jobs[0].completion_time = None
+    jobs[1].first_run_time = None
+    expected = _compute_metrics_partial(jobs, 100, PERCENTILES)
+    assert compute_metrics(jobs, 100, PERCENTILES) == expected
+    monkeypatch.setattr(metrics, "np", None)
+    assert compute_metrics(jobs, 100, PERCENTILES) == expected
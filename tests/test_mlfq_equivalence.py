@@ -0,0 +1,162 @@
+"""MLFQScheduler (lazy boosts) must schedule exactly like the eager original."""
+
+import random
+from collections import deque
+from typing import List, Optional
+
+import pytest
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.mlfq import MLFQScheduler
+from simulation.engine import SimulationEngine
+from simulation.trace import TraceRecorder
+from workloads.generator import (
+    generate_batch_workload,
+    generate_interactive_workload,
+    generate_mixed_workload,
+)
+
+BOOST_INTERVALS = [1, 3, 10, 50, 200]
+
+
+class EagerMLFQScheduler(Scheduler):
+    """Frozen copy of MLFQScheduler before boosts became lazy; the oracle."""
+
+    name = "MLFQ (eager)"
+    supports_quantum_coalescing = True
+
+    def __init__(
+        self,
+        num_queues: int = 3,
+        quanta: Optional[list[int]] = None,
+        boost_interval: int = 50,
+    ) -> None:
+        self.num_queues = num_queues
+        self.quanta = list(quanta or [1, 2, 4])
+        self.boost_interval = boost_interval
+        while len(self.quanta) < num_queues:
+            self.quanta.append(self.quanta[-1] * 2)
+        self.queues: list[deque[Job]] = [deque() for _ in range(num_queues)]
+        self.job_level: dict[int, int] = {}
+        self.job_used: dict[int, int] = {}
+        self.last_boost_time: int = 0
+
+    def add_job(self, job: Job, current_time: int) -> None:
+        self.job_level[job.job_id] = 0
+        self.job_used[job.job_id] = 0
+        self.queues[0].append(job)
+
+    def _maybe_boost(self, current_time: int) -> None:
+        if current_time - self.last_boost_time >= self.boost_interval:
+            self.last_boost_time = current_time
+            for level in range(1, self.num_queues):
+                while self.queues[level]:
+                    job = self.queues[level].popleft()
+                    self.job_level[job.job_id] = 0
+                    self.job_used[job.job_id] = 0
+                    self.queues[0].append(job)
+
+    def get_next_job(self, current_time: int) -> Optional[Job]:
+        self._maybe_boost(current_time)
+        for q in self.queues:
+            if q:
+                return q.popleft()
+        return None
+
+    def has_ready_jobs(self) -> bool:
+        return any(q for q in self.queues)
+
+    def get_quantum(self, job: Job) -> int:
+        level = self.job_level.get(job.job_id, 0)
+        return self.quanta[min(level, len(self.quanta) - 1)]
+
+    def coalesce_quanta(self, job: Job, run_start: int, quantum: int, horizon: int) -> int:
+        level = self.job_level.get(job.job_id, 0)
+        bottom = self.num_queues - 1
+        t = run_start
+        level_zero_since: Optional[int] = None
+        while True:
+            q = self.quanta[min(level, len(self.quanta) - 1)]
+            if t + q >= horizon:
+                break
+            if level == bottom:
+                last = (horizon - 1 - t) // q
+                until_boost = self.last_boost_time + self.boost_interval - t
+                steps = max(1, -(-until_boost // q))
+                if steps > last:
+                    t += last * q
+                    break
+                t += steps * q
+            else:
+                t += q
+                level += 1
+            if t - self.last_boost_time >= self.boost_interval:
+                if level_zero_since is not None:
+                    period = t - level_zero_since
+                    t += (horizon - 1 - t) // period * period
+                self.last_boost_time = t
+                level = 0
+                level_zero_since = t
+        self.job_level[job.job_id] = level
+        self.job_used[job.job_id] = 0
+        return t
+
+    def on_job_preempted(self, job: Job, current_time: int) -> None:
+        level = self.job_level.get(job.job_id, 0)
+        new_level = min(level + 1, self.num_queues - 1)
+        self.job_level[job.job_id] = new_level
+        self.job_used[job.job_id] = 0
+        self.queues[new_level].append(job)
+
+
+def _schedule(scheduler: Scheduler, jobs: List[Job], coalesce: bool):
+    trace = TraceRecorder()
+    engine = SimulationEngine(scheduler, quantum=4, coalesce_quanta=coalesce, trace=trace)
+    done = engine.run(jobs)
+    outcome = sorted((j.job_id, j.first_run_time, j.completion_time) for j in done)
+    return engine.current_time, outcome, list(trace.reader())
+
+
+def _assert_same(jobs: List[Job], coalesce: bool, **params) -> None:
+    expected = _schedule(EagerMLFQScheduler(**params), jobs, coalesce)
+    assert _schedule(MLFQScheduler(**params), jobs, coalesce) == expected
+
+
+def _random_workload(rng: random.Random) -> List[Job]:
+    # Short spans pile arrivals up at the same times and keep several levels busy.
+    n = rng.randint(1, 60)
+    span = rng.choice([1, 10, 50, 300])
+    jobs = [
+        Job(i, rng.randint(0, span), rng.randint(1, rng.choice([3, 20, 120])), rng.randint(0, 3))
+        for i in range(n)
+    ]
+    jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
+    return jobs
+
+
+STANDARD_WORKLOADS = {
+    "batch": generate_batch_workload,
+    "interactive": generate_interactive_workload,
+    "mixed": generate_mixed_workload,
+}
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+@pytest.mark.parametrize("boost_interval", BOOST_INTERVALS)
+@pytest.mark.parametrize("workload", sorted(STANDARD_WORKLOADS))
+def test_standard_workloads(workload, boost_interval, coalesce):
+    _assert_same(STANDARD_WORKLOADS[workload](), coalesce, boost_interval=boost_interval)
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+@pytest.mark.parametrize("boost_interval", BOOST_INTERVALS)
+def test_random_workloads(boost_interval, coalesce):
+    rng = random.Random(boost_interval)
+    for _ in range(40):
+        jobs = _random_workload(rng)
+        num_queues = rng.randint(1, 5)
+        quanta = [rng.randint(1, 6) for _ in range(rng.randint(1, num_queues))]
+        _assert_same(
+            jobs, coalesce, num_queues=num_queues, quanta=quanta, boost_interval=boost_interval
+        )
@@ -0,0 +1,119 @@
+"""PriorityAgingScheduler (scheduled bonus steps) must match re-aging every queued job."""
+
+import heapq
+import random
+from typing import List, Optional
+
+import pytest
+
+from models.job import Job
+from schedulers.base import Scheduler
+from schedulers.priority_aging import PriorityAgingScheduler
+from simulation.engine import SimulationEngine
+from workloads.generator import (
+    generate_batch_workload,
+    generate_interactive_workload,
+    generate_mixed_workload,
+)
+
+
+class RefreshAgingScheduler(Scheduler):
+    """Frozen copy of PriorityAgingScheduler before aging steps were scheduled; the oracle.
+
+    Every dispatch recomputes each queued job's effective priority.
+    """
+
+    name = "Priority+Aging (refresh)"
+    supports_quantum_coalescing = True
+
+    def __init__(self, age_interval: int = 5, max_age_bonus: int = 10) -> None:
+        self.age_interval = age_interval
+        self.max_age_bonus = max_age_bonus
+        self.ready_queue: list[tuple[int, int, int, Job]] = []
+        self.job_enqueue_time: dict[int, int] = {}
+        self.job_accumulated_wait: dict[int, int] = {}
+
+    def add_job(self, job: Job, current_time: int) -> None:
+        self.job_enqueue_time[job.job_id] = current_time
+        if job.job_id not in self.job_accumulated_wait:
+            self.job_accumulated_wait[job.job_id] = 0
+        effective = self._effective_priority(job, current_time)
+        heapq.heappush(self.ready_queue, (-effective, current_time, job.job_id, job))
+
+    def _effective_priority(self, job: Job, current_time: int) -> int:
+        enqueue = self.job_enqueue_time.get(job.job_id, current_time)
+        current_wait = current_time - enqueue
+        total_wait = self.job_accumulated_wait.get(job.job_id, 0) + current_wait
+        age_bonus = min(self.max_age_bonus, (total_wait // self.age_interval) * 2)
+        return job.priority + age_bonus
+
+    def get_next_job(self, current_time: int) -> Optional[Job]:
+        if not self.ready_queue:
+            return None
+        updated = []
+        for _, _, _, job in self.ready_queue:
+            eff = self._effective_priority(job, current_time)
+            updated.append((-eff, self.job_enqueue_time[job.job_id], job.job_id, job))
+        heapq.heapify(updated)
+        self.ready_queue = updated
+        _, _, _, job = heapq.heappop(self.ready_queue)
+        enqueue = self.job_enqueue_time.get(job.job_id, current_time)
+        self.job_accumulated_wait[job.job_id] = (
+            self.job_accumulated_wait.get(job.job_id, 0) + (current_time - enqueue)
+        )
+        return job
+
+    def has_ready_jobs(self) -> bool:
+        return len(self.ready_queue) > 0
+
+    def on_job_preempted(self, job: Job, current_time: int) -> None:
+        self.job_enqueue_time[job.job_id] = current_time
+        effective = self._effective_priority(job, current_time)
+        heapq.heappush(self.ready_queue, (-effective, current_time, job.job_id, job))
+
+
+def _schedule(scheduler: Scheduler, jobs: List[Job], quantum: int, coalesce: bool):
+    engine = SimulationEngine(scheduler, quantum, coalesce_quanta=coalesce)
+    done = engine.run(jobs)
+    outcome = sorted((j.job_id, j.first_run_time, j.completion_time) for j in done)
+    return engine.current_time, outcome
+
+
+def _assert_same(jobs: List[Job], quantum: int, coalesce: bool, **params) -> None:
+    expected = _schedule(RefreshAgingScheduler(**params), jobs, quantum, coalesce)
+    assert _schedule(PriorityAgingScheduler(**params), jobs, quantum, coalesce) == expected
+
+
+STANDARD_WORKLOADS = {
+    "batch": generate_batch_workload,
+    "interactive": generate_interactive_workload,
+    "mixed": generate_mixed_workload,
+}
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+@pytest.mark.parametrize("age_interval", [1, 3, 5, 20])
+@pytest.mark.parametrize("workload", sorted(STANDARD_WORKLOADS))
+def test_standard_workloads(workload, age_interval, coalesce):
+    _assert_same(STANDARD_WORKLOADS[workload](), 4, coalesce, age_interval=age_interval)
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+@pytest.mark.parametrize("seed", range(6))
+def test_random_workloads(seed, coalesce):
+    rng = random.Random(seed)
+    for _ in range(40):
+        n = rng.randint(1, 60)
+        span = rng.choice([1, 10, 50, 300])
+        jobs = []
+        for i in range(n):
+            burst = rng.randint(1, rng.choice([3, 20, 120]))
+            jobs.append(Job(i, rng.randint(0, span), burst, rng.randint(0, 8)))
+        jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
+        _assert_same(
+            jobs,
+            rng.randint(1, 8),
+            coalesce,
+            age_interval=rng.randint(1, 10),
+            max_age_bonus=rng.choice([0, 1, 2, 5, 10, 30]),
+        )
@@ -0,0 +1,70 @@
+"""Coalesced quantum boundaries must not change any schedule (coalesce_quanta on vs off)."""
+
+import random
+from typing import List
+
+import pytest
+
+from models.job import Job
+from schedulers.mlfq import MLFQScheduler
+from schedulers.priority_aging import PriorityAgingScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from simulation.engine import SimulationEngine
+from simulation.trace import TraceEvent, TraceRecorder
+
+SCHEDULERS = {
+    "rr": lambda rng: RoundRobinScheduler(),
+    "aging": lambda rng: PriorityAgingScheduler(rng.randint(1, 8), rng.randint(0, 12)),
+    "mlfq": lambda rng: MLFQScheduler(
+        rng.randint(1, 5),
+        [rng.randint(1, 6) for _ in range(rng.randint(1, 3))],
+        rng.randint(1, 40),
+    ),
+}
+
+
+def _random_workload(rng: random.Random) -> List[Job]:
+    # Long bursts with sparse arrivals leave a job alone on the CPU for many quanta.
+    n = rng.randint(1, 15)
+    span = rng.choice([50, 1000])
+    jobs = [
+        Job(i, rng.randint(0, span), rng.randint(1, rng.choice([30, 600])), rng.randint(0, 2))
+        for i in range(n)
+    ]
+    jobs.sort(key=lambda j: (j.arrival_time, j.job_id))
+    return jobs
+
+
+def _schedule(scheduler, jobs: List[Job], quantum: int, coalesce: bool):
+    trace = TraceRecorder()
+    engine = SimulationEngine(scheduler, quantum, coalesce_quanta=coalesce, trace=trace)
+    done = engine.run(jobs)
+    outcome = sorted((j.job_id, j.first_run_time, j.completion_time) for j in done)
+    # Coalescing replaces PREEMPT/DISPATCH pairs of the running job with one
+    # COALESCE record, so compare the arrivals and completions only.
+    kept = (TraceEvent.ARRIVAL, TraceEvent.COMPLETE)
+    events = [record for record in trace.reader() if record[2] in kept]
+    return engine.current_time, outcome, events
+
+
+@pytest.mark.parametrize("name", sorted(SCHEDULERS))
+def test_coalescing_matches_per_quantum_run(name):
+    rng = random.Random(name)
+    for _ in range(150):
+        jobs = _random_workload(rng)
+        quantum = rng.randint(1, 9)
+        state = rng.getstate()
+        plain = SCHEDULERS[name](rng)
+        rng.setstate(state)
+        coalesced = SCHEDULERS[name](rng)
+        expected = _schedule(plain, jobs, quantum, coalesce=False)
+        assert _schedule(coalesced, jobs, quantum, coalesce=True) == expected, (quantum, jobs)
+        if isinstance(plain, MLFQScheduler):
+            assert coalesced.last_boost_time == plain.last_boost_time
+
+
+def test_round_robin_skips_boundaries():
+    trace = TraceRecorder()
+    jobs = [Job(0, 0, 1_000_000), Job(1, 2_000_000, 1_000_000)]
+    SimulationEngine(RoundRobinScheduler(), 4, trace=trace).run(jobs)
+    assert len(trace) < 20
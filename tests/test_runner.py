@@ -0,0 +1,25 @@
+"""run_experiments keeps per-job records only when asked to."""
+
+from experiments.runner import run_experiments
+from simulation.cache import SimulationCache
+
+SIZES = dict(batch_num_jobs=8, interactive_num_jobs=12, mixed_num_batch=4, mixed_num_interactive=6)
+
+
+def test_job_records_are_opt_in():
+    online = run_experiments(**SIZES)
+    retained = run_experiments(retain_jobs=True, **SIZES)
+    assert all(not r.completed_jobs for r in online)
+    assert all(r.completed_jobs for r in retained)
+    assert [(r.workload_name, r.scheduler_name, r.metrics) for r in online] == [
+        (r.workload_name, r.scheduler_name, r.metrics) for r in retained
+    ]
+
+
+def test_cache_only_stores_retained_runs():
+    cache = SimulationCache()
+    run_experiments(cache=cache, **SIZES)
+    assert cache.stats.misses == 0
+    run_experiments(cache=cache, retain_jobs=True, **SIZES)
+    again = run_experiments(cache=cache, retain_jobs=True, **SIZES)
+    assert cache.stats.hits > 0 and all(r.completed_jobs for r in again)
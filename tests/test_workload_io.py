@@ -0,0 +1,108 @@
+"""Chunked workload parsing: chunk boundaries, duplicate ids and error aggregation."""
+
+import io
+import random
+
+import pytest
+
+from platform_ui.workload_io import (
+    WorkloadValidationError,
+    _JobIdSet,
+    iter_workload_jobs,
+    parse_workload_text,
+)
+
+
+def _csv(rows):
+    return "job_id,arrival_time,burst_time,priority\n" + "".join(f"{r}\n" for r in rows)
+
+
+def _stream(content, fmt="csv", **kwargs):
+    return list(iter_workload_jobs(io.StringIO(content), fmt, **kwargs))
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 3, 7, 1 << 14])
+def test_chunk_size_does_not_change_jobs(chunk_rows):
+    rows = [f"{i},{i // 3},{i % 5 + 1},{i % 2}" for i in range(20)]
+    jobs = _stream(_csv(rows), chunk_rows=chunk_rows)
+    expected = parse_workload_text(_csv(rows), "csv").jobs
+    assert [(j.job_id, j.arrival_time, j.burst_time, j.priority) for j in jobs] == [
+        (j.job_id, j.arrival_time, j.burst_time, j.priority) for j in expected
+    ]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 3, 4])
+def test_duplicate_ids_across_chunks(chunk_rows):
+    content = _csv(["1,0,1,0", "2,0,1,0", "3,1,1,0", "1,2,1,0", "5,3,1,0"])
+    with pytest.raises(WorkloadValidationError) as err:
+        _stream(content, chunk_rows=chunk_rows)
+    assert err.value.errors == ["Duplicate job_id=1 at row 4"]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 5])
+def test_row_errors_are_collected_in_order(chunk_rows):
+    # A malformed row sends its chunk to the row-by-row path; row numbers
+    # must still count from the start of the file.
+    content = _csv(["0,0,1,0", "1,x,1,0", "2,1,0,0", "3,2,1,0", "3,3,1,0", "5,1,1,0"])
+    with pytest.raises(WorkloadValidationError) as err:
+        _stream(content, chunk_rows=chunk_rows)
+    errors = err.value.errors
+    assert len(errors) == 4
+    assert "row 2" in errors[0] and "arrival_time" in errors[0]
+    assert "row 3" in errors[1] and "burst_time" in errors[1]
+    assert errors[2] == "Duplicate job_id=3 at row 5"
+    assert "row 6" in errors[3] and "ordered by arrival_time" in errors[3]
+    assert str(err.value) == f"{errors[0]} (and 3 more row errors)"
+    assert not err.value.truncated
+
+
+def test_errors_stop_at_max_errors():
+    content = _csv([f"{i},0,0,0" for i in range(50)])
+    with pytest.raises(WorkloadValidationError) as err:
+        _stream(content, chunk_rows=8, max_errors=10)
+    assert len(err.value.errors) == 10
+    assert err.value.truncated
+    assert str(err.value).endswith("(and 9+ more row errors)")
+
+
+def test_no_jobs_after_first_error():
+    content = _csv(["0,0,1,0", "1,0,1,0", "2,0,0,0", "3,0,1,0", "4,0,1,0"])
+    seen = []
+    with pytest.raises(WorkloadValidationError):
+        for job in iter_workload_jobs(io.StringIO(content), "csv", chunk_rows=2):
+            seen.append(job.job_id)
+    assert seen == [0, 1]
+
+
+def test_jsonl_chunks_report_bad_lines():
+    lines = [
+        '{"arrival_time": 0, "burst_time": 1}',
+        "[1]",
+        "{bad",
+        '{"arrival_time": 1, "burst_time": 2}',
+    ]
+    content = "\n".join(lines)
+    with pytest.raises(WorkloadValidationError) as err:
+        _stream(content, "jsonl", chunk_rows=2)
+    assert err.value.errors[0] == "JSON entry 1 must be an object"
+    assert err.value.errors[1].startswith("Invalid JSON in row 3")
+
+
+def test_sparse_ids_do_not_grow_the_bitmap():
+    ids = _JobIdSet()
+    assert ids.add(268_435_455)
+    assert not ids.add(268_435_455)
+    assert len(ids.bits) == 0
+    for job_id in range(100_000):
+        assert ids.add(job_id)
+    assert len(ids.bits) <= 100_000 * 8
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_job_id_set_matches_set(seed):
+    rng = random.Random(seed)
+    ids, seen = _JobIdSet(bitmap_limit=rng.choice([1 << 28, 4096])), set()
+    for _ in range(5000):
+        job_id = rng.choice([rng.randrange(200), rng.randrange(1 << 20), rng.randrange(1 << 40)])
+        assert ids.add(job_id) == (job_id not in seen)
+        seen.add(job_id)
@@ -3,9 +3,21 @@ from .generator import (
     generate_interactive_workload,
     generate_mixed_workload,
 )
+from .vectorized import (
+    ColumnarWorkload,
+    generate_batch_columns,
+    generate_columnar_workload,
+    generate_interactive_columns,
+    generate_mixed_columns,
+)
 
 __all__ = [
     "generate_batch_workload",
     "generate_interactive_workload",
     "generate_mixed_workload",
+    "ColumnarWorkload",
+    "generate_batch_columns",
+    "generate_columnar_workload",
+    "generate_interactive_columns",
+    "generate_mixed_columns",
 ]
@@ -0,0 +1,203 @@
+"""Binary columnar workload files: a small header plus four int64 columns.
+
+Layout (little-endian on every platform)::
+
+    header   magic "SCHWKLD\\0", version, column count, job count
+    columns  job_id[n], arrival_time[n], burst_time[n], priority[n]
+
+Rows are stored sorted by arrival_time, so a memory-mapped file can
+be fed straight to SimulationEngine.run_stream() without materializing it.
+Readers check the same invariants as writers, so a file from anywhere (an
+upload, say) is rejected with ValueError rather than simulated wrongly.
+On big-endian hosts the columns are byte-swapped on write and copied on read.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+from models.job import Job
+from .vectorized import _CHUNK, ColumnarWorkload
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+MAGIC = b"SCHWKLD\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQ")  # magic, version, columns, num_jobs
+COLUMNS = ("job_id", "arrival_time", "burst_time", "priority")
+SUFFIX = ".swl"
+
+
+def write_workload(path: str, jobs: Union[ColumnarWorkload, Iterable[Job]]) -> int:
+    """Write ``jobs`` (Job objects or a ColumnarWorkload) to ``path``; returns the job count."""
+    if isinstance(jobs, ColumnarWorkload):
+        columns = [jobs.job_id, jobs.arrival, jobs.burst, jobs.priority]
+        columns = [np.ascontiguousarray(col, dtype=np.int64) for col in columns]
+    else:
+        columns = _job_columns(jobs)
+    _validate(columns)
+    n = len(columns[0])
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(COLUMNS), n))
+        for col in columns:
+            f.write(memoryview(_little_endian(col)).cast("B"))
+    return n
+
+
+def _job_columns(jobs: Iterable[Job]) -> List[array]:
+    rows = sorted(
+        ((j.arrival_time, j.job_id, j.burst_time, j.priority) for j in jobs),
+        key=lambda r: (r[0], r[1]),
+    )
+    return [
+        array("q", [r[1] for r in rows]),
+        array("q", [r[0] for r in rows]),
+        array("q", [r[2] for r in rows]),
+        array("q", [r[3] for r in rows]),
+    ]
+
+
+def _little_endian(col):
+    if sys.byteorder == "little":
+        return col
+    swapped = array("q", col)
+    swapped.byteswap()
+    return swapped
+
+
+def _validate(columns) -> None:
+    job_id, arrival, burst, _ = columns
+    n = len(job_id)
+    if not n:
+        return
+    if np is not None:
+        bad_order, bad_arrival, bad_burst, duplicate = _numpy_checks(columns)
+    else:
+        bad_order = any(arrival[i] > arrival[i + 1] for i in range(n - 1))
+        bad_arrival = min(arrival) < 0
+        bad_burst = min(burst) < 1
+        duplicate = len(set(job_id)) != n
+    if bad_order:
+        raise ValueError("Workload columns must be sorted by arrival_time")
+    if bad_arrival:
+        raise ValueError("'arrival_time' must be >= 0")
+    if bad_burst:
+        raise ValueError("'burst_time' must be >= 1")
+    if duplicate:
+        raise ValueError("Workload has duplicate job_id values")
+
+
+def _numpy_checks(columns) -> tuple:
+    # A helper, so its views of the columns are gone before _validate raises
+    # (a traceback holding them would keep a memory map from closing).
+    ids, arr, bur = (np.frombuffer(memoryview(c).cast("B"), dtype=np.int64) for c in columns[:3])
+    return (
+        bool((np.diff(arr) < 0).any()),
+        bool(arr.min() < 0),
+        bool(bur.min() < 1),
+        len(np.unique(ids)) != len(ids),
+    )
+
+
+class BinaryWorkload:
+    """
+    Zero-copy reader over a binary workload, backed by a buffer or a memory map.
+
+    Columns are exposed as int64 memoryviews; rows become Job objects only
+    when iterated, one chunk at a time, so iterating it as the input of
+    run_stream() keeps memory bounded by the live jobs.
+    """
+
+    def __init__(self, buffer: memoryview, _mmap: Optional[mmap.mmap] = None) -> None:
+        if len(buffer) < HEADER.size:
+            raise ValueError("Not a binary workload file (truncated header)")
+        magic, version, columns, n = HEADER.unpack(buffer[: HEADER.size])
+        if magic != MAGIC or version != VERSION or columns != len(COLUMNS):
+            raise ValueError("Not a binary workload file (bad header)")
+        if len(buffer) != HEADER.size + 8 * columns * n:
+            raise ValueError("Binary workload file is truncated")
+        self._mmap = _mmap
+        self._raw = buffer
+        if not n:
+            flat = memoryview(array("q"))
+        elif sys.byteorder == "little":
+            flat = buffer[HEADER.size :].cast("q")
+        else:
+            swapped = array("q")
+            swapped.frombytes(buffer[HEADER.size :])
+            swapped.byteswap()
+            flat = memoryview(swapped)
+        self._flat = flat
+        self.job_id, self.arrival, self.burst, self.priority = (
+            flat[i * n : (i + 1) * n] for i in range(len(COLUMNS))
+        )
+        try:
+            _validate((self.job_id, self.arrival, self.burst, self.priority))
+        except ValueError:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path: str) -> "BinaryWorkload":
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if size <= HEADER.size:  # mmap of an empty body is not allowed
+                return cls(memoryview(f.read()))
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mm), _mmap=mm)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "BinaryWorkload":
+        return cls(memoryview(payload))
+
+    def __len__(self) -> int:
+        return len(self.arrival)
+
+    def job(self, index: int) -> Job:
+        return Job(
+            job_id=self.job_id[index],
+            arrival_time=self.arrival[index],
+            burst_time=self.burst[index],
+            priority=self.priority[index],
+        )
+
+    def __iter__(self) -> Iterator[Job]:
+        columns = (self.job_id, self.arrival, self.burst, self.priority)
+        for start in range(0, len(self), _CHUNK):
+            rows = zip(*(col[start : start + _CHUNK].tolist() for col in columns))
+            for job_id, arrival, burst, priority in rows:
+                yield Job(job_id=job_id, arrival_time=arrival, burst_time=burst, priority=priority)
+
+    iter_jobs = __iter__
+
+    def to_jobs(self) -> List[Job]:
+        return list(self)
+
+    def as_columnar(self) -> ColumnarWorkload:
+        """ColumnarWorkload whose arrays are NumPy views of the file (no copy)."""
+        if np is None:
+            raise RuntimeError("numpy is required for as_columnar(). Install with: pip install numpy")
+        job_id, arrival, burst, priority = (
+            np.frombuffer(col, dtype=np.int64)
+            for col in (self.job_id, self.arrival, self.burst, self.priority)
+        )
+        return ColumnarWorkload(job_id=job_id, arrival=arrival, burst=burst, priority=priority)
+
+    def close(self) -> None:
+        for view in (self.job_id, self.arrival, self.burst, self.priority, self._flat, self._raw):
+            view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "BinaryWorkload":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
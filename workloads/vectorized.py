@@ -0,0 +1,277 @@
+"""Vectorized workload generation: columnar NumPy arrays, Jobs built on demand.
+
+The generators here draw every arrival, burst and priority in one call to a
+seeded ``numpy.random.Generator`` and sort once with a stable argsort, so
+10^7-job workloads take seconds. They are statistically equivalent to, but
+not the same draws as, the ``random.Random`` generators in ``generator.py``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from models.job import Job
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+_CHUNK = 1 << 16  # rows converted to Python ints at a time by iter_jobs()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError(
+            "numpy is required for vectorized workloads. Install with: pip install numpy"
+        )
+
+
+@dataclass
+class ColumnarWorkload:
+    """Jobs as parallel int64 arrays, sorted by arrival time (ties by job_id)."""
+
+    job_id: "np.ndarray"
+    arrival: "np.ndarray"
+    burst: "np.ndarray"
+    priority: "np.ndarray"
+
+    @classmethod
+    def from_columns(cls, arrival, burst, priority, job_id=None) -> "ColumnarWorkload":
+        """Build from unsorted columns; job ids default to generation order."""
+        _require_numpy()
+        arrival = np.asarray(arrival, dtype=np.int64)
+        n = len(arrival)
+        if job_id is None:
+            job_id = np.arange(n, dtype=np.int64)
+        order = np.argsort(arrival, kind="stable")
+        return cls(
+            job_id=np.asarray(job_id, dtype=np.int64)[order],
+            arrival=arrival[order],
+            burst=np.broadcast_to(np.asarray(burst, dtype=np.int64), (n,))[order],
+            priority=np.broadcast_to(np.asarray(priority, dtype=np.int64), (n,))[order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.arrival)
+
+    def job(self, index: int) -> Job:
+        return Job(
+            job_id=int(self.job_id[index]),
+            arrival_time=int(self.arrival[index]),
+            burst_time=int(self.burst[index]),
+            priority=int(self.priority[index]),
+        )
+
+    def iter_jobs(self) -> Iterator[Job]:
+        """Yield Jobs in arrival order, materializing a chunk of rows at a time.
+
+        Suitable for SimulationEngine.run_stream(), which then never holds
+        more than the live jobs plus one chunk.
+        """
+        for start in range(0, len(self), _CHUNK):
+            end = start + _CHUNK
+            rows = zip(
+                self.job_id[start:end].tolist(),
+                self.arrival[start:end].tolist(),
+                self.burst[start:end].tolist(),
+                self.priority[start:end].tolist(),
+            )
+            for job_id, arrival, burst, priority in rows:
+                yield Job(job_id=job_id, arrival_time=arrival, burst_time=burst, priority=priority)
+
+    def to_jobs(self) -> List[Job]:
+        return list(self.iter_jobs())
+
+    def concat(self, other: "ColumnarWorkload") -> "ColumnarWorkload":
+        """Merge two workloads, keeping arrival order (ties: self before other)."""
+        _require_numpy()
+        return ColumnarWorkload.from_columns(
+            np.concatenate([self.arrival, other.arrival]),
+            np.concatenate([self.burst, other.burst]),
+            np.concatenate([self.priority, other.priority]),
+            job_id=np.concatenate([self.job_id, other.job_id]),
+        )
+
+
+# Arrival processes: (rng, n, **params) -> unsorted int64 arrival times.
+
+
+def uniform_arrivals(rng, n: int, arrival_min: int = 0, arrival_max: int = 100):
+    if arrival_max <= 0:
+        return np.zeros(n, dtype=np.int64)
+    return rng.integers(arrival_min, arrival_max, size=n, endpoint=True)
+
+
+def poisson_arrivals(rng, n: int, rate: float = 1.0, start: int = 0):
+    """Poisson process with ``rate`` arrivals per time unit (exponential gaps)."""
+    gaps = rng.exponential(1.0 / rate, size=n)
+    return start + np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def mmpp_arrivals(
+    rng,
+    n: int,
+    rates: Sequence[float] = (0.2, 5.0),
+    mean_sojourn: Sequence[float] = (200.0, 20.0),
+    start: int = 0,
+):
+    """
+    Bursty Markov-modulated Poisson process.
+
+    The process cycles through the states in order, staying an exponential
+    time with mean ``mean_sojourn[k]`` in state k and emitting a Poisson
+    process of rate ``rates[k]`` meanwhile. Segments are drawn in batches
+    until ``n`` arrivals exist; arrivals within a segment are uniform.
+    """
+    rates = np.asarray(rates, dtype=float)
+    sojourn = np.asarray(mean_sojourn, dtype=float)
+    k = len(rates)
+    if k == 0 or len(sojourn) != k or not (rates > 0).any():
+        raise ValueError("mmpp_arrivals needs matching non-empty rates/mean_sojourn")
+    expected_per_cycle = float((rates * sojourn).sum())
+    segment_starts, segment_lengths, counts = [], [], []
+    offset = 0.0
+    total = 0
+    while total < n:
+        cycles = int((n - total) / expected_per_cycle * 1.2) + 1
+        states = np.tile(np.arange(k), cycles)
+        lengths = rng.exponential(sojourn[states])
+        starts = offset + np.concatenate(([0.0], np.cumsum(lengths)[:-1]))
+        emitted = rng.poisson(rates[states] * lengths)
+        offset = float(starts[-1] + lengths[-1])
+        segment_starts.append(starts)
+        segment_lengths.append(lengths)
+        counts.append(emitted)
+        total += int(emitted.sum())
+    counts_all = np.concatenate(counts)
+    times = np.repeat(np.concatenate(segment_starts), counts_all) + rng.random(
+        int(counts_all.sum())
+    ) * np.repeat(np.concatenate(segment_lengths), counts_all)
+    # Segments are consecutive, so sorting within them orders the whole series.
+    times.sort()
+    return start + np.floor(times[:n]).astype(np.int64)
+
+
+ARRIVAL_PROCESSES: Dict[str, Callable[..., Any]] = {
+    "uniform": uniform_arrivals,
+    "poisson": poisson_arrivals,
+    "mmpp": mmpp_arrivals,
+}
+
+
+# Burst distributions: (rng, n, **params) -> int64 burst times >= 1.
+
+
+def uniform_bursts(rng, n: int, burst_min: int = 1, burst_max: int = 10):
+    return rng.integers(burst_min, burst_max, size=n, endpoint=True)
+
+
+def pareto_bursts(
+    rng, n: int, alpha: float = 1.5, burst_min: int = 1, burst_max: Optional[int] = None
+):
+    """Heavy-tailed Pareto bursts with shape ``alpha`` and scale ``burst_min``."""
+    bursts = np.ceil(burst_min * (1.0 + rng.pareto(alpha, size=n)))
+    return _clip_bursts(bursts, burst_max)
+
+
+def lognormal_bursts(
+    rng, n: int, mu: float = 1.5, sigma: float = 1.0, burst_max: Optional[int] = None
+):
+    """Lognormal bursts; ``mu``/``sigma`` are the mean/std of the underlying normal."""
+    bursts = np.ceil(rng.lognormal(mu, sigma, size=n))
+    return _clip_bursts(bursts, burst_max)
+
+
+def _clip_bursts(bursts, burst_max: Optional[int]):
+    upper = burst_max if burst_max is not None else np.iinfo(np.int64).max // 4
+    return np.clip(bursts, 1, upper).astype(np.int64)
+
+
+BURST_DISTRIBUTIONS: Dict[str, Callable[..., Any]] = {
+    "uniform": uniform_bursts,
+    "pareto": pareto_bursts,
+    "lognormal": lognormal_bursts,
+}
+
+
+def generate_columnar_workload(
+    num_jobs: int,
+    arrivals: str = "poisson",
+    bursts: str = "uniform",
+    priority: int = 0,
+    arrival_params: Optional[Dict[str, Any]] = None,
+    burst_params: Optional[Dict[str, Any]] = None,
+    seed: int = 42,
+) -> ColumnarWorkload:
+    """
+    Workload from a named arrival process and burst distribution.
+
+    E.g. ``generate_columnar_workload(10**7, "mmpp", "pareto",
+    burst_params={"alpha": 1.2})``. See ARRIVAL_PROCESSES and
+    BURST_DISTRIBUTIONS for the names and their keyword parameters.
+    """
+    _require_numpy()
+    if arrivals not in ARRIVAL_PROCESSES:
+        raise ValueError(f"Unknown arrival process: {arrivals}")
+    if bursts not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Unknown burst distribution: {bursts}")
+    rng = np.random.default_rng(seed)
+    burst = BURST_DISTRIBUTIONS[bursts](rng, num_jobs, **(burst_params or {}))
+    arrival = ARRIVAL_PROCESSES[arrivals](rng, num_jobs, **(arrival_params or {}))
+    return ColumnarWorkload.from_columns(arrival, burst, priority)
+
+
+def generate_batch_columns(
+    num_jobs: int = 20,
+    burst_min: int = 10,
+    burst_max: int = 100,
+    arrival_min: int = 0,
+    arrival_max: int = 50,
+    seed: int = 42,
+) -> ColumnarWorkload:
+    """Vectorized counterpart of generate_batch_workload (priority 0)."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    burst = uniform_bursts(rng, num_jobs, burst_min, burst_max)
+    arrival = uniform_arrivals(rng, num_jobs, arrival_min, arrival_max)
+    return ColumnarWorkload.from_columns(arrival, burst, 0)
+
+
+def generate_interactive_columns(
+    num_jobs: int = 50,
+    burst_min: int = 1,
+    burst_max: int = 10,
+    arrival_min: int = 0,
+    arrival_max: int = 100,
+    seed: int = 42,
+) -> ColumnarWorkload:
+    """Vectorized counterpart of generate_interactive_workload (priority 1)."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    burst = uniform_bursts(rng, num_jobs, burst_min, burst_max)
+    arrival = uniform_arrivals(rng, num_jobs, arrival_min, arrival_max)
+    return ColumnarWorkload.from_columns(arrival, burst, 1)
+
+
+def generate_mixed_columns(
+    num_batch: int = 10,
+    num_interactive: int = 30,
+    batch_burst_min: int = 20,
+    batch_burst_max: int = 80,
+    interactive_burst_min: int = 1,
+    interactive_burst_max: int = 15,
+    arrival_range: int = 120,
+    seed: int = 42,
+) -> ColumnarWorkload:
+    """Vectorized counterpart of generate_mixed_workload (batch 0, interactive 2)."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    burst = np.concatenate(
+        [
+            uniform_bursts(rng, num_batch, batch_burst_min, batch_burst_max),
+            uniform_bursts(rng, num_interactive, interactive_burst_min, interactive_burst_max),
+        ]
+    )
+    arrival = rng.integers(0, arrival_range, size=num_batch + num_interactive, endpoint=True)
+    priority = np.repeat(np.array([0, 2], dtype=np.int64), [num_batch, num_interactive])
+    return ColumnarWorkload.from_columns(arrival, burst, priority)